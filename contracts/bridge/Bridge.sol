@@ -10,7 +10,6 @@ import {EnumerableMap} from "@openzeppelin/contracts/utils/structs/EnumerableMap
 import {Initializable} from "@openzeppelin/contracts/proxy/utils/Initializable.sol";
 import {IAVLMerklePath} from "./library/IAVLMerklePath.sol";
 import {TMSignature} from "./library/TMSignature.sol";
-import {Utils} from "./library/Utils.sol";
 import {ResultCodec} from "./library/ResultCodec.sol";
 import {IBridge} from "../../interfaces/bridge/IBridge.sol";
 import {AccessControl} from "@openzeppelin/contracts/access/AccessControl.sol";
@@ -21,7 +20,6 @@ contract Bridge is Initializable, IBridge, AccessControl {
     using BlockHeaderMerkleParts for BlockHeaderMerkleParts.Data;
     using MultiStore for MultiStore.Data;
     using IAVLMerklePath for IAVLMerklePath.Data;
-    using CommonEncodedVotePart for CommonEncodedVotePart.Data;
     using TMSignature for TMSignature.Data;
     using EnumerableMap for EnumerableMap.AddressToUintMap;
 
@@ -174,18 +172,22 @@ contract Bridge is Initializable, IBridge, AccessControl {
         bytes32 blockHeader = merkleParts.getBlockHeader(
             multiStore.getAppHash()
         );
-        // Verify the prefix, suffix and then compute the common encoded part.
-        bytes memory commonEncodedPart = commonEncodedVotePart
-            .checkPartsAndEncodedCommonParts(blockHeader);
         // Create a local variable to prevent reading that state repeatedly.
         bytes memory _encodedChainID = encodedChainID;
+        // Verify the prefix, suffix and then lay out the encoded canonical vote once, leaving
+        // only each signature's timestamp and the chain ID to be written for it.
+        TMSignature.CanonicalVote memory canonicalVote = TMSignature.newCanonicalVote(
+            commonEncodedVotePart,
+            blockHeader,
+            _encodedChainID.length
+        );
 
         // Counts the total number of valid signatures signed by active validators.
         address lastSigner = address(0);
         uint256 sumVotingPower = 0;
         for (uint256 idx = 0; idx < signatures.length; ++idx) {
-            address signer = signatures[idx].checkTimeAndRecoverSigner(
-                commonEncodedPart,
+            address signer = signatures[idx].checkTimeAndRecoverSignerInPlace(
+                canonicalVote,
                 _encodedChainID
             );
             require(signer > lastSigner, "INVALID_SIGNATURE_SIGNER_ORDER");
@@ -461,19 +463,8 @@ contract Bridge is Initializable, IBridge, AccessControl {
         bytes32 dataHash,
         IAVLMerklePath.Data[] memory merklePaths
     ) private pure returns (bool) {
-        bytes memory encodedVersion = Utils.encodeVarintSigned(version);
-
-        bytes32 currentMerkleHash = sha256(
-            abi.encodePacked(
-                uint8(0), // Height of tree (only leaf node) is 0 (signed-varint encode)
-                uint8(2), // Size of subtree is 1 (signed-varint encode)
-                encodedVersion,
-                uint8(key.length), // Size of data key
-                key,
-                uint8(32), // Size of data hash
-                dataHash
-            )
-        );
+        bytes32 currentMerkleHash =
+            IAVLMerklePath.getLeafHash(version, key, dataHash);
 
         // Goes step-by-step computing hash of parent nodes until reaching root node.
         for (uint256 idx = 0; idx < merklePaths.length; ++idx) {
@@ -1,6 +1,7 @@
 // SPDX-License-Identifier: Apache-2.0
 
 pragma solidity ^0.8.14;
+import {Sha256Scratch} from "./Sha256Scratch.sol";
 import {Utils} from "./Utils.sol";
 
 
@@ -54,17 +55,10 @@ library BlockHeaderMerkleParts {
                     Utils.merkleInnerHash( // [2A]
                         self.versionAndChainIdHash, // [1A]
                         Utils.merkleInnerHash( // [1B]
-                            Utils.merkleLeafHash( // [2]
-                                abi.encodePacked(
-                                    uint8(8),
-                                    Utils.encodeVarintUnsigned(self.height)
-                                )
-                            ),
-                            Utils.merkleLeafHash( // [3]
-                                Utils.encodeTime(
-                                    self.timeSecond,
-                                    self.timeNanoSecondFraction
-                                )
+                            heightLeafHash(self.height), // [2]
+                            timeLeafHash( // [3]
+                                self.timeSecond,
+                                self.timeNanoSecondFraction
                             )
                         )
                     ),
@@ -74,9 +68,7 @@ library BlockHeaderMerkleParts {
                     Utils.merkleInnerHash( // [2C]
                         self.nextValidatorHashAndConsensusHash, // [1E]
                         Utils.merkleInnerHash( // [1F]
-                            Utils.merkleLeafHash( // [A]
-                                abi.encodePacked(uint8(10), uint8(32), appHash)
-                            ),
+                            appHashLeafHash(appHash), // [A]
                             self.lastResultsHash // [B]
                         )
                     ),
@@ -84,4 +76,35 @@ library BlockHeaderMerkleParts {
                 )
             );
     }
+
+    /// @dev merkleLeafHash(abi.encodePacked(uint8(8), Utils.encodeVarintUnsigned(height))),
+    /// written in scratch memory.
+    function heightLeafHash(uint64 height) internal pure returns (bytes32) {
+        (bytes memory preimage, uint256 ptr) = Sha256Scratch.begin();
+        ptr = Sha256Scratch.writeUint8(ptr, 0);
+        ptr = Sha256Scratch.writeUint8(ptr, 8);
+        ptr = Sha256Scratch.writeVarint(ptr, height);
+        return Sha256Scratch.hash(preimage, ptr);
+    }
+
+    /// @dev merkleLeafHash(Utils.encodeTime(second, nanoSecond)), written in scratch memory.
+    function timeLeafHash(uint64 second, uint32 nanoSecond)
+        internal
+        pure
+        returns (bytes32)
+    {
+        (bytes memory preimage, uint256 ptr) = Sha256Scratch.begin();
+        ptr = Sha256Scratch.writeUint8(ptr, 0);
+        ptr = Utils.writeTime(ptr, second, nanoSecond);
+        return Sha256Scratch.hash(preimage, ptr);
+    }
+
+    /// @dev merkleLeafHash(abi.encodePacked(uint8(10), uint8(32), appHash)), written in scratch
+    /// memory.
+    function appHashLeafHash(bytes32 appHash) internal pure returns (bytes32) {
+        (bytes memory preimage, uint256 ptr) = Sha256Scratch.begin();
+        ptr = Sha256Scratch.writeBytesN(ptr, hex"000a20", 3);
+        ptr = Sha256Scratch.writeBytes32(ptr, appHash);
+        return Sha256Scratch.hash(preimage, ptr);
+    }
 }
@@ -1,6 +1,7 @@
 // SPDX-License-Identifier: Apache-2.0
 
 pragma solidity ^0.8.14;
+import {Sha256Scratch} from "./Sha256Scratch.sol";
 
 /// @dev Library for performing concatenation of all common parts together into a single common part.
 /// The common part is used for the signature verification process, and it should be the same bytes for all validators.
@@ -44,6 +45,29 @@ library CommonEncodedVotePart {
         pure
         returns (bytes memory)
     {
+        _checkParts(self);
+        return abi.encodePacked(
+            self.signedDataPrefix,
+            blockHash,
+            self.signedDataSuffix
+        );
+    }
+
+    /// @dev Writes the common part checkPartsAndEncodedCommonParts returns at ptr, after the same
+    /// checks, and returns the position after it. See Sha256Scratch.
+    /// @param blockHash The block hash that the validator signed data on.
+    function checkPartsAndWriteCommonParts(
+        Data memory self,
+        bytes32 blockHash,
+        uint256 ptr
+    ) internal pure returns (uint256) {
+        _checkParts(self);
+        ptr = Sha256Scratch.writeBytes(ptr, self.signedDataPrefix);
+        ptr = Sha256Scratch.writeBytes32(ptr, blockHash);
+        return Sha256Scratch.writeBytes(ptr, self.signedDataSuffix);
+    }
+
+    function _checkParts(Data memory self) private pure {
         // We need to limit the possible size of the prefix and suffix to ensure only one possible block hash.
 
         // There are only two possible prefix sizes.
@@ -61,11 +85,5 @@ library CommonEncodedVotePart {
         // 2. The CanonicalPartSetHeader.Hash's size is fixed (32 bytes) because it is a product of SHA256.
         // Therefore, the overall size is fixed.
         require(self.signedDataSuffix.length == 38, "CommonEncodedVotePart: Invalid suffix's size");
-
-        return abi.encodePacked(
-            self.signedDataPrefix,
-            blockHash,
-            self.signedDataSuffix
-        );
     }
 }
@@ -1,6 +1,6 @@
 // SPDX-License-Identifier: Apache-2.0
 pragma solidity ^0.8.14;
-import {Utils} from "./Utils.sol";
+import {Sha256Scratch} from "./Sha256Scratch.sol";
 
 
 /// @dev Library for computing iAVL Merkle root from (1) data leaf and (2) a list of "MerklePath"
@@ -23,6 +23,24 @@ library IAVLMerklePath {
         bytes32 siblingHash;
     }
 
+    /// @dev Returns the hash of the leaf node holding key and the hash of its value.
+    /// @param version The block height at which the leaf was last updated.
+    function getLeafHash(
+        uint256 version,
+        bytes memory key,
+        bytes32 dataHash
+    ) internal pure returns (bytes32) {
+        (bytes memory preimage, uint256 ptr) = Sha256Scratch.begin();
+        // Height of tree (only leaf node) is 0 and size of subtree is 1 (signed-varint encode)
+        ptr = Sha256Scratch.writeBytesN(ptr, hex"0002", 2);
+        ptr = Sha256Scratch.writeVarint(ptr, version * 2);
+        ptr = Sha256Scratch.writeUint8(ptr, key.length); // Size of data key
+        ptr = Sha256Scratch.writeBytes(ptr, key);
+        ptr = Sha256Scratch.writeUint8(ptr, 32); // Size of data hash
+        ptr = Sha256Scratch.writeBytes32(ptr, dataHash);
+        return Sha256Scratch.hash(preimage, ptr);
+    }
+
     /// @dev Returns the upper Merkle hash given a proof component and hash of data subtree.
     /// @param dataSubtreeHash The hash of data subtree up until this point.
     function getParentHash(Data memory self, bytes32 dataSubtreeHash)
@@ -32,17 +50,17 @@ library IAVLMerklePath {
     {
         (bytes32 leftSubtree, bytes32 rightSubtree) =
             self.isDataOnRight ? (self.siblingHash, dataSubtreeHash) : (dataSubtreeHash, self.siblingHash);
-        return
-            sha256(
-                abi.encodePacked(
-                    self.subtreeHeight << 1, // Tendermint signed-int8 encoding requires multiplying by 2
-                    Utils.encodeVarintSigned(self.subtreeSize),
-                    Utils.encodeVarintSigned(self.subtreeVersion),
-                    uint8(32), // Size of left subtree hash
-                    leftSubtree,
-                    uint8(32), // Size of right subtree hash
-                    rightSubtree
-                )
-            );
+        // Written in scratch memory: uint8(subtreeHeight << 1) (Tendermint signed-int8 encoding
+        // requires multiplying by 2), the signed varints of subtreeSize and subtreeVersion, then
+        // each subtree hash after its size, 32.
+        (bytes memory preimage, uint256 ptr) = Sha256Scratch.begin();
+        ptr = Sha256Scratch.writeUint8(ptr, self.subtreeHeight << 1);
+        ptr = Sha256Scratch.writeVarint(ptr, self.subtreeSize * 2);
+        ptr = Sha256Scratch.writeVarint(ptr, self.subtreeVersion * 2);
+        ptr = Sha256Scratch.writeUint8(ptr, 32);
+        ptr = Sha256Scratch.writeBytes32(ptr, leftSubtree);
+        ptr = Sha256Scratch.writeUint8(ptr, 32);
+        ptr = Sha256Scratch.writeBytes32(ptr, rightSubtree);
+        return Sha256Scratch.hash(preimage, ptr);
     }
 }
@@ -1,6 +1,7 @@
 // SPDX-License-Identifier: Apache-2.0
 
 pragma solidity ^0.8.14;
+import {Sha256Scratch} from "./Sha256Scratch.sol";
 import {Utils} from "./Utils.sol";
 
 
@@ -26,12 +27,7 @@ library MultiStore {
                     Utils.merkleInnerHash(
                         Utils.merkleInnerHash(
                             self.mintStoreMerkleHash,
-                            Utils.merkleLeafHash(
-                                abi.encodePacked(
-                                    hex"066f7261636c6520", // oracle prefix (uint8(6) + "oracle" + uint8(32))
-                                    sha256(abi.encodePacked(self.oracleIAVLStateHash))
-                                )
-                            )
+                            oracleLeafHash(self.oracleIAVLStateHash)
                         ),
                         self.paramsToRestakeStoresMerkleHash
                     ),
@@ -41,4 +37,19 @@ library MultiStore {
             )
         );
     }
+
+    /// @dev Returns the leaf hash of the oracle store, the merkleLeafHash of the oracle prefix
+    /// followed by sha256(oracleIAVLStateHash), with both preimages written in scratch memory.
+    function oracleLeafHash(bytes32 oracleIAVLStateHash) internal pure returns (bytes32) {
+        (bytes memory preimage, uint256 ptr) = Sha256Scratch.begin();
+        ptr = Sha256Scratch.writeBytes32(ptr, oracleIAVLStateHash);
+        bytes32 storeHash = Sha256Scratch.hash(preimage, ptr);
+
+        (preimage, ptr) = Sha256Scratch.begin();
+        ptr = Sha256Scratch.writeUint8(ptr, 0);
+        // oracle prefix (uint8(6) + "oracle" + uint8(32))
+        ptr = Sha256Scratch.writeBytesN(ptr, hex"066f7261636c6520", 8);
+        ptr = Sha256Scratch.writeBytes32(ptr, storeHash);
+        return Sha256Scratch.hash(preimage, ptr);
+    }
 }
@@ -1,134 +1,134 @@
 // SPDX-License-Identifier: Apache-2.0
 pragma solidity ^0.8.14;
 
-import {ProtobufLib} from "./ProtobufLib.sol";
 import {IBridge} from "../../../interfaces/bridge/IBridge.sol";
 
+/// @dev Protobuf encoding of IBridge.Result, the preimage of the result's IAVL leaf data hash.
+/// Fields are written in order and left out when they hold their default value. The exact
+/// output length is computed first, so every key, varint and payload is written once into a
+/// single buffer instead of re-copying a growing one field by field.
 library ResultCodec {
     function encode(IBridge.Result memory instance)
         internal
         pure
-        returns (bytes memory)
+        returns (bytes memory out)
     {
-        bytes memory finalEncoded;
+        uint256 len = _bytesFieldLength(bytes(instance.clientID)) +
+            _varintFieldLength(instance.oracleScriptID) +
+            _bytesFieldLength(instance.params) +
+            _varintFieldLength(instance.askCount) +
+            _varintFieldLength(instance.minCount) +
+            _varintFieldLength(instance.requestID) +
+            _varintFieldLength(instance.ansCount) +
+            _varintFieldLength(instance.requestTime) +
+            _varintFieldLength(instance.resolveTime) +
+            _varintFieldLength(uint64(instance.resolveStatus)) +
+            _bytesFieldLength(instance.result);
 
-        // Omit encoding clientID if default value
-        if (bytes(instance.clientID).length > 0) {
-            finalEncoded = abi.encodePacked(
-                finalEncoded,
-                ProtobufLib.encode_key(
-                    1,
-                    uint64(ProtobufLib.WireType.LengthDelimited)
-                ),
-                ProtobufLib.encode_uint64(
-                    uint64(bytes(instance.clientID).length)
-                ),
-                bytes(instance.clientID)
-            );
+        uint256 ptr;
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            out := mload(0x40)
+            mstore(out, len)
+            ptr := add(out, 32)
+            mstore(0x40, and(add(add(ptr, len), 31), not(31)))
         }
 
-        // Omit encoding oracleScriptID if default value
-        if (uint64(instance.oracleScriptID) != 0) {
-            finalEncoded = abi.encodePacked(
-                finalEncoded,
-                ProtobufLib.encode_key(2, uint64(ProtobufLib.WireType.Varint)),
-                ProtobufLib.encode_uint64(instance.oracleScriptID)
-            );
-        }
+        // Every key, (field_number << 3) | wire_type, fits in one byte.
+        ptr = _writeBytesField(ptr, 0x0a, bytes(instance.clientID));
+        ptr = _writeVarintField(ptr, 0x10, instance.oracleScriptID);
+        ptr = _writeBytesField(ptr, 0x1a, instance.params);
+        ptr = _writeVarintField(ptr, 0x20, instance.askCount);
+        ptr = _writeVarintField(ptr, 0x28, instance.minCount);
+        ptr = _writeVarintField(ptr, 0x30, instance.requestID);
+        ptr = _writeVarintField(ptr, 0x38, instance.ansCount);
+        ptr = _writeVarintField(ptr, 0x40, instance.requestTime);
+        ptr = _writeVarintField(ptr, 0x48, instance.resolveTime);
+        // encode_int32(int32(uint32(resolveStatus))) is the varint of the enum's small value.
+        ptr = _writeVarintField(ptr, 0x50, uint64(instance.resolveStatus));
+        ptr = _writeBytesField(ptr, 0x5a, instance.result);
 
-        // Omit encoding params if default value
-        if (bytes(instance.params).length > 0) {
-            finalEncoded = abi.encodePacked(
-                finalEncoded,
-                ProtobufLib.encode_key(
-                    3,
-                    uint64(ProtobufLib.WireType.LengthDelimited)
-                ),
-                ProtobufLib.encode_uint64(
-                    uint64(bytes(instance.params).length)
-                ),
-                bytes(instance.params)
-            );
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            // Zero the padding of the last word, which the payload copies may have filled.
+            mstore(ptr, 0)
         }
+    }
 
-        // Omit encoding askCount if default value
-        if (uint64(instance.askCount) != 0) {
-            finalEncoded = abi.encodePacked(
-                finalEncoded,
-                ProtobufLib.encode_key(4, uint64(ProtobufLib.WireType.Varint)),
-                ProtobufLib.encode_uint64(instance.askCount)
-            );
+    function _varintLength(uint64 n) private pure returns (uint256 len) {
+        len = 1;
+        while (n > 0x7F) {
+            n >>= 7;
+            unchecked {
+                ++len;
+            }
         }
+    }
 
-        // Omit encoding minCount if default value
-        if (uint64(instance.minCount) != 0) {
-            finalEncoded = abi.encodePacked(
-                finalEncoded,
-                ProtobufLib.encode_key(5, uint64(ProtobufLib.WireType.Varint)),
-                ProtobufLib.encode_uint64(instance.minCount)
-            );
-        }
+    function _varintFieldLength(uint64 n) private pure returns (uint256) {
+        return n == 0 ? 0 : 1 + _varintLength(n);
+    }
 
-        // Omit encoding requestID if default value
-        if (uint64(instance.requestID) != 0) {
-            finalEncoded = abi.encodePacked(
-                finalEncoded,
-                ProtobufLib.encode_key(6, uint64(ProtobufLib.WireType.Varint)),
-                ProtobufLib.encode_uint64(instance.requestID)
-            );
-        }
+    function _bytesFieldLength(bytes memory b) private pure returns (uint256) {
+        return
+            b.length == 0
+                ? 0
+                : 1 + _varintLength(uint64(b.length)) + b.length;
+    }
 
-        // Omit encoding ansCount if default value
-        if (uint64(instance.ansCount) != 0) {
-            finalEncoded = abi.encodePacked(
-                finalEncoded,
-                ProtobufLib.encode_key(7, uint64(ProtobufLib.WireType.Varint)),
-                ProtobufLib.encode_uint64(instance.ansCount)
-            );
+    /// @dev Writes key and the varint of n at ptr, unless n is 0, and returns the new position.
+    function _writeVarintField(
+        uint256 ptr,
+        uint256 key,
+        uint64 n
+    ) private pure returns (uint256) {
+        if (n == 0) {
+            return ptr;
         }
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            mstore8(ptr, key)
+            ptr := add(ptr, 1)
+            for {
 
-        // Omit encoding requestTime if default value
-        if (uint64(instance.requestTime) != 0) {
-            finalEncoded = abi.encodePacked(
-                finalEncoded,
-                ProtobufLib.encode_key(8, uint64(ProtobufLib.WireType.Varint)),
-                ProtobufLib.encode_uint64(instance.requestTime)
-            );
-        }
+            } gt(n, 0x7f) {
 
-        // Omit encoding resolveTime if default value
-        if (uint64(instance.resolveTime) != 0) {
-            finalEncoded = abi.encodePacked(
-                finalEncoded,
-                ProtobufLib.encode_key(9, uint64(ProtobufLib.WireType.Varint)),
-                ProtobufLib.encode_uint64(instance.resolveTime)
-            );
+            } {
+                mstore8(ptr, or(0x80, and(n, 0x7f)))
+                n := shr(7, n)
+                ptr := add(ptr, 1)
+            }
+            mstore8(ptr, n)
+            ptr := add(ptr, 1)
         }
+        return ptr;
+    }
 
-        // Omit encoding resolveStatus if default value
-        if (uint64(instance.resolveStatus) != 0) {
-            finalEncoded = abi.encodePacked(
-                finalEncoded,
-                ProtobufLib.encode_key(10, uint64(ProtobufLib.WireType.Varint)),
-                ProtobufLib.encode_int32(int32(uint32(instance.resolveStatus)))
-            );
+    /// @dev Writes key, the varint length of b and b itself at ptr, unless b is empty, and
+    /// returns the new position. The copy goes a word at a time and may write up to 31 bytes
+    /// past the new position; the next field or the final padding overwrites them.
+    function _writeBytesField(
+        uint256 ptr,
+        uint256 key,
+        bytes memory b
+    ) private pure returns (uint256) {
+        uint256 size = b.length;
+        if (size == 0) {
+            return ptr;
         }
-
-        // Omit encoding result if default value
-        if (bytes(instance.result).length > 0) {
-            finalEncoded = abi.encodePacked(
-                finalEncoded,
-                ProtobufLib.encode_key(
-                    11,
-                    uint64(ProtobufLib.WireType.LengthDelimited)
-                ),
-                ProtobufLib.encode_uint64(
-                    uint64(bytes(instance.result).length)
-                ),
-                bytes(instance.result)
-            );
+        ptr = _writeVarintField(ptr, key, uint64(size));
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            let src := add(b, 32)
+            for {
+                let i := 0
+            } lt(i, size) {
+                i := add(i, 32)
+            } {
+                mstore(add(ptr, i), mload(add(src, i)))
+            }
+            ptr := add(ptr, size)
         }
-
-        return finalEncoded;
+        return ptr;
     }
 }
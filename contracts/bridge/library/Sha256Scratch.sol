@@ -0,0 +1,126 @@
+// SPDX-License-Identifier: Apache-2.0
+
+pragma solidity ^0.8.14;
+
+/// @dev Builds SHA-256 preimages in scratch memory at the free memory pointer, which is never
+/// moved, so hashing allocates nothing and memory does not grow with every node of a proof.
+///
+/// begin() returns a preimage, a bytes at the free memory pointer, and the position of its first
+/// byte. The write functions put a piece at a position and return the position after it, and
+/// hash() sets the preimage length from the final position and returns its sha256. Nothing may
+/// be allocated between begin() and hash(): the preimage is not reserved and would be overwritten.
+/// The sha256 builtin copies its input to the free memory pointer, one word below the preimage's
+/// bytes; the copy moves forward, so it never reads a word it has already overwritten.
+library Sha256Scratch {
+    function begin()
+        internal
+        pure
+        returns (bytes memory preimage, uint256 ptr)
+    {
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            preimage := mload(0x40)
+            ptr := add(preimage, 32)
+        }
+    }
+
+    function hash(bytes memory preimage, uint256 end)
+        internal
+        pure
+        returns (bytes32)
+    {
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            mstore(preimage, sub(end, add(preimage, 32)))
+        }
+        return sha256(preimage);
+    }
+
+    function writeUint8(uint256 ptr, uint256 value)
+        internal
+        pure
+        returns (uint256)
+    {
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            mstore8(ptr, value)
+        }
+        return ptr + 1;
+    }
+
+    function writeBytes32(uint256 ptr, bytes32 value)
+        internal
+        pure
+        returns (uint256)
+    {
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            mstore(ptr, value)
+        }
+        return ptr + 32;
+    }
+
+    /// @dev Writes the first size bytes of value, size at most 32.
+    function writeBytesN(
+        uint256 ptr,
+        bytes32 value,
+        uint256 size
+    ) internal pure returns (uint256) {
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            mstore(ptr, value)
+        }
+        return ptr + size;
+    }
+
+    /// @dev Copies value a word at a time; the last word may write up to 31 bytes past the
+    /// returned position, which the next piece overwrites and hash() leaves out.
+    function writeBytes(uint256 ptr, bytes memory value)
+        internal
+        pure
+        returns (uint256)
+    {
+        uint256 size = value.length;
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            let src := add(value, 32)
+            for {
+                let i := 0
+            } lt(i, size) {
+                i := add(i, 32)
+            } {
+                mstore(add(ptr, i), mload(add(src, i)))
+            }
+        }
+        return ptr + size;
+    }
+
+    /// @dev Writes the unsigned varint encoding of value, least significant group first. Zero
+    /// reverts with the arithmetic underflow panic (0x11), as Utils.encodeVarintUnsigned always has.
+    function writeVarint(uint256 ptr, uint256 value)
+        internal
+        pure
+        returns (uint256)
+    {
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            if iszero(value) {
+                mstore(0, shl(224, 0x4e487b71))
+                mstore(4, 0x11)
+                revert(0, 0x24)
+            }
+            for {
+
+            } gt(value, 0x7f) {
+
+            } {
+                mstore8(ptr, or(0x80, and(value, 0x7f)))
+                value := shr(7, value)
+                ptr := add(ptr, 1)
+            }
+            mstore8(ptr, value)
+            ptr := add(ptr, 1)
+        }
+        return ptr;
+    }
+}
@@ -1,6 +1,8 @@
 // SPDX-License-Identifier: Apache-2.0
 
 pragma solidity ^0.8.14;
+import {CommonEncodedVotePart} from "./CommonEncodedVotePart.sol";
+import {Sha256Scratch} from "./Sha256Scratch.sol";
 
 /// @dev Library for performing signer recovery for ECDSA secp256k1 signature. Note that the
 /// library is written specifically for signature signed on Tendermint's precommit data, which
@@ -16,6 +18,14 @@ library TMSignature {
         bytes encodedTimestamp;
     }
 
+    /// @dev An encoded canonical vote laid out by newCanonicalVote. encoded holds the size byte and
+    /// the common part, followed by room for the rest of a vote whose chain ID is at most
+    /// encodedChainIDCapacity bytes.
+    struct CanonicalVote {
+        bytes encoded;
+        uint256 encodedChainIDCapacity;
+    }
+
     /// @dev Returns the address that signed on the given encoded canonical vote message on Cosmos.
     /// @param commonEncodedPart The first common part of the encoded canonical vote.
     /// @param encodedChainID The last part of the encoded canonical vote.
@@ -24,15 +34,7 @@ library TMSignature {
         pure
         returns (address)
     {
-        // We need to limit the possible size of the encodedCanonicalVote to ensure only one possible block hash.
-        // The size of the encodedTimestamp will be between 6 and 12 according to the following two constraints.
-        // 1. The size of an encoded Unix's second is 6 bytes until over a thousand years in the future.
-        // 2. The NanoSecond size can vary from 0 to 6 bytes.
-        // Therefore, 6 + 0 <= the size <= 6 + 6.
-        require(
-            6 <= self.encodedTimestamp.length && self.encodedTimestamp.length <= 12,
-            "TMSignature: Invalid timestamp's size"
-        );
+        _checkTimestampSize(self);
         bytes memory encodedCanonicalVote = abi.encodePacked(
             commonEncodedPart,
             uint8(42),
@@ -48,4 +50,85 @@ library TMSignature {
                 self.s
             );
     }
+
+    /// @dev Returns the encoded canonical vote of a block laid out once for all its signatures:
+    /// a size byte followed by the common part (prefix || blockHash || suffix), with room after it
+    /// for the rest of any signature's vote. The encoded length covers only the size byte and the
+    /// common part; checkTimeAndRecoverSignerInPlace fills in the rest for each signature.
+    /// @param commonEncodedVotePart The common part of a block that all validators agree upon.
+    /// @param blockHash The block hash that the validator signed data on.
+    /// @param encodedChainIDLength The size of the encodedChainID the votes end with.
+    function newCanonicalVote(
+        CommonEncodedVotePart.Data memory commonEncodedVotePart,
+        bytes32 blockHash,
+        uint256 encodedChainIDLength
+    ) internal pure returns (CanonicalVote memory) {
+        bytes memory encoded;
+        uint256 ptr;
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            encoded := mload(0x40)
+            ptr := add(encoded, 33)
+        }
+        uint256 end = CommonEncodedVotePart.checkPartsAndWriteCommonParts(
+            commonEncodedVotePart,
+            blockHash,
+            ptr
+        );
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            mstore(encoded, sub(end, add(encoded, 32)))
+            // Reserve 42, the timestamp size and a timestamp of at most 12 bytes, the chain ID,
+            // and the word its copy may write past its end.
+            mstore(0x40, and(add(add(end, encodedChainIDLength), 76), not(31)))
+        }
+        return CanonicalVote(encoded, encodedChainIDLength);
+    }
+
+    /// @dev Same as checkTimeAndRecoverSigner, on a vote returned by newCanonicalVote. Only the
+    /// part after the common part and the size byte are written, and the vote is hashed in place.
+    /// @param vote The encoded canonical vote of the block, see newCanonicalVote.
+    /// @param encodedChainID The last part of the encoded canonical vote.
+    function checkTimeAndRecoverSignerInPlace(
+        Data memory self,
+        CanonicalVote memory vote,
+        bytes memory encodedChainID
+    ) internal pure returns (address) {
+        _checkTimestampSize(self);
+        require(
+            encodedChainID.length <= vote.encodedChainIDCapacity,
+            "TMSignature: Chain ID exceeds the vote's capacity"
+        );
+        bytes memory encoded = vote.encoded;
+        uint256 commonLength = encoded.length;
+        uint256 start;
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            start := add(encoded, 32)
+        }
+        uint256 ptr = Sha256Scratch.writeUint8(start + commonLength, 42);
+        ptr = Sha256Scratch.writeUint8(ptr, self.encodedTimestamp.length);
+        ptr = Sha256Scratch.writeBytes(ptr, self.encodedTimestamp);
+        ptr = Sha256Scratch.writeBytes(ptr, encodedChainID);
+        // The size byte is uint8(encodedCanonicalVote.length), the size of everything after it.
+        Sha256Scratch.writeUint8(start, ptr - start - 1);
+        bytes32 digest = Sha256Scratch.hash(encoded, ptr);
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            mstore(encoded, commonLength)
+        }
+        return ecrecover(digest, self.v, self.r, self.s);
+    }
+
+    function _checkTimestampSize(Data memory self) private pure {
+        // We need to limit the possible size of the encodedCanonicalVote to ensure only one possible block hash.
+        // The size of the encodedTimestamp will be between 6 and 12 according to the following two constraints.
+        // 1. The size of an encoded Unix's second is 6 bytes until over a thousand years in the future.
+        // 2. The NanoSecond size can vary from 0 to 6 bytes.
+        // Therefore, 6 + 0 <= the size <= 6 + 6.
+        require(
+            6 <= self.encodedTimestamp.length && self.encodedTimestamp.length <= 12,
+            "TMSignature: Invalid timestamp's size"
+        );
+    }
 }
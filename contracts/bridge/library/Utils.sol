@@ -1,6 +1,7 @@
 // SPDX-License-Identifier: Apache-2.0
 
 pragma solidity ^0.8.14;
+import {Sha256Scratch} from "./Sha256Scratch.sol";
 
 /// @dev Helper utility library for calculating Merkle proof and managing bytes.
 library Utils {
@@ -10,7 +11,10 @@ library Utils {
         pure
         returns (bytes32)
     {
-        return sha256(abi.encodePacked(uint8(0), value));
+        (bytes memory preimage, uint256 ptr) = Sha256Scratch.begin();
+        ptr = Sha256Scratch.writeUint8(ptr, 0);
+        ptr = Sha256Scratch.writeBytes(ptr, value);
+        return Sha256Scratch.hash(preimage, ptr);
     }
 
     /// @dev Returns the hash of internal node, calculated from child nodes.
@@ -19,7 +23,11 @@ library Utils {
         pure
         returns (bytes32)
     {
-        return sha256(abi.encodePacked(uint8(1), left, right));
+        (bytes memory preimage, uint256 ptr) = Sha256Scratch.begin();
+        ptr = Sha256Scratch.writeUint8(ptr, 1);
+        ptr = Sha256Scratch.writeBytes32(ptr, left);
+        ptr = Sha256Scratch.writeBytes32(ptr, right);
+        return Sha256Scratch.hash(preimage, ptr);
     }
 
     /// @dev Returns the encoded bytes using signed varint encoding of the given input.
@@ -35,41 +43,47 @@ library Utils {
     function encodeVarintUnsigned(uint256 value)
         internal
         pure
-        returns (bytes memory)
+        returns (bytes memory result)
     {
-        // Computes the size of the encoded value.
-        uint256 tempValue = value;
-        uint256 size = 0;
-        while (tempValue > 0) {
-            ++size;
-            tempValue >>= 7;
-        }
-        // Allocates the memory buffer and fills in the encoded value.
-        bytes memory result = new bytes(size);
-        tempValue = value;
-        for (uint256 idx = 0; idx < size; ++idx) {
-            result[idx] = bytes1(uint8(128) | uint8(tempValue & 127));
-            tempValue >>= 7;
-        }
-        result[size - 1] &= bytes1(uint8(127)); // Drop the first bit of the last byte.
-        return result;
+        uint256 ptr;
+        (result, ptr) = Sha256Scratch.begin();
+        _claim(result, Sha256Scratch.writeVarint(ptr, value));
     }
 
     /// @dev Returns the encoded bytes follow how tendermint encode time.
     function encodeTime(uint64 second, uint32 nanoSecond)
         internal
         pure
-        returns (bytes memory)
+        returns (bytes memory result)
     {
-        bytes memory result =
-            abi.encodePacked(hex"08", encodeVarintUnsigned(uint256(second)));
+        uint256 ptr;
+        (result, ptr) = Sha256Scratch.begin();
+        _claim(result, writeTime(ptr, second, nanoSecond));
+    }
+
+    /// @dev Writes encodeTime(second, nanoSecond) in place, see Sha256Scratch.
+    function writeTime(
+        uint256 ptr,
+        uint64 second,
+        uint32 nanoSecond
+    ) internal pure returns (uint256) {
+        ptr = Sha256Scratch.writeUint8(ptr, 0x08);
+        ptr = Sha256Scratch.writeVarint(ptr, second);
         if (nanoSecond > 0) {
-            result = abi.encodePacked(
-                result,
-                hex"10",
-                encodeVarintUnsigned(uint256(nanoSecond))
-            );
+            ptr = Sha256Scratch.writeUint8(ptr, 0x10);
+            ptr = Sha256Scratch.writeVarint(ptr, nanoSecond);
+        }
+        return ptr;
+    }
+
+    /// @dev Turns bytes written in place at the free memory pointer into an allocated bytes,
+    /// zeroing the padding of its last word.
+    function _claim(bytes memory result, uint256 end) private pure {
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            mstore(result, sub(end, add(result, 32)))
+            mstore(end, 0)
+            mstore(0x40, and(add(end, 31), not(31)))
         }
-        return result;
     }
 }
@@ -0,0 +1,218 @@
+// SPDX-License-Identifier: Apache-2.0
+
+pragma solidity ^0.8.14;
+
+import {BlockHeaderMerkleParts} from "../bridge/library/BlockHeaderMerkleParts.sol";
+import {IAVLMerklePath} from "../bridge/library/IAVLMerklePath.sol";
+import {MultiStore} from "../bridge/library/MultiStore.sol";
+
+/// @dev Utils as it was before the Merkle libraries moved onto Sha256Scratch: every preimage
+/// built with abi.encodePacked and every varint in its own bytes.
+library UtilsLegacy {
+    /// @dev Returns the hash of a Merkle leaf node.
+    function merkleLeafHash(bytes memory value)
+        internal
+        pure
+        returns (bytes32)
+    {
+        return sha256(abi.encodePacked(uint8(0), value));
+    }
+
+    /// @dev Returns the hash of internal node, calculated from child nodes.
+    function merkleInnerHash(bytes32 left, bytes32 right)
+        internal
+        pure
+        returns (bytes32)
+    {
+        return sha256(abi.encodePacked(uint8(1), left, right));
+    }
+
+    /// @dev Returns the encoded bytes using signed varint encoding of the given input.
+    function encodeVarintSigned(uint256 value)
+        internal
+        pure
+        returns (bytes memory)
+    {
+        return encodeVarintUnsigned(value * 2);
+    }
+
+    /// @dev Returns the encoded bytes using unsigned varint encoding of the given input.
+    function encodeVarintUnsigned(uint256 value)
+        internal
+        pure
+        returns (bytes memory)
+    {
+        // Computes the size of the encoded value.
+        uint256 tempValue = value;
+        uint256 size = 0;
+        while (tempValue > 0) {
+            ++size;
+            tempValue >>= 7;
+        }
+        // Allocates the memory buffer and fills in the encoded value.
+        bytes memory result = new bytes(size);
+        tempValue = value;
+        for (uint256 idx = 0; idx < size; ++idx) {
+            result[idx] = bytes1(uint8(128) | uint8(tempValue & 127));
+            tempValue >>= 7;
+        }
+        result[size - 1] &= bytes1(uint8(127)); // Drop the first bit of the last byte.
+        return result;
+    }
+
+    /// @dev Returns the encoded bytes follow how tendermint encode time.
+    function encodeTime(uint64 second, uint32 nanoSecond)
+        internal
+        pure
+        returns (bytes memory)
+    {
+        bytes memory result =
+            abi.encodePacked(hex"08", encodeVarintUnsigned(uint256(second)));
+        if (nanoSecond > 0) {
+            result = abi.encodePacked(
+                result,
+                hex"10",
+                encodeVarintUnsigned(uint256(nanoSecond))
+            );
+        }
+        return result;
+    }
+}
+
+/// @dev Computes every hash of one relayAndVerify, the block header from the multistore and
+/// the merkle parts and the oracle root from a result's leaf and its IAVL path, both through the
+/// Sha256Scratch libraries and the way they were computed before, to compare their gas.
+contract MockMerkleHashing {
+    using BlockHeaderMerkleParts for BlockHeaderMerkleParts.Data;
+    using IAVLMerklePath for IAVLMerklePath.Data;
+    using MultiStore for MultiStore.Data;
+
+    function relayHashes(
+        MultiStore.Data memory multiStore,
+        BlockHeaderMerkleParts.Data memory merkleParts,
+        uint256 version,
+        bytes memory key,
+        bytes32 dataHash,
+        IAVLMerklePath.Data[] memory merklePaths
+    ) public pure returns (bytes32 blockHeader, bytes32 oracleRoot) {
+        blockHeader = merkleParts.getBlockHeader(multiStore.getAppHash());
+
+        oracleRoot = IAVLMerklePath.getLeafHash(version, key, dataHash);
+        for (uint256 idx = 0; idx < merklePaths.length; ++idx) {
+            oracleRoot = merklePaths[idx].getParentHash(oracleRoot);
+        }
+    }
+
+    function relayHashesLegacy(
+        MultiStore.Data memory multiStore,
+        BlockHeaderMerkleParts.Data memory merkleParts,
+        uint256 version,
+        bytes memory key,
+        bytes32 dataHash,
+        IAVLMerklePath.Data[] memory merklePaths
+    ) public pure returns (bytes32 blockHeader, bytes32 oracleRoot) {
+        blockHeader = _getBlockHeader(merkleParts, _getAppHash(multiStore));
+
+        oracleRoot = sha256(
+            abi.encodePacked(
+                uint8(0),
+                uint8(2),
+                UtilsLegacy.encodeVarintSigned(version),
+                uint8(key.length),
+                key,
+                uint8(32),
+                dataHash
+            )
+        );
+        for (uint256 idx = 0; idx < merklePaths.length; ++idx) {
+            oracleRoot = _getParentHash(merklePaths[idx], oracleRoot);
+        }
+    }
+
+    function _getAppHash(MultiStore.Data memory self) private pure returns (bytes32) {
+        return UtilsLegacy.merkleInnerHash(
+            self.authToIcahostStoresMerkleHash,
+            UtilsLegacy.merkleInnerHash(
+                UtilsLegacy.merkleInnerHash(
+                    UtilsLegacy.merkleInnerHash(
+                        UtilsLegacy.merkleInnerHash(
+                            self.mintStoreMerkleHash,
+                            UtilsLegacy.merkleLeafHash(
+                                abi.encodePacked(
+                                    hex"066f7261636c6520",
+                                    sha256(abi.encodePacked(self.oracleIAVLStateHash))
+                                )
+                            )
+                        ),
+                        self.paramsToRestakeStoresMerkleHash
+                    ),
+                    self.rollingseedToTransferStoresMerkleHash
+                ),
+                self.tssToUpgradeStoresMerkleHash
+            )
+        );
+    }
+
+    function _getBlockHeader(BlockHeaderMerkleParts.Data memory self, bytes32 appHash)
+        private
+        pure
+        returns (bytes32)
+    {
+        return
+            UtilsLegacy.merkleInnerHash(
+                UtilsLegacy.merkleInnerHash(
+                    UtilsLegacy.merkleInnerHash(
+                        self.versionAndChainIdHash,
+                        UtilsLegacy.merkleInnerHash(
+                            UtilsLegacy.merkleLeafHash(
+                                abi.encodePacked(
+                                    uint8(8),
+                                    UtilsLegacy.encodeVarintUnsigned(self.height)
+                                )
+                            ),
+                            UtilsLegacy.merkleLeafHash(
+                                UtilsLegacy.encodeTime(
+                                    self.timeSecond,
+                                    self.timeNanoSecondFraction
+                                )
+                            )
+                        )
+                    ),
+                    self.lastBlockIdAndOther
+                ),
+                UtilsLegacy.merkleInnerHash(
+                    UtilsLegacy.merkleInnerHash(
+                        self.nextValidatorHashAndConsensusHash,
+                        UtilsLegacy.merkleInnerHash(
+                            UtilsLegacy.merkleLeafHash(
+                                abi.encodePacked(uint8(10), uint8(32), appHash)
+                            ),
+                            self.lastResultsHash
+                        )
+                    ),
+                    self.evidenceAndProposerHash
+                )
+            );
+    }
+
+    function _getParentHash(IAVLMerklePath.Data memory self, bytes32 dataSubtreeHash)
+        private
+        pure
+        returns (bytes32)
+    {
+        (bytes32 leftSubtree, bytes32 rightSubtree) =
+            self.isDataOnRight ? (self.siblingHash, dataSubtreeHash) : (dataSubtreeHash, self.siblingHash);
+        return
+            sha256(
+                abi.encodePacked(
+                    self.subtreeHeight << 1,
+                    UtilsLegacy.encodeVarintSigned(self.subtreeSize),
+                    UtilsLegacy.encodeVarintSigned(self.subtreeVersion),
+                    uint8(32),
+                    leftSubtree,
+                    uint8(32),
+                    rightSubtree
+                )
+            );
+    }
+}
@@ -0,0 +1,71 @@
+// SPDX-License-Identifier: Apache-2.0
+
+pragma solidity ^0.8.14;
+
+import {Obi} from "../obi/Obi.sol";
+import {ObiVRFParams} from "../obi/generated/ObiVRFParams.sol";
+import {ObiVRFResultV1} from "../obi/generated/ObiVRFResultV1.sol";
+import {ObiVRFResultV2} from "../obi/generated/ObiVRFResultV2.sol";
+
+/// @dev Decodes the VRF params and results both with the generic Obi library, the way
+/// VRFDecoderV1 and VRFDecoderV2 do, and with the libraries generated by obi_codegen.py.
+contract MockObiGenerated {
+    using Obi for Obi.Data;
+
+    function decodeParamsObi(bytes memory data)
+        public
+        pure
+        returns (ObiVRFParams.Params memory params)
+    {
+        Obi.Data memory decoder = Obi.from(data);
+        params.seed = decoder.decodeBytes();
+        params.time = decoder.decodeU64();
+        params.taskWorker = decoder.decodeBytes();
+        require(decoder.finished(), "DATA_DECODE_NOT_FINISHED");
+    }
+
+    function decodeParamsGenerated(bytes memory data)
+        public
+        pure
+        returns (ObiVRFParams.Params memory)
+    {
+        return ObiVRFParams.decode(data);
+    }
+
+    function decodeResultV1Obi(bytes memory data)
+        public
+        pure
+        returns (ObiVRFResultV1.Result memory result)
+    {
+        Obi.Data memory decoder = Obi.from(data);
+        result.proof = decoder.decodeBytes();
+        result.result = decoder.decodeBytes();
+        require(decoder.finished(), "DATA_DECODE_NOT_FINISHED");
+    }
+
+    function decodeResultV1Generated(bytes memory data)
+        public
+        pure
+        returns (ObiVRFResultV1.Result memory)
+    {
+        return ObiVRFResultV1.decode(data);
+    }
+
+    function decodeResultV2Obi(bytes memory data)
+        public
+        pure
+        returns (ObiVRFResultV2.Result memory result)
+    {
+        Obi.Data memory decoder = Obi.from(data);
+        result.result = decoder.decodeBytes();
+        require(decoder.finished(), "DATA_DECODE_NOT_FINISHED");
+    }
+
+    function decodeResultV2Generated(bytes memory data)
+        public
+        pure
+        returns (ObiVRFResultV2.Result memory)
+    {
+        return ObiVRFResultV2.decode(data);
+    }
+}
@@ -3,10 +3,108 @@
 pragma solidity ^0.8.14;
 
 import {Obi} from "../obi/Obi.sol";
+import {VRFDecoderV1} from "../vrf/provider_v1/VRFDecoderV1.sol";
+import {VRFDecoderV2} from "../vrf/provider_v2/VRFDecoderV2.sol";
 import {MockResultDecoder} from "./MockResultDecoder.sol";
 
+/// @dev The parts of the Obi library that the VRF decoders and the signed decoders use, as they
+/// were before they moved to word loads: every integer built from single bytes through decodeU8,
+/// and bytes copied one byte at a time. Kept to compare the gas of the VRF decoders and the values
+/// of the signed decoders.
+library ObiLegacy {
+    struct Data {
+        uint256 offset;
+        bytes raw;
+    }
+
+    function from(bytes memory data) internal pure returns (Data memory) {
+        return Data({offset: 0, raw: data});
+    }
+
+    modifier shift(Data memory data, uint256 size) {
+        require(data.raw.length >= data.offset + size, "Obi: Out of range");
+        _;
+        data.offset += size;
+    }
+
+    function finished(Data memory data) internal pure returns (bool) {
+        return data.offset == data.raw.length;
+    }
+
+    function decodeU8(Data memory data)
+        internal
+        pure
+        shift(data, 1)
+        returns (uint8 value)
+    {
+        value = uint8(data.raw[data.offset]);
+    }
+
+    function decodeI8(Data memory data)
+        internal
+        pure
+        shift(data, 1)
+        returns (int8 value)
+    {
+        value = int8(uint8(data.raw[data.offset]));
+    }
+
+    function decodeU16(Data memory data) internal pure returns (uint16 value) {
+        value = uint16(decodeU8(data)) << 8;
+        value |= uint16(decodeU8(data));
+    }
+
+    function decodeI16(Data memory data) internal pure returns (int16 value) {
+        value = int16(decodeI8(data)) << 8;
+        value |= int16(decodeI8(data));
+    }
+
+    function decodeU32(Data memory data) internal pure returns (uint32 value) {
+        value = uint32(decodeU16(data)) << 16;
+        value |= uint32(decodeU16(data));
+    }
+
+    function decodeI32(Data memory data) internal pure returns (int32 value) {
+        value = int32(decodeI16(data)) << 16;
+        value |= int32(decodeI16(data));
+    }
+
+    function decodeU64(Data memory data) internal pure returns (uint64 value) {
+        value = uint64(decodeU32(data)) << 32;
+        value |= uint64(decodeU32(data));
+    }
+
+    function decodeI64(Data memory data) internal pure returns (int64 value) {
+        value = int64(decodeI32(data)) << 32;
+        value |= int64(decodeI32(data));
+    }
+
+    function decodeI128(Data memory data) internal pure returns (int128 value) {
+        value = int128(decodeI64(data)) << 64;
+        value |= int128(decodeI64(data));
+    }
+
+    function decodeI256(Data memory data) internal pure returns (int256 value) {
+        value = int256(decodeI128(data)) << 128;
+        value |= int256(decodeI128(data));
+    }
+
+    function decodeBytes(Data memory data)
+        internal
+        pure
+        returns (bytes memory value)
+    {
+        value = new bytes(decodeU32(data));
+        for (uint256 i = 0; i < value.length; i++) {
+            value[i] = bytes1(decodeU8(data));
+        }
+    }
+}
+
 contract MockObiUser {
     using MockResultDecoder for bytes;
+    using Obi for Obi.Data;
+    using ObiLegacy for ObiLegacy.Data;
 
     function decode(bytes memory data)
         public
@@ -15,4 +113,116 @@ contract MockObiUser {
     {
         return data.decodeResult();
     }
+
+    function decodeVRFParamsV1(bytes memory data)
+        public
+        pure
+        returns (VRFDecoderV1.Params memory)
+    {
+        return VRFDecoderV1.decodeParams(data);
+    }
+
+    function decodeVRFResultV1(bytes memory data)
+        public
+        pure
+        returns (VRFDecoderV1.Result memory)
+    {
+        return VRFDecoderV1.decodeResult(data);
+    }
+
+    function decodeVRFParamsV2(bytes memory data)
+        public
+        pure
+        returns (VRFDecoderV2.Params memory)
+    {
+        return VRFDecoderV2.decodeParams(data);
+    }
+
+    function decodeVRFResultV2(bytes memory data)
+        public
+        pure
+        returns (bytes32)
+    {
+        return VRFDecoderV2.decodeResult(data);
+    }
+
+    /// @dev VRFDecoderV1.decodeParams and VRFDecoderV2.decodeParams, which are the same, on
+    /// top of ObiLegacy.
+    function decodeVRFParamsLegacy(bytes memory data)
+        public
+        pure
+        returns (VRFDecoderV1.Params memory params)
+    {
+        ObiLegacy.Data memory decoder = ObiLegacy.from(data);
+        params.seed = VRFDecoderV1.bytesToBytes32(decoder.decodeBytes());
+        params.time = decoder.decodeU64();
+        params.taskWorker = VRFDecoderV1.bytesToAddress(decoder.decodeBytes());
+        require(decoder.finished(), "DATA_DECODE_NOT_FINISHED");
+    }
+
+    function decodeVRFResultV1Legacy(bytes memory data)
+        public
+        pure
+        returns (VRFDecoderV1.Result memory result)
+    {
+        ObiLegacy.Data memory decoder = ObiLegacy.from(data);
+        result.proof = decoder.decodeBytes();
+        result.result = decoder.decodeBytes();
+        require(decoder.finished(), "DATA_DECODE_NOT_FINISHED");
+    }
+
+    function decodeVRFResultV2Legacy(bytes memory data)
+        public
+        pure
+        returns (bytes32 result)
+    {
+        ObiLegacy.Data memory decoder = ObiLegacy.from(data);
+        result = bytes32(decoder.decodeBytes());
+        require(decoder.finished(), "DATA_DECODE_NOT_FINISHED");
+    }
+
+    /// @dev Reads an i8, i16, i32, i64, i128 and i256 in that order.
+    function decodeSigned(bytes memory data)
+        public
+        pure
+        returns (
+            int8 i8,
+            int16 i16,
+            int32 i32,
+            int64 i64,
+            int128 i128,
+            int256 i256
+        )
+    {
+        Obi.Data memory decoder = Obi.from(data);
+        i8 = decoder.decodeI8();
+        i16 = decoder.decodeI16();
+        i32 = decoder.decodeI32();
+        i64 = decoder.decodeI64();
+        i128 = decoder.decodeI128();
+        i256 = decoder.decodeI256();
+        require(decoder.finished(), "DATA_DECODE_NOT_FINISHED");
+    }
+
+    function decodeSignedLegacy(bytes memory data)
+        public
+        pure
+        returns (
+            int8 i8,
+            int16 i16,
+            int32 i32,
+            int64 i64,
+            int128 i128,
+            int256 i256
+        )
+    {
+        ObiLegacy.Data memory decoder = ObiLegacy.from(data);
+        i8 = decoder.decodeI8();
+        i16 = decoder.decodeI16();
+        i32 = decoder.decodeI32();
+        i64 = decoder.decodeI64();
+        i128 = decoder.decodeI128();
+        i256 = decoder.decodeI256();
+        require(decoder.finished(), "DATA_DECODE_NOT_FINISHED");
+    }
 }
@@ -3,8 +3,71 @@
 pragma solidity ^0.8.14;
 
 import {IBridge} from "../../interfaces/bridge/IBridge.sol";
+import {ProtobufLib} from "../bridge/library/ProtobufLib.sol";
 import {ResultCodec} from "../bridge/library/ResultCodec.sol";
 
+/// @dev The ResultCodec.encode that grew its output with abi.encodePacked field by field, kept
+/// to check that the single-buffer encoder returns the same bytes and to compare their gas. The
+/// fields go through two helpers instead of being spelled out one by one; resolveStatus is
+/// encoded as a uint64, which is what ProtobufLib.encode_int32 wrote for it.
+library ResultCodecLegacy {
+    function encode(IBridge.Result memory instance)
+        internal
+        pure
+        returns (bytes memory finalEncoded)
+    {
+        finalEncoded = _appendBytes(finalEncoded, 1, bytes(instance.clientID));
+        finalEncoded = _appendVarint(finalEncoded, 2, instance.oracleScriptID);
+        finalEncoded = _appendBytes(finalEncoded, 3, instance.params);
+        finalEncoded = _appendVarint(finalEncoded, 4, instance.askCount);
+        finalEncoded = _appendVarint(finalEncoded, 5, instance.minCount);
+        finalEncoded = _appendVarint(finalEncoded, 6, instance.requestID);
+        finalEncoded = _appendVarint(finalEncoded, 7, instance.ansCount);
+        finalEncoded = _appendVarint(finalEncoded, 8, instance.requestTime);
+        finalEncoded = _appendVarint(finalEncoded, 9, instance.resolveTime);
+        finalEncoded = _appendVarint(finalEncoded, 10, uint64(instance.resolveStatus));
+        finalEncoded = _appendBytes(finalEncoded, 11, instance.result);
+    }
+
+    /// @dev Appends a varint field, omitted if it has the default value.
+    function _appendVarint(
+        bytes memory encoded,
+        uint64 fieldNumber,
+        uint64 value
+    ) private pure returns (bytes memory) {
+        if (value == 0) {
+            return encoded;
+        }
+        return
+            abi.encodePacked(
+                encoded,
+                ProtobufLib.encode_key(fieldNumber, uint64(ProtobufLib.WireType.Varint)),
+                ProtobufLib.encode_uint64(value)
+            );
+    }
+
+    /// @dev Appends a length-delimited field, omitted if it is empty.
+    function _appendBytes(
+        bytes memory encoded,
+        uint64 fieldNumber,
+        bytes memory value
+    ) private pure returns (bytes memory) {
+        if (value.length == 0) {
+            return encoded;
+        }
+        return
+            abi.encodePacked(
+                encoded,
+                ProtobufLib.encode_key(
+                    fieldNumber,
+                    uint64(ProtobufLib.WireType.LengthDelimited)
+                ),
+                ProtobufLib.encode_uint64(uint64(value.length)),
+                value
+            );
+    }
+}
+
 contract MockResultCodec {
     function encode(IBridge.Result memory _res)
         public
@@ -13,4 +76,12 @@ contract MockResultCodec {
     {
         return ResultCodec.encode(_res);
     }
+
+    function encodeLegacy(IBridge.Result memory _res)
+        public
+        pure
+        returns (bytes memory)
+    {
+        return ResultCodecLegacy.encode(_res);
+    }
 }
@@ -2,6 +2,7 @@
 
 pragma solidity ^0.8.14;
 
+import {CommonEncodedVotePart} from "../bridge/library/CommonEncodedVotePart.sol";
 import {TMSignature} from "../bridge/library/TMSignature.sol";
 
 contract MockTMSignature {
@@ -16,4 +17,76 @@ contract MockTMSignature {
     {
         return TMSignature.checkTimeAndRecoverSigner(_data, _commonEncodedPart, _encodedChainID);
     }
+
+    function recoverSigners(
+        CommonEncodedVotePart.Data memory _commonEncodedVotePart,
+        bytes32 _blockHash,
+        bytes memory _encodedChainID,
+        TMSignature.Data[] memory _signatures
+    )
+        public
+        pure
+        returns (address[] memory signers)
+    {
+        signers = new address[](_signatures.length);
+        TMSignature.CanonicalVote memory canonicalVote = TMSignature.newCanonicalVote(
+            _commonEncodedVotePart,
+            _blockHash,
+            _encodedChainID.length
+        );
+        for (uint256 idx = 0; idx < _signatures.length; ++idx) {
+            signers[idx] = TMSignature.checkTimeAndRecoverSignerInPlace(
+                _signatures[idx],
+                canonicalVote,
+                _encodedChainID
+            );
+        }
+    }
+
+    function recoverSignerWithCapacity(
+        CommonEncodedVotePart.Data memory _commonEncodedVotePart,
+        bytes32 _blockHash,
+        uint256 _encodedChainIDCapacity,
+        bytes memory _encodedChainID,
+        TMSignature.Data memory _signature
+    )
+        public
+        pure
+        returns (address)
+    {
+        TMSignature.CanonicalVote memory canonicalVote = TMSignature.newCanonicalVote(
+            _commonEncodedVotePart,
+            _blockHash,
+            _encodedChainIDCapacity
+        );
+        return TMSignature.checkTimeAndRecoverSignerInPlace(
+            _signature,
+            canonicalVote,
+            _encodedChainID
+        );
+    }
+
+    function recoverSignersLegacy(
+        CommonEncodedVotePart.Data memory _commonEncodedVotePart,
+        bytes32 _blockHash,
+        bytes memory _encodedChainID,
+        TMSignature.Data[] memory _signatures
+    )
+        public
+        pure
+        returns (address[] memory signers)
+    {
+        signers = new address[](_signatures.length);
+        bytes memory commonEncodedPart = CommonEncodedVotePart.checkPartsAndEncodedCommonParts(
+            _commonEncodedVotePart,
+            _blockHash
+        );
+        for (uint256 idx = 0; idx < _signatures.length; ++idx) {
+            signers[idx] = TMSignature.checkTimeAndRecoverSigner(
+                _signatures[idx],
+                commonEncodedPart,
+                _encodedChainID
+            );
+        }
+    }
 }
@@ -3,6 +3,9 @@
 pragma solidity ^0.8.14;
 
 library Obi {
+    // The top bit of every byte of a word.
+    uint256 private constant SIGN_BITS =
+        0x8080808080808080808080808080808080808080808080808080808080808080;
 
     struct Data {
         uint256 offset;
@@ -23,52 +26,73 @@ library Obi {
         return data.offset == data.raw.length;
     }
 
-    function decodeU8(Data memory data)
-        internal
+    /// @dev Reads the size-byte big-endian integer at the offset with one bounds check and one
+    /// word load, and moves the offset past it. size is at most 32.
+    function _decodeUint(Data memory data, uint256 size)
+        private
         pure
-        shift(data, 1)
-        returns (uint8 value)
+        returns (uint256 value)
     {
-        value = uint8(data.raw[data.offset]);
+        bytes memory raw = data.raw;
+        uint256 offset = data.offset;
+        require(raw.length >= offset + size, "Obi: Out of range");
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            value := shr(sub(256, shl(3, size)), mload(add(add(raw, 32), offset)))
+        }
+        data.offset = offset + size;
     }
 
-    function decodeI8(Data memory data)
-        internal
+    /// @dev Reads a size-byte signed value with _decodeUint. The signed decoders have always ORed
+    /// together the sign-extended halves of the value, which sign-extends it from its lowest byte
+    /// with the top bit set: decodeI16 reads 0x0080 as -128 and 0x7fff as -1. A value with no such
+    /// byte is read as it is.
+    function _decodeInt(Data memory data, uint256 size)
+        private
         pure
-        shift(data, 1)
-        returns (int8 value)
+        returns (int256)
     {
-        value = int8(uint8(data.raw[data.offset]));
+        uint256 value = _decodeUint(data, size);
+        unchecked {
+            uint256 signBit = value & SIGN_BITS;
+            signBit &= 0 - signBit;
+            if (signBit != 0) {
+                value |= ~((signBit << 1) - 1);
+            }
+        }
+        return int256(value);
+    }
+
+    function decodeU8(Data memory data) internal pure returns (uint8 value) {
+        value = uint8(_decodeUint(data, 1));
+    }
+
+    function decodeI8(Data memory data) internal pure returns (int8 value) {
+        value = int8(uint8(_decodeUint(data, 1)));
     }
 
     function decodeU16(Data memory data) internal pure returns (uint16 value) {
-        value = uint16(decodeU8(data)) << 8;
-        value |= uint16(decodeU8(data));
+        value = uint16(_decodeUint(data, 2));
     }
 
     function decodeI16(Data memory data) internal pure returns (int16 value) {
-        value = int16(decodeI8(data)) << 8;
-        value |= int16(decodeI8(data));
+        value = int16(_decodeInt(data, 2));
     }
 
     function decodeU32(Data memory data) internal pure returns (uint32 value) {
-        value = uint32(decodeU16(data)) << 16;
-        value |= uint32(decodeU16(data));
+        value = uint32(_decodeUint(data, 4));
     }
 
     function decodeI32(Data memory data) internal pure returns (int32 value) {
-        value = int32(decodeI16(data)) << 16;
-        value |= int32(decodeI16(data));
+        value = int32(_decodeInt(data, 4));
     }
 
     function decodeU64(Data memory data) internal pure returns (uint64 value) {
-        value = uint64(decodeU32(data)) << 32;
-        value |= uint64(decodeU32(data));
+        value = uint64(_decodeUint(data, 8));
     }
 
     function decodeI64(Data memory data) internal pure returns (int64 value) {
-        value = int64(decodeI32(data)) << 32;
-        value |= int64(decodeI32(data));
+        value = int64(_decodeInt(data, 8));
     }
 
     function decodeU128(Data memory data)
@@ -76,13 +100,11 @@ library Obi {
         pure
         returns (uint128 value)
     {
-        value = uint128(decodeU64(data)) << 64;
-        value |= uint128(decodeU64(data));
+        value = uint128(_decodeUint(data, 16));
     }
 
     function decodeI128(Data memory data) internal pure returns (int128 value) {
-        value = int128(decodeI64(data)) << 64;
-        value |= int128(decodeI64(data));
+        value = int128(_decodeInt(data, 16));
     }
 
     function decodeU256(Data memory data)
@@ -90,28 +112,45 @@ library Obi {
         pure
         returns (uint256 value)
     {
-        value = uint256(decodeU128(data)) << 128;
-        value |= uint256(decodeU128(data));
+        value = _decodeUint(data, 32);
     }
 
     function decodeI256(Data memory data) internal pure returns (int256 value) {
-        value = int256(decodeI128(data)) << 128;
-        value |= int256(decodeI128(data));
+        value = _decodeInt(data, 32);
     }
 
     function decodeBool(Data memory data) internal pure returns (bool value) {
         value = (decodeU8(data) != 0);
     }
 
+    /// @dev Copies the bytes a word at a time into memory allocated without zero-filling, then
+    /// zeroes the padding of the last word, which the copy may have filled with the bytes after.
     function decodeBytes(Data memory data)
         internal
         pure
         returns (bytes memory value)
     {
-        value = new bytes(decodeU32(data));
-        for (uint256 i = 0; i < value.length; i++) {
-            value[i] = bytes1(decodeU8(data));
+        uint256 size = _decodeUint(data, 4);
+        bytes memory raw = data.raw;
+        uint256 offset = data.offset;
+        require(raw.length >= offset + size, "Obi: Out of range");
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            value := mload(0x40)
+            mstore(value, size)
+            let src := add(add(raw, 32), offset)
+            let dest := add(value, 32)
+            for {
+                let i := 0
+            } lt(i, size) {
+                i := add(i, 32)
+            } {
+                mstore(add(dest, i), mload(add(src, i)))
+            }
+            mstore(add(dest, size), 0)
+            mstore(0x40, add(dest, and(add(size, 31), not(31))))
         }
+        data.offset = offset + size;
     }
 
     function decodeString(Data memory data)
@@ -0,0 +1,62 @@
+// SPDX-License-Identifier: Apache-2.0
+// Generated by example_utils_functions/obi_codegen.py from the OBI schema
+// {result:bytes}. Do not edit; regenerate instead.
+
+pragma solidity ^0.8.14;
+
+/// @title ObiVRFResultV2 library
+/// @notice Decodes OBI-encoded Result in one pass over the input
+library ObiVRFResultV2 {
+    struct Result {
+        bytes result;
+    }
+
+    function decode(bytes memory raw)
+        internal
+        pure
+        returns (Result memory value)
+    {
+        uint256 ptr;
+        uint256 end;
+        uint256 size;
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            ptr := add(raw, 32)
+            end := add(ptr, mload(raw))
+        }
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            size := shr(224, mload(ptr))
+            ptr := add(ptr, 4)
+        }
+        require(ptr + size <= end, "Obi: Out of range");
+        value.result = _copy(ptr, size);
+        ptr += size;
+        require(ptr == end, "DATA_DECODE_NOT_FINISHED");
+    }
+
+    /// @dev Copies size bytes at ptr a word at a time into a new bytes, allocated without
+    /// zero-filling like Obi.decodeBytes, and zeroes the padding of the last word, which the
+    /// copy may have filled with the bytes that follow.
+    function _copy(uint256 ptr, uint256 size)
+        private
+        pure
+        returns (bytes memory out)
+    {
+        // solium-disable-next-line security/no-inline-assembly
+        assembly {
+            out := mload(0x40)
+            mstore(out, size)
+            let dest := add(out, 32)
+            for {
+                let i := 0
+            } lt(i, size) {
+                i := add(i, 32)
+            } {
+                mstore(add(dest, i), mload(add(ptr, i)))
+            }
+            mstore(add(dest, size), 0)
+            mstore(0x40, add(dest, and(add(size, 31), not(31))))
+        }
+    }
+}
@@ -0,0 +1,486 @@
+# Micro-benchmarks for the example utility functions.
+#
+# Usage: python bench.py [name ...]  (runs every benchmark when no name is given)
+import os
+import random
+import sys
+import time
+
+import bridge
+import bridge_codec
+import commit_verifier
+import obi
+import relay_optimizer
+import result_codec
+import secp256k1
+import sha256
+import vrf_indexer
+
+_rng = random.Random(0)
+
+
+def _timeit(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def _report(name, seconds, count, unit="op"):
+    print(f"{name:<44} {seconds / count * 1e3:10.3f} ms/{unit}")
+
+
+def bench_ecc_mul(rounds=20):
+    scalars = [_rng.randrange(1, secp256k1._n) for _ in range(rounds)]
+
+    def run(mul):
+        return [mul(secp256k1._g, k) for k in scalars]
+
+    affine_time, affine = _timeit(run, secp256k1.ecc_mul_affine)
+    jacobian_time, jacobian = _timeit(run, secp256k1.ecc_mul)
+    assert affine == jacobian
+    _report("ecc_mul (affine)", affine_time, rounds)
+    _report("ecc_mul (jacobian)", jacobian_time, rounds)
+
+
+def bench_ecc_mul_base(rounds=200):
+    scalars = [_rng.randrange(1, secp256k1._n) for _ in range(rounds)]
+    build_time, _ = _timeit(secp256k1._get_base_table)
+    generic_time, generic = _timeit(lambda: [secp256k1.ecc_mul(secp256k1._g, k) for k in scalars])
+    base_time, base = _timeit(lambda: [secp256k1.ecc_mul_base(k) for k in scalars])
+    assert generic == base
+    _report("ecc_mul_base table build (once)", build_time, 1, "build")
+    _report("ecc_mul(G, k)", generic_time, rounds)
+    _report("ecc_mul_base(k)", base_time, rounds)
+
+
+def bench_ecc_mul2(rounds=50):
+    points = [secp256k1.ecc_mul_base(_rng.randrange(1, secp256k1._n)) for _ in range(rounds)]
+    pairs = [(_rng.randrange(1, secp256k1._n), _rng.randrange(1, secp256k1._n)) for _ in range(rounds)]
+    secp256k1._get_g_odd_multiples()
+
+    def run_separate():
+        return [
+            secp256k1.ecc_add(secp256k1.ecc_mul(secp256k1._g, a), secp256k1.ecc_mul(Q, b))
+            for Q, (a, b) in zip(points, pairs)
+        ]
+
+    def run_mul2():
+        return [secp256k1.ecc_mul2(secp256k1._g, a, Q, b) for Q, (a, b) in zip(points, pairs)]
+
+    separate_time, separate = _timeit(run_separate)
+    mul2_time, mul2 = _timeit(run_mul2)
+    assert separate == mul2
+    _report("ecc_mul(G, a) + ecc_mul(Q, b)", separate_time, rounds)
+    _report("ecc_mul2(G, a, Q, b)", mul2_time, rounds)
+
+
+def bench_glv(rounds=50):
+    points = [secp256k1.ecc_mul_base(_rng.randrange(1, secp256k1._n)) for _ in range(rounds)]
+    scalars = [_rng.randrange(1, secp256k1._n) for _ in range(rounds)]
+    pairs = [(_rng.randrange(1, secp256k1._n), _rng.randrange(1, secp256k1._n)) for _ in range(rounds)]
+
+    generic_time, generic = _timeit(lambda: [secp256k1.ecc_mul(P, k) for P, k in zip(points, scalars)])
+    glv_time, glv = _timeit(lambda: [secp256k1.ecc_mul_glv(P, k) for P, k in zip(points, scalars)])
+    assert generic == glv
+    _report("ecc_mul(P, k)", generic_time, rounds)
+    _report("ecc_mul_glv(P, k)", glv_time, rounds)
+
+    def run_mul2(glv):
+        return [secp256k1.ecc_mul2(secp256k1._g, a, Q, b, glv) for Q, (a, b) in zip(points, pairs)]
+
+    plain_time, plain = _timeit(run_mul2, False)
+    split_time, split = _timeit(run_mul2, True)
+    assert plain == split
+    _report("ecc_mul2(G, a, Q, b, glv=False)", plain_time, rounds)
+    _report("ecc_mul2(G, a, Q, b, glv=True)", split_time, rounds)
+
+
+def _random_signatures(count):
+    messages, rs, ss, vs = [], [], [], []
+    for _ in range(count):
+        x, y = secp256k1.ecc_mul(secp256k1._g, _rng.randrange(1, secp256k1._n))
+        messages.append(_rng.randbytes(32))
+        rs.append(x.to_bytes(32, "big"))
+        ss.append(_rng.randrange(1, secp256k1._n).to_bytes(32, "big"))
+        vs.append(27 + y % 2)
+    return messages, rs, ss, vs
+
+
+def bench_batch_ecrecover(count=100):
+    signatures = _random_signatures(count)
+
+    def run_loop(messages, rs, ss, vs):
+        return [secp256k1.ecrecover(*sig) for sig in zip(messages, rs, ss, vs)]
+
+    loop_time, loop = _timeit(run_loop, *signatures)
+    batch_time, batch = _timeit(secp256k1.batch_ecrecover, *signatures)
+    assert loop == batch
+    _report(f"ecrecover loop ({count} signatures)", loop_time, count, "sig")
+    _report(f"batch_ecrecover ({count} signatures)", batch_time, count, "sig")
+
+
+def _pubkey_bytes(point):
+    return point[0].to_bytes(32, "big") + point[1].to_bytes(32, "big")
+
+
+def _sign(priv, e):
+    k = _rng.randrange(1, secp256k1._n)
+    x, y = secp256k1.ecc_mul_base(k)
+    r = x % secp256k1._n
+    s = secp256k1.inv_mod(k, secp256k1._n) * (e + r * priv) % secp256k1._n
+    return r.to_bytes(32, "big"), s.to_bytes(32, "big"), 27 + y % 2
+
+
+def bench_verify_commit(count=100):
+    privs = [_rng.randrange(1, secp256k1._n) for _ in range(count)]
+    pubs = [_pubkey_bytes(secp256k1.ecc_mul_base(d)) for d in privs]
+    registry = secp256k1.build_validator_registry([(pub, 1) for pub in pubs])
+    messages = [_rng.randbytes(32) for _ in range(count)]
+    signatures = sorted(
+        (secp256k1.pubkey_to_address(pub), m) + _sign(d, int.from_bytes(m, "big"))
+        for d, pub, m in zip(privs, pubs, messages)
+    )
+    recover_args = [list(column) for column in zip(*signatures)][1:]
+
+    build_time, _ = _timeit(lambda: [secp256k1._get_pubkey_tables(pub) for pub in pubs])
+    recover_time, recovered = _timeit(secp256k1.batch_ecrecover, *recover_args)
+    verify_time, power = _timeit(secp256k1.verify_commit, registry, signatures)
+    assert power == count
+    assert [secp256k1.pubkey_to_address(pub) for pub in recovered] == [sig[0] for sig in signatures]
+    _report(f"pubkey tables build ({count} validators, once)", build_time, count, "key")
+    _report(f"batch_ecrecover ({count} signatures)", recover_time, count, "sig")
+    _report(f"verify_commit ({count} signatures)", verify_time, count, "sig")
+
+
+def bench_commit_verifier(blocks=16, signatures_per_block=20):
+    commits = [
+        (height, list(zip(*_random_signatures(signatures_per_block))))
+        for height in range(blocks)
+    ]
+    count = blocks * signatures_per_block
+    for workers in sorted({1, 2, os.cpu_count() or 1}):
+        elapsed, results = _timeit(
+            lambda: list(commit_verifier.verify_commits(commits, {}, workers=workers, chunk_size=2))
+        )
+        assert [height for height, _, _ in results] == list(range(blocks))
+        _report(f"verify_commits ({workers} workers)", elapsed, count, "sig")
+
+
+# Canonical vote parts taken from tests/bridge/test_tmsignature.py.
+_common_encoded_part = bytes.fromhex(
+    "08021184C002000000000022480A20"
+    "8c36c3d12a378bd7e4e8f26bdecca68b48390240da456ee9c3292b6e36756ac4"
+    "12240801122044551F853D916A7C630C0C210C921BAC7D05CE0C249DFC6088C0274F05841827"
+)
+_encoded_chain_id = bytes.fromhex("321362616e642d6c616f7a692d746573746e657431")
+
+
+def _encoded_timestamps(count):
+    # Seconds always take 6 bytes; the nanosecond varint makes the total 6 to 12 bytes.
+    return [
+        bytes.fromhex("08DE94938506") + (b"\x10" + bytes([0x80 | _rng.randrange(128)] * n + [1]) if n else b"")
+        for n in (_rng.randrange(0, 5) for _ in range(count))
+    ]
+
+
+def bench_sha256_midstate(count=100):
+    timestamps = _encoded_timestamps(count)
+
+    def vote(ts):
+        return _common_encoded_part + bytes([42, len(ts)]) + ts + _encoded_chain_id
+
+    def run_scratch():
+        votes = [vote(ts) for ts in timestamps]
+        return [sha256.digest(bytes([len(v)]) + v) for v in votes]
+
+    def run_midstate():
+        # The leading length byte depends on the timestamp size, so keep one midstate per size.
+        midstates = {}
+        digests = []
+        for ts in timestamps:
+            size = len(_common_encoded_part) + 2 + len(ts) + len(_encoded_chain_id)
+            if size not in midstates:
+                midstates[size] = sha256.Sha256(bytes([size]) + _common_encoded_part)
+            h = midstates[size].copy()
+            h.update(bytes([42, len(ts)]) + ts + _encoded_chain_id)
+            digests.append(h.digest())
+        return digests
+
+    scratch_time, scratch = _timeit(run_scratch)
+    midstate_time, midstate = _timeit(run_midstate)
+    assert scratch == midstate
+    _report(f"sha256 votes from scratch ({len(vote(timestamps[0]))}B)", scratch_time, count, "vote")
+    _report("sha256 votes from shared midstate", midstate_time, count, "vote")
+
+
+def bench_sha256_batch(count=2000):
+    # Tendermint inner node preimages: 0x01 || left || right.
+    messages = [b"\x01" + _rng.randbytes(64) for _ in range(count)]
+    scalar_time, scalar = _timeit(lambda: [sha256.digest(m) for m in messages])
+    batch_time, batch = _timeit(sha256.batch_digest, messages)
+    assert scalar == batch
+    _report("sha256 digest loop (65B)", scalar_time, count, "hash")
+    _report(f"sha256 batch_digest (65B, numpy={sha256.np is not None})", batch_time, count, "hash")
+
+
+def bench_sha256_backends(size=1 << 18):
+    data = _rng.randbytes(size)
+    expected = None
+    for name in sha256.backends():
+        elapsed, result = _timeit(lambda: sha256.new(data, name).digest())
+        assert expected is None or result == expected
+        expected = result
+        print(f"{'sha256 backend ' + name:<44} {size / elapsed / 1e6:10.3f} MB/s")
+
+
+def _synthetic_commit(count):
+    # A commit signed by count fresh validators of power 1, signatures sorted by address.
+    privs = [_rng.randrange(1, secp256k1._n) for _ in range(count)]
+    addresses = [secp256k1.pubkey_to_address(_pubkey_bytes(secp256k1.ecc_mul_base(d))) for d in privs]
+    multi_store = bridge.MultiStore(*[_rng.randbytes(32) for _ in range(6)])
+    merkle_parts = bridge.BlockHeaderMerkleParts(
+        _rng.randbytes(32), 180356, 1621412443, 922160838, *[_rng.randbytes(32) for _ in range(4)]
+    )
+    common_vote = bridge.CommonEncodedVotePart(_common_encoded_part[:15], _common_encoded_part[-38:])
+    block_hash = bridge.get_block_header(merkle_parts, bridge.get_app_hash(multi_store))
+    common_encoded_part = bridge.check_parts_and_encoded_common_parts(common_vote, block_hash)
+    timestamps = _encoded_timestamps(count)
+    signatures = []
+    for d, address, ts in sorted(zip(privs, addresses, timestamps), key=lambda x: x[1]):
+        vote = common_encoded_part + bytes([42, len(ts)]) + ts + _encoded_chain_id
+        e = int.from_bytes(sha256.digest(bytes([len(vote)]) + vote), "big")
+        r, s, v = _sign(d, e)
+        signatures.append(bridge.TMSignature(r, s, v, ts))
+    return multi_store, merkle_parts, common_vote, common_encoded_part, signatures, addresses
+
+
+def bench_bridge_header(count=100):
+    multi_store, merkle_parts, common_vote, common_encoded_part, signatures, addresses = _synthetic_commit(count)
+
+    def run_loop():
+        # One vote hash and one ecrecover per signature, as the contract does.
+        last_signer = bytes(20)
+        for sig in signatures:
+            vote = common_encoded_part + bytes([42, len(sig.encoded_timestamp)]) + sig.encoded_timestamp
+            vote += _encoded_chain_id
+            pub = secp256k1.ecrecover(sha256.digest(bytes([len(vote)]) + vote), sig.r, sig.s, sig.v)
+            signer = secp256k1.pubkey_to_address(pub)
+            assert signer > last_signer
+            last_signer = signer
+        return multi_store.oracle_iavl_state_hash
+
+    def run_bridge():
+        return bridge.verify_block_header(
+            multi_store, merkle_parts, common_vote, signatures, dict.fromkeys(addresses, 1), count,
+            _encoded_chain_id,
+        )
+
+    loop_time, loop = _timeit(run_loop)
+    bridge_time, root = _timeit(run_bridge)
+    assert loop == root == multi_store.oracle_iavl_state_hash
+    _report(f"verifyBlockHeader loop ({count} signatures)", loop_time, 1, "block")
+    _report(f"bridge.verify_block_header ({count} signatures)", bridge_time, 1, "block")
+
+
+def _iavl_proofs(count, version=13135977):
+    # A balanced oracle tree over request keys 1..count. Returns its root and one proof per key.
+    proofs = [(version, bridge.request_key(i), _rng.randbytes(32), []) for i in range(1, count + 1)]
+    nodes = [(bridge.get_leaf_hash(*proof[:3]), 0, 1, [proof]) for proof in proofs]
+    while len(nodes) > 1:
+        parents = []
+        for i in range(0, len(nodes) - 1, 2):
+            left, left_height, left_size, left_proofs = nodes[i]
+            right, right_height, right_size, right_proofs = nodes[i + 1]
+            height = max(left_height, right_height) + 1
+            size = left_size + right_size
+            node_version = _rng.randrange(1, version + 1)
+            for proof in left_proofs:
+                proof[3].append(bridge.IAVLMerklePath(False, height, size, node_version, right))
+            for proof in right_proofs:
+                proof[3].append(bridge.IAVLMerklePath(True, height, size, node_version, left))
+            parent = bridge.get_parent_hash(left_proofs[0][3][-1], left)
+            parents.append((parent, height, size, left_proofs + right_proofs))
+        if len(nodes) % 2:
+            parents.append(nodes[-1])
+        nodes = parents
+    return nodes[0][0], proofs
+
+
+def bench_iavl_proofs(count=2000):
+    root, proofs = _iavl_proofs(count)
+    bridge.encode_varint_signed.cache_clear()
+    loop_time, loop = _timeit(lambda: [bridge.verify_proof(root, *proof) for proof in proofs])
+    bulk_time, bulk = _timeit(bridge.verify_proofs, root, proofs)
+    assert loop == bulk == [True] * count
+    for name, elapsed in [("verify_proof loop", loop_time), ("verify_proofs", bulk_time)]:
+        print(f"{name + f' ({count} proofs)':<44} {count / elapsed:10.0f} proofs/s")
+
+
+def bench_bridge_codec(signatures=100, paths=20, rounds=50):
+    payload = bridge_codec.RelayAndVerify(
+        bridge_codec.RelayData(
+            bridge_codec.MultiStore(*[_rng.randbytes(32) for _ in range(6)]),
+            bridge_codec.BlockHeaderMerkleParts(_rng.randbytes(32), 1, 2, 3, *[_rng.randbytes(32) for _ in range(4)]),
+            bridge_codec.CommonEncodedVotePart(_rng.randbytes(15), _rng.randbytes(38)),
+            [
+                bridge_codec.TMSignature(_rng.randbytes(32), _rng.randbytes(32), 27, ts)
+                for ts in _encoded_timestamps(signatures)
+            ],
+        ),
+        bridge_codec.VerifyData(
+            1,
+            bridge_codec.Result("client", 1, _rng.randbytes(100), 16, 10, 1, 16, 1, 2, 1, _rng.randbytes(200)),
+            1,
+            [bridge_codec.IAVLMerklePath(True, i + 1, 2 << i, 1, _rng.randbytes(32)) for i in range(paths)],
+        ),
+    )
+    data = bridge_codec.encode(payload)
+    field_time, _ = _timeit(
+        lambda: [bridge_codec.decode_relay_and_verify(data).verify_data.result.request_id for _ in range(rounds)]
+    )
+
+    def run_full():
+        for _ in range(rounds):
+            decoded = bridge_codec.decode_relay_and_verify(data)
+            list(decoded.relay_data.signatures), list(decoded.verify_data.merkle_paths)
+
+    full_time, _ = _timeit(run_full)
+    encode_time, encoded = _timeit(lambda: [bridge_codec.encode(payload) for _ in range(rounds)])
+    assert encoded[0] == data
+    _report(f"decode, one field ({len(data)}B payload)", field_time, rounds, "payload")
+    _report(f"decode, every record ({len(data)}B payload)", full_time, rounds, "payload")
+    _report(f"encode ({len(data)}B payload)", encode_time, rounds, "payload")
+
+
+def bench_relay_optimizer(count=100):
+    multi_store, merkle_parts, common_vote, _, signatures, addresses = _synthetic_commit(count)
+    powers = {address: _rng.randrange(1, 1000) for address in addresses}
+    total = sum(powers.values())
+    payload = bridge_codec.RelayAndVerify(
+        bridge_codec.RelayData(multi_store, merkle_parts, common_vote, signatures),
+        bridge_codec.VerifyData(
+            1,
+            bridge_codec.Result("client", 1, b"", 16, 10, 1, 16, 1, 2, 1, b""),
+            1,
+            [bridge_codec.IAVLMerklePath(True, 1, 2, 1, _rng.randbytes(32))],
+        ),
+    )
+    for margin_bps in (0, 500):
+        elapsed, (optimized, _, report) = _timeit(
+            relay_optimizer.optimize_payload, payload, powers, total, _encoded_chain_id, margin_bps
+        )
+        relay_data = optimized.relay_data
+        bridge.verify_block_header(
+            relay_data.multi_store, relay_data.merkle_parts, relay_data.common_encoded_vote_part,
+            relay_data.signatures, powers, total, _encoded_chain_id,
+        )
+        _report(f"optimize_payload ({count} signatures, margin {margin_bps}bps)", elapsed, 1, "block")
+        print(f"  kept {report.kept}/{count}, saved {report.calldata_bytes_saved} calldata bytes, "
+              f"{report.calldata_gas_saved} calldata gas, ~{report.execution_gas_saved} execution gas")
+
+
+def bench_obi(count=20000):
+    params = [(_rng.randbytes(32), _rng.randrange(1 << 64), _rng.randbytes(20)) for _ in range(count)]
+    data = obi.VRF_PARAMS.encode_many(params)
+
+    def run_loop():
+        # Field by field with bytes slices, as the VRF worker decodes params today.
+        values = []
+        offset = 0
+        while offset < len(data):
+            n = int.from_bytes(data[offset:offset + 4], "big")
+            seed = data[offset + 4:offset + 4 + n]
+            offset += 4 + n
+            t = int.from_bytes(data[offset:offset + 8], "big")
+            n = int.from_bytes(data[offset + 8:offset + 12], "big")
+            worker = data[offset + 12:offset + 12 + n]
+            offset += 12 + n
+            values.append((seed, t, worker))
+        return values
+
+    loop_time, loop = _timeit(run_loop)
+    many_time, many = _timeit(obi.VRF_PARAMS.decode_many, data)
+    encode_time, encoded = _timeit(obi.VRF_PARAMS.encode_many, params)
+    assert loop == many == params and encoded == data
+    for name, elapsed in [("decode loop", loop_time), ("decode_many", many_time), ("encode_many", encode_time)]:
+        print(f"{name + f' ({count} VRF params)':<44} {count / elapsed:10.0f} records/s")
+
+
+def bench_result_codec(count=20000):
+    results = [
+        bridge_codec.Result(
+            f"client {i % 10}", _rng.randrange(1, 50), _rng.randbytes(40), 16, 10, 1000000 + i, 16,
+            1591622426 + i, 1591622429 + i, 1, _rng.randbytes(64),
+        )
+        for i in range(count)
+    ]
+    result_codec.encode_varint.cache_clear()
+    loop_time, loop = _timeit(lambda: [sha256.new(result_codec.encode(result)).digest() for result in results])
+    batch_time, batch = _timeit(result_codec.data_hashes, results)
+    assert loop == batch
+    for name, elapsed in [("encode + sha256 loop", loop_time), ("data_hashes", batch_time)]:
+        print(f"{name + f' ({count} results)':<44} {count / elapsed:10.0f} results/s")
+
+
+def bench_vrf_indexer(tasks=50000, per_block=50):
+    # A fake node: every block holds per_block requests and relays 90% of the previous block's.
+    caller = bytes(12) + _rng.randbytes(20)
+    blocks = []
+    for first in range(0, tasks, per_block):
+        logs = []
+        for nonce in range(first, first + per_block):
+            client_seed = f"client {nonce}".encode().ljust(32, b"\x00")
+            head = [1655972425, nonce, 1, nonce, 112, 10**15, 7 * 32, 12]
+            logs.append(([vrf_indexer.REQUESTED, "0x" + caller.hex()],
+                         b"".join(value.to_bytes(32, "big") for value in head) + client_seed))
+            if first and nonce % 10:
+                head = [1655972425, nonce, 1, nonce - per_block, 5 * 32, 12]
+                logs.append(([vrf_indexer.RELAYED, "0x" + caller.hex()],
+                             b"".join(value.to_bytes(32, "big") for value in head) + client_seed))
+        blocks.append(logs)
+
+    def rpc(method, params):
+        if method == "eth_blockNumber":
+            return hex(len(blocks) - 1)
+        if method == "eth_getBlockByNumber":
+            return {"hash": "0x%064x" % int(params[0], 16)}
+        first, last = int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16)
+        return [
+            {"blockNumber": hex(number), "logIndex": hex(i), "transactionHash": "0x%064x" % (number << 16 | i),
+             "topics": topics, "data": "0x" + data.hex()}
+            for number in range(first, last + 1)
+            for i, (topics, data) in enumerate(blocks[number])
+        ]
+
+    indexer = vrf_indexer.Indexer(":memory:", rpc, "0x" + "ab" * 20, confirmations=0, span=16, relayers=False)
+    sync_time, written = _timeit(indexer.sync)
+    query_time, pending = _timeit(indexer.pending_tasks)
+    assert len(pending) == tasks // 10 + per_block - per_block // 10
+    print(f"{f'sync ({written} logs)':<44} {written / sync_time:10.0f} logs/s")
+    _report(f"pending_tasks ({len(pending)} of {tasks} tasks)", query_time, 1, "query")
+
+
+BENCHMARKS = {
+    "ecc_mul": bench_ecc_mul,
+    "ecc_mul_base": bench_ecc_mul_base,
+    "ecc_mul2": bench_ecc_mul2,
+    "glv": bench_glv,
+    "batch_ecrecover": bench_batch_ecrecover,
+    "verify_commit": bench_verify_commit,
+    "commit_verifier": bench_commit_verifier,
+    "sha256_midstate": bench_sha256_midstate,
+    "sha256_batch": bench_sha256_batch,
+    "sha256_backends": bench_sha256_backends,
+    "bridge_header": bench_bridge_header,
+    "iavl_proofs": bench_iavl_proofs,
+    "bridge_codec": bench_bridge_codec,
+    "relay_optimizer": bench_relay_optimizer,
+    "obi": bench_obi,
+    "result_codec": bench_result_codec,
+    "vrf_indexer": bench_vrf_indexer,
+}
+
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or list(BENCHMARKS):
+        BENCHMARKS[name]()
@@ -0,0 +1,395 @@
+# Off-chain mirror of Bridge.verifyBlockHeader, for checking a relayBlock / relayAndVerify payload
+# before it is sent. Every check raises ValueError with the exact revert reason of the contract, so
+# a payload that passes here is only rejected on-chain if the bridge's validator set has changed.
+#
+# The records below take their fields in the order of the Solidity structs, so the tuples of a
+# decoded payload can be passed as MultiStore(*values), TMSignature(*values) and so on. bytes32 and
+# bytes fields are bytes; addresses are 20-byte bytes, which compare like the contract's uint160.
+from collections import namedtuple
+from functools import lru_cache
+
+import sha256
+from secp256k1 import _n, batch_ecrecover, pubkey_to_address
+
+MultiStore = namedtuple("MultiStore", [
+    "oracle_iavl_state_hash",
+    "mint_store_merkle_hash",
+    "params_to_restake_stores_merkle_hash",
+    "rollingseed_to_transfer_stores_merkle_hash",
+    "tss_to_upgrade_stores_merkle_hash",
+    "auth_to_icahost_stores_merkle_hash",
+])
+
+BlockHeaderMerkleParts = namedtuple("BlockHeaderMerkleParts", [
+    "version_and_chain_id_hash",
+    "height",
+    "time_second",
+    "time_nano_second_fraction",
+    "last_block_id_and_other",
+    "next_validator_hash_and_consensus_hash",
+    "last_results_hash",
+    "evidence_and_proposer_hash",
+])
+
+CommonEncodedVotePart = namedtuple("CommonEncodedVotePart", ["signed_data_prefix", "signed_data_suffix"])
+
+TMSignature = namedtuple("TMSignature", ["r", "s", "v", "encoded_timestamp"])
+
+IAVLMerklePath = namedtuple("IAVLMerklePath", [
+    "is_data_on_right",
+    "subtree_height",
+    "subtree_size",
+    "subtree_version",
+    "sibling_hash",
+])
+
+# Oracle store keys: hex"0052657175657374436f756e74" and abi.encodePacked(uint8(255), uint64 requestID).
+REQUESTS_COUNT_KEY = b"\x00RequestCount"
+
+_new = sha256.get_backend()
+
+
+def _sha256(m):
+    return _new(m).digest()
+
+
+def merkle_leaf_hash(value):
+    return _sha256(b"\x00" + value)
+
+
+def merkle_inner_hash(left, right):
+    return _sha256(b"\x01" + left + right)
+
+
+def encode_varint_unsigned(value):
+    # Utils.encodeVarintUnsigned writes result[size - 1] with size == 0 and reverts on zero.
+    if value <= 0:
+        raise ValueError(f"ENCODE_VARINT_ERROR: value must be positive but got {value}")
+    result = bytearray()
+    while value > 127:
+        result.append(0x80 | (value & 127))
+        value >>= 7
+    result.append(value)
+    return bytes(result)
+
+
+# The same few sizes and versions appear in every proof of an oracle tree, so their encodings are cached.
+@lru_cache(maxsize=4096)
+def encode_varint_signed(value):
+    return encode_varint_unsigned(value * 2)
+
+
+def encode_time(second, nano_second):
+    result = b"\x08" + encode_varint_unsigned(second)
+    if nano_second > 0:
+        result += b"\x10" + encode_varint_unsigned(nano_second)
+    return result
+
+
+def get_app_hash(multi_store):
+    oracle_leaf = merkle_leaf_hash(b"\x06oracle\x20" + _sha256(multi_store.oracle_iavl_state_hash))
+    return merkle_inner_hash(
+        multi_store.auth_to_icahost_stores_merkle_hash,
+        merkle_inner_hash(
+            merkle_inner_hash(
+                merkle_inner_hash(
+                    merkle_inner_hash(multi_store.mint_store_merkle_hash, oracle_leaf),
+                    multi_store.params_to_restake_stores_merkle_hash,
+                ),
+                multi_store.rollingseed_to_transfer_stores_merkle_hash,
+            ),
+            multi_store.tss_to_upgrade_stores_merkle_hash,
+        ),
+    )
+
+
+def get_block_header(merkle_parts, app_hash):
+    height_leaf = merkle_leaf_hash(b"\x08" + encode_varint_unsigned(merkle_parts.height))
+    time_leaf = merkle_leaf_hash(encode_time(merkle_parts.time_second, merkle_parts.time_nano_second_fraction))
+    app_hash_leaf = merkle_leaf_hash(b"\x0a\x20" + app_hash)
+    return merkle_inner_hash(
+        merkle_inner_hash(
+            merkle_inner_hash(merkle_parts.version_and_chain_id_hash, merkle_inner_hash(height_leaf, time_leaf)),
+            merkle_parts.last_block_id_and_other,
+        ),
+        merkle_inner_hash(
+            merkle_inner_hash(
+                merkle_parts.next_validator_hash_and_consensus_hash,
+                merkle_inner_hash(app_hash_leaf, merkle_parts.last_results_hash),
+            ),
+            merkle_parts.evidence_and_proposer_hash,
+        ),
+    )
+
+
+def check_parts_and_encoded_common_parts(common_encoded_vote_part, block_hash):
+    prefix, suffix = common_encoded_vote_part
+    if len(prefix) not in (15, 24):
+        raise ValueError("CommonEncodedVotePart: Invalid prefix's size")
+    if len(suffix) != 38:
+        raise ValueError("CommonEncodedVotePart: Invalid suffix's size")
+    return prefix + block_hash + suffix
+
+
+def _check_time(signature):
+    if not 6 <= len(signature.encoded_timestamp) <= 12:
+        raise ValueError("TMSignature: Invalid timestamp's size")
+
+
+# The sha256 of every canonical vote, sharing one midstate per vote size: the votes only differ in
+# the timestamp, which comes after the common encoded part.
+def _vote_hashes(signatures, common_encoded_part, encoded_chain_id):
+    midstates = {}
+    hashes = []
+    for signature in signatures:
+        timestamp = signature.encoded_timestamp
+        size = len(common_encoded_part) + 2 + len(timestamp) + len(encoded_chain_id)
+        midstate = midstates.get(size)
+        if midstate is None:
+            # uint8(encodedCanonicalVote.length) keeps only the low byte, as abi.encodePacked does.
+            midstate = midstates[size] = _new(bytes([size & 0xFF]) + common_encoded_part)
+        h = midstate.copy()
+        h.update(bytes([42, len(timestamp)]) + timestamp + encoded_chain_id)
+        hashes.append(h.digest())
+    return hashes
+
+
+# The ecrecover precompile returns address(0) instead of failing, which the signer order check then
+# rejects, so invalid signatures map to bytes(20) here.
+def _is_recoverable(r, s, v):
+    r = int.from_bytes(r, "big")
+    s = int.from_bytes(s, "big")
+    return v in (27, 28) and 0 < r < _n and 0 < s < _n
+
+
+# Recovers the signer of each message hash as ecrecover does: a signature it rejects (v not 27 or
+# 28, r or s out of range, r not an x coordinate) recovers address(0) instead of raising.
+def recover_hash_signers(hashes, rs, ss, vs):
+    signers = [bytes(20)] * len(hashes)
+    valid = [i for i in range(len(hashes)) if _is_recoverable(rs[i], ss[i], vs[i])]
+    columns = tuple([column[i] for i in valid] for column in (hashes, rs, ss, vs))
+    try:
+        pubs = batch_ecrecover(*columns)
+    except ValueError:
+        # An r that is not on the curve or a signature recovering to infinity fails the whole batch.
+        pubs = []
+        for column in zip(*columns):
+            try:
+                pubs.extend(batch_ecrecover(*[[value] for value in column]))
+            except ValueError:
+                pubs.append(None)
+    for i, pub in zip(valid, pubs):
+        if pub is not None:
+            signers[i] = pubkey_to_address(pub)
+    return signers
+
+
+def recover_signers(signatures, common_encoded_part, encoded_chain_id):
+    for signature in signatures:
+        _check_time(signature)
+    return recover_hash_signers(
+        _vote_hashes(signatures, common_encoded_part, encoded_chain_id),
+        [signature.r for signature in signatures],
+        [signature.s for signature in signatures],
+        [signature.v for signature in signatures],
+    )
+
+
+# Returns the voting power that signed the commit. validator_powers maps a 20-byte address to its
+# power; signers outside the set add no power, like a failed validatorPowers.tryGet.
+def sum_voting_power(signatures, common_encoded_part, encoded_chain_id, validator_powers):
+    # The contract checks the timestamp of a signature only after the order of the ones before it,
+    # so recover up to the first bad timestamp and raise its error after the order checks.
+    bad_time = next(
+        (i for i, signature in enumerate(signatures) if not 6 <= len(signature.encoded_timestamp) <= 12),
+        len(signatures),
+    )
+    signers = recover_signers(signatures[:bad_time], common_encoded_part, encoded_chain_id)
+
+    last_signer = bytes(20)
+    voting_power = 0
+    for signer in signers:
+        if not signer > last_signer:
+            raise ValueError("INVALID_SIGNATURE_SIGNER_ORDER")
+        voting_power += validator_powers.get(signer, 0)
+        last_signer = signer
+    if bad_time < len(signatures):
+        _check_time(signatures[bad_time])
+    return voting_power
+
+
+# Returns the oracle state root that relayBlock would store, or raises ValueError with the revert
+# reason of verifyBlockHeader.
+def verify_block_header(
+    multi_store,
+    merkle_parts,
+    common_encoded_vote_part,
+    signatures,
+    validator_powers,
+    total_validator_power,
+    encoded_chain_id,
+):
+    block_header = get_block_header(merkle_parts, get_app_hash(multi_store))
+    common_encoded_part = check_parts_and_encoded_common_parts(common_encoded_vote_part, block_header)
+    voting_power = sum_voting_power(signatures, common_encoded_part, encoded_chain_id, validator_powers)
+    if not voting_power * 3 > total_validator_power * 2:
+        raise ValueError("INSUFFICIENT_VALIDATOR_SIGNATURES")
+    return multi_store.oracle_iavl_state_hash
+
+
+def request_key(request_id):
+    return b"\xff" + request_id.to_bytes(8, "big")
+
+
+def get_parent_hash(merkle_path, data_subtree_hash):
+    if merkle_path.is_data_on_right:
+        left_subtree, right_subtree = merkle_path.sibling_hash, data_subtree_hash
+    else:
+        left_subtree, right_subtree = data_subtree_hash, merkle_path.sibling_hash
+    return _sha256(
+        # subtreeHeight << 1 is still a uint8, so a shifted out top bit is dropped.
+        bytes([(merkle_path.subtree_height << 1) & 0xFF])
+        + encode_varint_signed(merkle_path.subtree_size)
+        + encode_varint_signed(merkle_path.subtree_version)
+        + b"\x20" + left_subtree
+        + b"\x20" + right_subtree
+    )
+
+
+def get_leaf_hash(version, key, data_hash):
+    return _sha256(b"\x00\x02" + encode_varint_signed(version) + bytes([len(key) & 0xFF]) + key + b"\x20" + data_hash)
+
+
+def verify_proof(root_hash, version, key, data_hash, merkle_paths):
+    current_merkle_hash = get_leaf_hash(version, key, data_hash)
+    for merkle_path in merkle_paths:
+        current_merkle_hash = get_parent_hash(merkle_path, current_merkle_hash)
+    return current_merkle_hash == root_hash
+
+
+# Checks many (version, key, data hash, merkle paths) proofs against one oracle root. Proofs of keys
+# that are close in the tree share their upper paths, so once a proof reaches an inner node another
+# proof already went through, the rest of its path is a dictionary lookup instead of more sha256.
+def verify_proofs(root_hash, proofs):
+    parents = {}
+    results = []
+    for version, key, data_hash, merkle_paths in proofs:
+        current_merkle_hash = get_leaf_hash(version, key, data_hash)
+        for merkle_path in merkle_paths:
+            node = (current_merkle_hash, merkle_path)
+            parent = parents.get(node)
+            if parent is None:
+                parent = parents[node] = get_parent_hash(merkle_path, current_merkle_hash)
+            current_merkle_hash = parent
+        results.append(current_merkle_hash == root_hash)
+    return results
+
+
+# Mirrors Bridge.verifyRequestsCount against an oracle root the caller already trusts.
+def verify_requests_count(root_hash, count, version, merkle_paths):
+    count &= 0xFFFFFFFFFFFFFFFF  # uint64(count)
+    data_hash = _sha256(count.to_bytes(8, "big"))
+    if not verify_proof(root_hash, version, REQUESTS_COUNT_KEY, data_hash, merkle_paths):
+        raise ValueError("INVALID_ORACLE_DATA_PROOF")
+    return count
+
+
+def _raises(reason, fn, *args):
+    try:
+        fn(*args)
+    except ValueError as e:
+        assert e.args[0] == reason, e.args[0]
+        return
+    raise AssertionError(f"expected {reason}")
+
+
+if __name__ == "__main__":
+    # Vectors from tests/bridge/test_block_header_merkle_parts.py and test_tmsignature.py.
+    merkle_parts = BlockHeaderMerkleParts(
+        bytes.fromhex("E2082320A69AC962782E931075D14B13CD98F3E7FC5D8580D4EB60FBC0D622D5"),
+        180356,
+        1621412443,
+        922160838,
+        bytes.fromhex("4021DC4D787B5F0842D8F14EA4C87BDF2AAB95F201036D4A3E0EF1E9D2E7816B"),
+        bytes.fromhex("025E8953C93B0A8B399568160FFE8B29FC5394CAF235B07EC41DF1391ACF1A35"),
+        bytes.fromhex("68BD2057602D88D956B166F2FC88D1B6E18CE4846CCA241558FBBD0062DC6344"),
+        bytes.fromhex("23198513920C899234DA2518EDF1D35109AEB9BE637BAA272A0D94DB5530745A"),
+    )
+    block_hash = get_block_header(
+        merkle_parts, bytes.fromhex("E500B3DD21816EE04BE5E77271EC0D8286B8AFF81EF96344FED74B52992E6D23"))
+    assert block_hash.hex() == "8c36c3d12a378bd7e4e8f26bdecca68b48390240da456ee9c3292b6e36756ac4"
+
+    prefix = bytes.fromhex("08021184C002000000000022480A20")
+    suffix = bytes.fromhex("12240801122044551F853D916A7C630C0C210C921BAC7D05CE0C249DFC6088C0274F05841827")
+    common_encoded_part = check_parts_and_encoded_common_parts((prefix, suffix), block_hash)
+    assert common_encoded_part == prefix + block_hash + suffix
+    _raises("CommonEncodedVotePart: Invalid prefix's size", check_parts_and_encoded_common_parts,
+            (prefix[:-1], suffix), block_hash)
+    _raises("CommonEncodedVotePart: Invalid suffix's size", check_parts_and_encoded_common_parts,
+            (prefix + bytes(9), suffix + b"\x00"), block_hash)
+
+    encoded_chain_id = bytes.fromhex("321362616e642d6c616f7a692d746573746e657431")
+    signatures = [TMSignature(bytes.fromhex(r), bytes.fromhex(s), v, bytes.fromhex(t)) for r, s, v, t in [
+        ("6916405D52FF02EC26DD78E831E0A179C89B99CBBDB15C9DA802B75A7621D5EB",
+         "69CF40BE7AC1AA176B13BA4D57EB2B8735A5832014F0DC168EA6F580C51BB222", 28, "08DE9493850610F0FFAEEB02"),
+        ("6A8E3C35DEED991D257BCA9451360BFBE7978D388AF8D2F864A6919FE1083C7E",
+         "14D145DD6BC1A770ACBDF37DAC08DD8076AB888FDA2739BE9B9767B23A387D1E", 27, "08DE9493850610DAEB8D9C03"),
+        ("EB402F4B863A1DF91E7772D9574640EFFC5447ECEC6EDF6F1CFE2C33D7DC8DD4",
+         "1FEC45523E885DD6E8AD75EA2D81D30657267DF646406240F206A98749EBD0A7", 27, "08DE9493850610B68FD4E702"),
+    ]]
+    signers = [bytes.fromhex(a) for a in [
+        "3b759C4d728e50D5cC04c75f596367829d5b5061",
+        "49897b9D617AD700b84a935616E81f9f4b5305bc",
+        "7054bd1Fd7535A0DD552361e634196b1574594BB",
+    ]]
+    assert recover_signers(signatures, common_encoded_part, encoded_chain_id) == signers
+
+    powers = {signer: 10 for signer in signers}
+    assert sum_voting_power(signatures, common_encoded_part, encoded_chain_id, powers) == 30
+    assert sum_voting_power(signatures, common_encoded_part, encoded_chain_id, {signers[0]: 10}) == 10
+    _raises("INVALID_SIGNATURE_SIGNER_ORDER", sum_voting_power,
+            signatures[::-1], common_encoded_part, encoded_chain_id, powers)
+    # A v the precompile rejects recovers address(0), an r off the curve fails the batch.
+    _raises("INVALID_SIGNATURE_SIGNER_ORDER", sum_voting_power,
+            [signatures[0]._replace(v=29)] + signatures[1:], common_encoded_part, encoded_chain_id, powers)
+    _raises("INVALID_SIGNATURE_SIGNER_ORDER", sum_voting_power,
+            signatures[:2] + [signatures[2]._replace(r=(5).to_bytes(32, "big"))], common_encoded_part,
+            encoded_chain_id, powers)
+    # A short timestamp after an order violation still reverts with the order error.
+    _raises("INVALID_SIGNATURE_SIGNER_ORDER", sum_voting_power,
+            [signatures[1], signatures[0], signatures[2]._replace(encoded_timestamp=b"\x08")],
+            common_encoded_part, encoded_chain_id, powers)
+    _raises("TMSignature: Invalid timestamp's size", sum_voting_power,
+            signatures[:2] + [signatures[2]._replace(encoded_timestamp=bytes(13))],
+            common_encoded_part, encoded_chain_id, powers)
+
+    # Vectors from tests/bridge/test_iavl_merkle_path.py.
+    merkle_hash = bytes.fromhex("22AA109AFDA802E032EB0D4755090E67237F421DDCD5F2491128CB7768EA17A9")
+    for merkle_path, expected in [
+        ((False, 1, 2, 436, "6763EDF42C0D7A3765E8CD9B970AE0E20DC6D3CF5DF0DC63CAD2C85FAFC6A803"),
+         "9CE895E70AEB8767D86B7D80C03B0DE7C6F03422E0A6050B474C737D272ABE2B"),
+        ((True, 2, 4, 439, "92F33601466769D62670A58771C8F8F2695E7142B3852197DD3CA6825B8A3B26"),
+         "A36F3D44C03782769E03B659BFA473CA668C846E5C04300A08C1B0B33EB7FFA2"),
+        ((False, 3, 8, 584, "52C4B25043FF760DB4AE3F341E830908004D1E7C3BBDF724BC71DC24AA685134"),
+         "7ED53BF9F8E8B899CF5C3949D634F6FE2555DD5F9FC1E00754107B70E15328F3"),
+        ((False, 4, 16, 109145, "C0924EFCFAF77E4FF65E9F24ED0C43C7BBBBB070CC111C4A58DA2B66B1189E74"),
+         "C2AE72F6381535536804DDEA42368C815840B46AE23362033F489B6AF4E13C68"),
+    ]:
+        merkle_hash = get_parent_hash(IAVLMerklePath(*merkle_path[:4], bytes.fromhex(merkle_path[4])), merkle_hash)
+        assert merkle_hash == bytes.fromhex(expected)
+
+    assert encode_varint_signed(64) == b"\x80\x01"
+    assert request_key(300) == bytes.fromhex("ff000000000000012c")
+    assert REQUESTS_COUNT_KEY == bytes.fromhex("0052657175657374436f756e74")
+
+    # Two sibling leaves under one root: both proofs go through the same root node.
+    leaves = [(5, request_key(1), _sha256(b"one")), (7, request_key(2), _sha256(b"two"))]
+    left, right = [get_leaf_hash(*leaf) for leaf in leaves]
+    root = get_parent_hash(IAVLMerklePath(False, 1, 2, 7, right), left)
+    proofs = [
+        leaves[0] + ([IAVLMerklePath(False, 1, 2, 7, right)],),
+        leaves[1] + ([IAVLMerklePath(True, 1, 2, 7, left)],),
+        leaves[1][:2] + (_sha256(b"three"), [IAVLMerklePath(True, 1, 2, 7, left)]),
+    ]
+    assert [verify_proof(root, *proof) for proof in proofs] == verify_proofs(root, proofs) == [True, True, False]
+    _raises("INVALID_ORACLE_DATA_PROOF", verify_requests_count, root, 1, 5, [])
@@ -0,0 +1,380 @@
+# Codec for the proof payloads of Bridge.relayAndVerify, verifyOracleResult, relayAndMultiVerify and
+# relayAndVerifyCount. Decoding works on a memoryview of the payload. A struct decodes all of its
+# fields at once, but arrays (LazyArray) stay views until indexed, so looking at one field of a
+# large proof does not decode its signatures or merkle paths. Encoding sizes the whole payload first
+# and writes it into a single bytearray.
+#
+# The records use the field names of the bridge.py records, so a decoded relay payload can be
+# passed to bridge.verify_block_header and its merkle paths to bridge.verify_proofs as they are.
+import bridge
+
+
+class Record:
+    __slots__ = ()
+
+    def __init__(self, *values):
+        if len(values) != len(self.__slots__):
+            raise ValueError(f"{type(self).__name__}: expected {len(self.__slots__)} fields but got {len(values)}")
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def __iter__(self):
+        return (getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and tuple(self) == tuple(other)
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{name}={value!r}' for name, value in zip(self.__slots__, self))})"
+
+    def _replace(self, **changes):
+        return type(self)(*[changes.pop(name, value) for name, value in zip(self.__slots__, self)])
+
+
+class MultiStore(Record):
+    __slots__ = bridge.MultiStore._fields
+
+
+class BlockHeaderMerkleParts(Record):
+    __slots__ = bridge.BlockHeaderMerkleParts._fields
+
+
+class CommonEncodedVotePart(Record):
+    __slots__ = bridge.CommonEncodedVotePart._fields
+
+
+class TMSignature(Record):
+    __slots__ = bridge.TMSignature._fields
+
+
+class IAVLMerklePath(Record):
+    __slots__ = bridge.IAVLMerklePath._fields
+
+
+class Result(Record):
+    __slots__ = (
+        "client_id",
+        "oracle_script_id",
+        "params",
+        "ask_count",
+        "min_count",
+        "request_id",
+        "ans_count",
+        "request_time",
+        "resolve_time",
+        "resolve_status",
+        "result",
+    )
+
+
+class RelayData(Record):
+    __slots__ = ("multi_store", "merkle_parts", "common_encoded_vote_part", "signatures")
+
+
+class VerifyData(Record):
+    __slots__ = ("block_height", "result", "version", "merkle_paths")
+
+
+class CountData(Record):
+    __slots__ = ("block_height", "count", "version", "merkle_paths")
+
+
+class RelayAndVerify(Record):
+    __slots__ = ("relay_data", "verify_data")
+
+
+class RelayAndMultiVerify(Record):
+    __slots__ = ("relay_data", "verify_data")
+
+
+class RelayAndVerifyCount(Record):
+    __slots__ = ("relay_data", "verify_data")
+
+
+def _read_word(view, offset):
+    if offset + 32 > len(view):
+        raise ValueError("ABI_DECODE_ERROR: out of range")
+    return int.from_bytes(view[offset:offset + 32], "big")
+
+
+def _padded(size):
+    return (size + 31) & ~31
+
+
+# Each ABI type below decodes from (view, offset) and encodes into (buffer, offset), returning the
+# offset after what it wrote. A dynamic type takes one offset word in the head of its enclosing
+# tuple and size() bytes in the tail; size() is only needed once, to allocate the buffer.
+class _Uint:
+    dynamic = False
+    head_size = 32
+
+    def __init__(self, bits=256):
+        self.bits = bits
+
+    def decode(self, view, offset):
+        value = _read_word(view, offset)
+        if value >> self.bits:
+            raise ValueError(f"ABI_DECODE_ERROR: value does not fit uint{self.bits}")
+        return value
+
+    def size(self, value):
+        return 32
+
+    def encode_into(self, buf, offset, value):
+        buf[offset:offset + 32] = value.to_bytes(32, "big")
+        return offset + 32
+
+
+class _Bool(_Uint):
+    def __init__(self):
+        super().__init__(1)
+
+    def decode(self, view, offset):
+        return bool(super().decode(view, offset))
+
+
+class _Bytes32:
+    dynamic = False
+    head_size = 32
+
+    def decode(self, view, offset):
+        if offset + 32 > len(view):
+            raise ValueError("ABI_DECODE_ERROR: out of range")
+        return bytes(view[offset:offset + 32])
+
+    def size(self, value):
+        return 32
+
+    def encode_into(self, buf, offset, value):
+        if len(value) != 32:
+            raise ValueError(f"ABI_ENCODE_ERROR: bytes32 value has {len(value)} bytes")
+        buf[offset:offset + 32] = value
+        return offset + 32
+
+
+class _Bytes:
+    dynamic = True
+    head_size = 32
+
+    def decode(self, view, offset):
+        size = _read_word(view, offset)
+        if offset + 32 + size > len(view):
+            raise ValueError("ABI_DECODE_ERROR: out of range")
+        return bytes(view[offset + 32:offset + 32 + size])
+
+    def size(self, value):
+        return 32 + _padded(len(value))
+
+    def encode_into(self, buf, offset, value):
+        buf[offset:offset + 32] = len(value).to_bytes(32, "big")
+        buf[offset + 32:offset + 32 + len(value)] = value
+        return offset + 32 + _padded(len(value))
+
+
+class _String(_Bytes):
+    def decode(self, view, offset):
+        return super().decode(view, offset).decode()
+
+    def size(self, value):
+        return super().size(value.encode())
+
+    def encode_into(self, buf, offset, value):
+        return super().encode_into(buf, offset, value.encode())
+
+
+class _Tuple:
+    def __init__(self, record, types):
+        self.record = record
+        self.types = types
+        self.dynamic = any(t.dynamic for t in types)
+        # A dynamic tuple is an offset word in the head of its parent, its own head holds its fields.
+        self.fields_size = sum(32 if t.dynamic else t.head_size for t in types)
+        self.head_size = 32 if self.dynamic else self.fields_size
+
+    def decode(self, view, offset):
+        values = []
+        head = offset
+        for t in self.types:
+            if t.dynamic:
+                values.append(t.decode(view, offset + _read_word(view, head)))
+                head += 32
+            else:
+                values.append(t.decode(view, head))
+                head += t.head_size
+        return self.record(*values)
+
+    def size(self, value):
+        if not self.dynamic:
+            return self.head_size
+        return self.fields_size + sum(t.size(v) for t, v in zip(self.types, value) if t.dynamic)
+
+    def encode_into(self, buf, offset, value):
+        head = offset
+        tail = offset + self.fields_size
+        for t, v in zip(self.types, value):
+            if t.dynamic:
+                buf[head:head + 32] = (tail - offset).to_bytes(32, "big")
+                tail = t.encode_into(buf, tail, v)
+                head += 32
+            else:
+                head = t.encode_into(buf, head, v)
+        return tail
+
+
+class LazyArray:
+    __slots__ = ("_view", "_offset", "_length", "_type")
+
+    def __init__(self, view, offset, length, element_type):
+        self._view = view
+        self._offset = offset
+        self._length = length
+        self._type = element_type
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("LazyArray index out of range")
+        if self._type.dynamic:
+            return self._type.decode(self._view, self._offset + _read_word(self._view, self._offset + 32 * index))
+        return self._type.decode(self._view, self._offset + self._type.head_size * index)
+
+    def __iter__(self):
+        return (self[i] for i in range(self._length))
+
+    def __eq__(self, other):
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        return f"LazyArray({list(self)!r})"
+
+
+class _Array:
+    dynamic = True
+    head_size = 32
+
+    def __init__(self, element_type):
+        self.element_type = element_type
+
+    def decode(self, view, offset):
+        length = _read_word(view, offset)
+        element_size = 32 if self.element_type.dynamic else self.element_type.head_size
+        if offset + 32 + length * element_size > len(view):
+            raise ValueError("ABI_DECODE_ERROR: out of range")
+        return LazyArray(view, offset + 32, length, self.element_type)
+
+    def size(self, value):
+        t = self.element_type
+        if not t.dynamic:
+            return 32 + t.head_size * len(value)
+        return 32 + sum(32 + t.size(v) for v in value)
+
+    def encode_into(self, buf, offset, value):
+        t = self.element_type
+        buf[offset:offset + 32] = len(value).to_bytes(32, "big")
+        base = offset + 32
+        if not t.dynamic:
+            for v in value:
+                base = t.encode_into(buf, base, v)
+            return base
+        tail = base + 32 * len(value)
+        for i, v in enumerate(value):
+            buf[base + 32 * i:base + 32 * (i + 1)] = (tail - base).to_bytes(32, "big")
+            tail = t.encode_into(buf, tail, v)
+        return tail
+
+
+# A bytes field that itself holds abi.encode(inner), like the relay and verify data of a proof.
+# The inner payload is decoded in place and encoded straight into the outer buffer.
+class _Nested(_Bytes):
+    def __init__(self, inner):
+        self.inner = inner
+
+    def decode(self, view, offset):
+        size = _read_word(view, offset)
+        if offset + 32 + size > len(view):
+            raise ValueError("ABI_DECODE_ERROR: out of range")
+        return self.inner.decode(view[offset + 32:offset + 32 + size], 0)
+
+    def size(self, value):
+        return 32 + _padded(self.inner.size(value))
+
+    def encode_into(self, buf, offset, value):
+        end = self.inner.encode_into(buf, offset + 32, value)
+        buf[offset:offset + 32] = (end - offset - 32).to_bytes(32, "big")
+        return offset + 32 + _padded(end - offset - 32)
+
+
+_uint = _Uint()
+_bytes32 = _Bytes32()
+_bytes = _Bytes()
+
+_multi_store = _Tuple(MultiStore, [_bytes32] * 6)
+_merkle_parts = _Tuple(BlockHeaderMerkleParts, [_bytes32, _Uint(64), _Uint(64), _Uint(32)] + [_bytes32] * 4)
+_common_encoded_vote_part = _Tuple(CommonEncodedVotePart, [_bytes, _bytes])
+_tm_signature = _Tuple(TMSignature, [_bytes32, _bytes32, _Uint(8), _bytes])
+_merkle_path = _Tuple(IAVLMerklePath, [_Bool(), _Uint(8), _uint, _uint, _bytes32])
+_result = _Tuple(Result, [_String(), _Uint(64), _bytes] + [_Uint(64)] * 6 + [_Uint(8), _bytes])
+
+_relay_data = _Tuple(RelayData, [_multi_store, _merkle_parts, _common_encoded_vote_part, _Array(_tm_signature)])
+_verify_data = _Tuple(VerifyData, [_uint, _result, _uint, _Array(_merkle_path)])
+_count_data = _Tuple(CountData, [_uint, _uint, _uint, _Array(_merkle_path)])
+
+_payloads = {
+    RelayAndVerify: _Tuple(RelayAndVerify, [_Nested(_relay_data), _Nested(_verify_data)]),
+    RelayAndMultiVerify: _Tuple(RelayAndMultiVerify, [_Nested(_relay_data), _Array(_Nested(_verify_data))]),
+    RelayAndVerifyCount: _Tuple(RelayAndVerifyCount, [_Nested(_relay_data), _Nested(_count_data)]),
+}
+
+
+def _view(data):
+    if isinstance(data, str):
+        data = bytes.fromhex(data[2:] if data.startswith("0x") else data)
+    return memoryview(data).cast("B")
+
+
+# relayAndVerify and verifyOracleResult take the same payload.
+def decode_relay_and_verify(data):
+    return _payloads[RelayAndVerify].decode(_view(data), 0)
+
+
+def decode_relay_and_multi_verify(data):
+    return _payloads[RelayAndMultiVerify].decode(_view(data), 0)
+
+
+def decode_relay_and_verify_count(data):
+    return _payloads[RelayAndVerifyCount].decode(_view(data), 0)
+
+
+# Encodes a RelayAndVerify, RelayAndMultiVerify or RelayAndVerifyCount record. Fields may be
+# records, decoded records or plain tuples in struct order.
+def encode(payload):
+    t = _payloads[type(payload)]
+    buf = bytearray(t.size(payload))
+    t.encode_into(buf, 0, payload)
+    return bytes(buf)
+
+
+if __name__ == "__main__":
+    payload = RelayAndVerifyCount(
+        RelayData(
+            MultiStore(*[bytes([i]) * 32 for i in range(6)]),
+            BlockHeaderMerkleParts(bytes(32), 180356, 1621412443, 922160838, *[bytes(32)] * 4),
+            CommonEncodedVotePart(bytes(15), bytes(38)),
+            [TMSignature(bytes([1]) * 32, bytes([2]) * 32, 27, bytes(12)), TMSignature(bytes(32), bytes(32), 28, b"")],
+        ),
+        CountData(180356, 7, 180300, [IAVLMerklePath(True, 1, 2, 180300, bytes([3]) * 32)]),
+    )
+    data = encode(payload)
+    assert len(data) % 32 == 0
+    decoded = decode_relay_and_verify_count(data)
+    assert decoded == payload and encode(decoded) == data
+    assert decoded.relay_data.signatures[-1].encoded_timestamp == b""
@@ -0,0 +1,105 @@
+# Re-verifies the signatures of many past BandChain blocks across a pool of worker processes.
+#
+# A block is (height, signatures) where every signature is (message hash, r, s, v), the same inputs
+# Bridge.verifyBlockHeader passes to ecrecover. Blocks are grouped into chunks and at most
+# max_in_flight chunks are queued at any time, so memory stays bounded however long the input is.
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from bridge import recover_hash_signers
+
+
+# A signature ecrecover rejects recovers address(0), which voting_power turns into a rejected block
+# rather than an error that would lose the rest of the chunk.
+def recover_signers(signatures):
+    if not signatures:
+        return []
+    messages, rs, ss, vs = zip(*signatures)
+    return recover_hash_signers(messages, rs, ss, vs)
+
+
+def _recover_chunk(chunk):
+    return [(height, recover_signers(signatures)) for height, signatures in chunk]
+
+
+def _chunks(blocks, chunk_size):
+    blocks = iter(blocks)
+    while True:
+        chunk = list(islice(blocks, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# Sums the power of signers the way verifyBlockHeader does, or returns None where it reverts with
+# INVALID_SIGNATURE_SIGNER_ORDER: every signer, address(0) included, must be above the one before it.
+def voting_power(signers, validator_powers):
+    last_signer = bytes(20)
+    power = 0
+    for signer in signers:
+        if signer <= last_signer:
+            return None
+        power += validator_powers.get(signer, 0)
+        last_signer = signer
+    return power
+
+
+# Yields (height, signers, voting power) for every block, in input order. validator_powers maps a
+# 20-byte address to its power; signers outside the set add no power, as in verifyBlockHeader. The
+# power is None for a block the contract rejects because its signers are not strictly increasing.
+def verify_commits(blocks, validator_powers, workers=None, chunk_size=8, max_in_flight=None):
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+
+    def report(results):
+        for height, signers in results:
+            yield height, signers, voting_power(signers, validator_powers)
+
+    if workers == 1:
+        for chunk in _chunks(blocks, chunk_size):
+            yield from report(_recover_chunk(chunk))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in _chunks(blocks, chunk_size):
+            if len(pending) >= max_in_flight:
+                yield from report(pending.popleft().result())
+            pending.append(executor.submit(_recover_chunk, chunk))
+        while pending:
+            yield from report(pending.popleft().result())
+
+
+if __name__ == "__main__":
+    blocks = [
+        (
+            height,
+            [(
+                bytes.fromhex("45298f64c176ea53805cec6a6bff4bdd3fccb40250d62dc8f954aab6ef9037cb"),
+                bytes.fromhex("10ce9c6360ed05342478a0ed2ec6d378adf5a1d437a2be3c8e89740b3cd3bff1"),
+                bytes.fromhex("aa4b0588903d649c20d4d924998cb8be13e1f4ffe7e11ad8f84f80a8b2771fc9"),
+                27,
+            )],
+        )
+        for height in range(5)
+    ]
+    signer = bytes.fromhex("ddf22d062cd8c0f7335b223591a21b701320b5b9")
+    for workers in (1, 2):
+        assert list(verify_commits(blocks, {signer: 7}, workers=workers, chunk_size=2)) == [
+            (height, [signer], 7) for height in range(5)
+        ]
+    # The same signature twice, or a signer below the one before it, is a block the chain rejects.
+    blocks.append((5, blocks[0][1] * 2))
+    assert list(verify_commits(blocks, {signer: 7}, workers=1))[-1] == (5, [signer, signer], None)
+    # An r that is not an x coordinate, or a v ecrecover rejects, fails only its own block.
+    message, r, s, v = blocks[0][1][0]
+    bad_r = (5).to_bytes(32, "big")
+    blocks[1:] = [(6, [(message, bad_r, s, v)]), (7, [(message, r, s, 0)]), (8, blocks[0][1])]
+    assert list(verify_commits(blocks, {signer: 7}, workers=2, chunk_size=3)) == [
+        (0, [signer], 7), (6, [bytes(20)], None), (7, [bytes(20)], None), (8, [signer], 7),
+    ]
+    assert voting_power([bytes([2]) * 20, bytes([1]) * 20], {}) is None
+    assert voting_power([bytes(20)], {}) is None
+    assert voting_power([bytes([1]) * 20, bytes([2]) * 20], {bytes([2]) * 20: 3}) == 3
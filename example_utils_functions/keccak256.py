@@ -0,0 +1,66 @@
+# https://keccak.team/keccak_specs_summary.html
+# Ethereum's keccak256 uses the original Keccak padding (0x01), not the FIPS-202 SHA3 padding (0x06),
+# so hashlib.sha3_256 cannot be used in its place.
+
+F64 = 0xFFFFFFFFFFFFFFFF
+
+_rc = [0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+       0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+       0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+       0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+       0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+       0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008]
+
+# Rotation offsets r[x][y], indexed as lane x + 5 * y.
+_rotations = [0, 1, 62, 28, 27,
+              36, 44, 6, 55, 20,
+              3, 10, 43, 25, 39,
+              41, 45, 15, 21, 8,
+              18, 2, 61, 56, 14]
+
+_rate = 136
+
+
+def _rotl(x, y):
+    return ((x << y) | (x >> (64 - y))) & F64 if y else x
+
+
+def _keccak_f(a):
+    for rc in _rc:
+        # theta
+        c = [a[x] ^ a[x + 5] ^ a[x + 10] ^ a[x + 15] ^ a[x + 20] for x in range(5)]
+        d = [c[(x - 1) % 5] ^ _rotl(c[(x + 1) % 5], 1) for x in range(5)]
+        a = [a[i] ^ d[i % 5] for i in range(25)]
+        # rho and pi
+        b = [0] * 25
+        for x in range(5):
+            for y in range(5):
+                b[y + 5 * ((2 * x + 3 * y) % 5)] = _rotl(a[x + 5 * y], _rotations[x + 5 * y])
+        # chi
+        a = [b[i] ^ ((~b[(i % 5 + 1) % 5 + 5 * (i // 5)]) & b[(i % 5 + 2) % 5 + 5 * (i // 5)])
+             for i in range(25)]
+        # iota
+        a[0] ^= rc
+    return a
+
+
+def digest(_m):
+    padlen = _rate - len(_m) % _rate
+    if padlen == 1:
+        m = _m + b'\x81'
+    else:
+        m = _m + b'\x01' + (b'\x00' * (padlen - 2)) + b'\x80'
+
+    state = [0] * 25
+    for i in range(0, len(m), _rate):
+        block = m[i:i + _rate]
+        for j in range(_rate // 8):
+            state[j] ^= int.from_bytes(block[j * 8:j * 8 + 8], byteorder='little')
+        state = _keccak_f(state)
+
+    return b''.join([(i).to_bytes(8, byteorder='little') for i in state[:4]])
+
+
+if __name__ == "__main__":
+    assert digest(b'').hex() == 'c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470'
+    assert digest(b'abc').hex() == '4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45'
@@ -0,0 +1,309 @@
+# OBI encoder and decoder for the types of contracts/obi/Obi.sol, driven by a schema such as
+# "{seed:bytes,time:u64,task_worker:bytes}". Structs may nest; a bare type ("u64") is a schema too.
+#
+# A schema compiles once into a list of steps. Neighbouring fixed-width fields share one
+# struct.Struct, so a run of integers and bools is a single unpack_from, and bytes/string fields are
+# read as one memoryview slice each. Decoded structs are namedtuples; structs are encoded from any
+# sequence in field order or from a mapping by field name.
+import struct
+from collections import namedtuple
+
+# Types struct can read in one step, with the size Obi.sol shifts by.
+_FIXED = {
+    "u8": "B",
+    "u16": "H",
+    "u32": "I",
+    "u64": "Q",
+    "i8": "b",
+    "i16": "h",
+    "i32": "i",
+    "i64": "q",
+    "bool": "?",
+}
+# Wider integers and the fixed-size byte arrays of Obi.sol: (size, signed) or (size, None) for bytes.
+_WIDE = {
+    "u128": (16, False),
+    "u256": (32, False),
+    "i128": (16, True),
+    "i256": (32, True),
+    "bytes32": (32, None),
+    "bytes64": (64, None),
+    "bytes65": (65, None),
+}
+_LENGTH = struct.Struct(">I")
+
+
+# The signed integers here are plain two's complement, which is how Band encodes them, while
+# decodeI16 to decodeI256 of Obi.sol OR together the sign-extended halves of the value: they agree
+# unless the top bit of a lower half is set, where Obi.sol decodes 0x0080 as -128 and this module as
+# 128. obi_sol_signed reproduces Obi.sol for one big-endian signed field.
+def obi_sol_signed(raw):
+    if len(raw) == 1:
+        return int.from_bytes(raw, "big", signed=True)
+    half = len(raw) // 2
+    return obi_sol_signed(raw[:half]) << (8 * half) | obi_sol_signed(raw[half:])
+
+
+class Struct:
+    def __init__(self, name, fields):
+        self.fields = fields
+        self.record = namedtuple(name, [field for field, _ in fields])
+
+
+def parse_schema(schema, name="Record"):
+    text = "".join(schema.split())
+    kind, end = _parse(text, 0, name)
+    if end != len(text):
+        raise ValueError(f"OBI_SCHEMA: unexpected {text[end:]!r}")
+    return kind
+
+
+def _parse(text, pos, name):
+    if text.startswith("{", pos):
+        fields = []
+        pos += 1
+        while not text.startswith("}", pos):
+            colon = text.find(":", pos)
+            if colon < 0:
+                raise ValueError(f"OBI_SCHEMA: missing ':' after {text[pos:]!r}")
+            field = text[pos:colon]
+            if not field.isidentifier() or field in dict(fields):
+                raise ValueError(f"OBI_SCHEMA: bad field name {field!r}")
+            kind, pos = _parse(text, colon + 1, field.title().replace("_", ""))
+            fields.append((field, kind))
+            if text.startswith(",", pos):
+                pos += 1
+            elif not text.startswith("}", pos):
+                raise ValueError(f"OBI_SCHEMA: expected ',' or '}}' at {text[pos:]!r}")
+        if not fields:
+            raise ValueError("OBI_SCHEMA: empty struct")
+        return Struct(name, fields), pos + 1
+    end = pos
+    while end < len(text) and text[end].isalnum():
+        end += 1
+    kind = text[pos:end]
+    if kind not in _FIXED and kind not in _WIDE and kind not in ("bytes", "string"):
+        raise ValueError(f"OBI_SCHEMA: unknown type {kind!r}")
+    return kind, end
+
+
+# Flattens a schema into its leaf types in wire order. Each leaf gets a variable name, and the
+# returned expression rebuilds the decoded value from those variables, e.g.
+# "new(R0, (v0, new(R1, (v1, v2, )), ))", where new is tuple.__new__ as in namedtuple._make.
+def _flatten(kind, leaves, records):
+    if isinstance(kind, Struct):
+        name = f"R{len(records)}"
+        records[name] = kind
+        return f"new({name}, ({''.join(_flatten(field_kind, leaves, records) + ', ' for _, field_kind in kind.fields)}))"
+    leaves.append((f"v{len(leaves)}", kind))
+    return leaves[-1][0]
+
+
+# Groups leaves into runs: consecutive fixed-width leaves form one run, every other leaf its own.
+def _runs(leaves):
+    runs = []
+    for leaf in leaves:
+        if leaf[1] in _FIXED and runs and runs[-1][0][1] in _FIXED:
+            runs[-1].append(leaf)
+        else:
+            runs.append([leaf])
+    return runs
+
+
+# Both codecs are generated as Python source, the way collections.namedtuple builds its classes,
+# so decoding one record is straight-line code: one unpack_from per run of fixed-width fields and
+# one memoryview slice per bytes/string field.
+#
+# Returns the source of decode_from and decode_many with the names it expects in its namespace:
+# the records (R<i>, namedtuple classes of the schema's Structs) and the layouts (S<i>, the struct
+# formats of the fixed-width runs). obi_codegen.py writes the same source out as a module.
+def decoder_source(schema):
+    leaves = []
+    records = {}
+    result = _flatten(schema, leaves, records)
+    layouts = {}
+    body = []
+    for i, run in enumerate(_runs(leaves)):
+        name, kind = run[0]
+        if kind in _FIXED:
+            layouts[f"S{i}"] = ">" + "".join(_FIXED[kind] for _, kind in run)
+            size = struct.calcsize(layouts[f"S{i}"])
+            body += [f"{', '.join(name for name, _ in run)}, = S{i}(view, offset)", f"offset += {size}"]
+            continue
+        if kind in ("bytes", "string"):
+            body += ["end = offset + 4 + L(view, offset)[0]", "offset += 4"]
+            read = "str(view[offset:end], 'utf-8')" if kind == "string" else "bytes(view[offset:end])"
+        else:
+            width, signed = _WIDE[kind]
+            body += [f"end = offset + {width}"]
+            read = "bytes(view[offset:end])" if signed is None else f"from_bytes(view[offset:end], 'big', signed={signed})"
+        body += ["if end > size:", "    raise ValueError('Obi: Out of range')", f"{name} = {read}", "offset = end"]
+
+    # decode_many runs the same body in a loop rather than calling decode_from per record.
+    lines = ["def decode_from(view, offset):", "    size = len(view)", "    try:"]
+    lines += ["        " + line for line in body]
+    lines += [
+        "    except struct_error:",
+        "        raise ValueError('Obi: Out of range') from None",
+        f"    return {result}, offset",
+        "",
+        "",
+        "def decode_many(view):",
+        "    size = len(view)",
+        "    offset = 0",
+        "    values = []",
+        "    append = values.append",
+        "    try:",
+        "        while offset < size:",
+    ]
+    lines += ["            " + line for line in body]
+    lines += [
+        f"            append({result})",
+        "    except struct_error:",
+        "        raise ValueError('Obi: Out of range') from None",
+        "    return values",
+    ]
+    return "\n".join(lines) + "\n", records, layouts
+
+
+def _build_decoder(schema):
+    source, records, layouts = decoder_source(schema)
+    namespace = {name: kind.record for name, kind in records.items()}
+    namespace.update({name: struct.Struct(layout).unpack_from for name, layout in layouts.items()})
+    namespace.update(new=tuple.__new__, L=_LENGTH.unpack_from, from_bytes=int.from_bytes, struct_error=struct.error)
+    exec(source, namespace)
+    return namespace["decode_from"], namespace["decode_many"]
+
+
+# Unpacks a value into the leaf variables of _flatten, accepting sequences and mappings for structs.
+def _unpack_lines(kind, target, leaves, lines, indent):
+    if not isinstance(kind, Struct):
+        leaves.append((target, kind))
+        return
+    names = [f"{target}_{i}" for i in range(len(kind.fields))]
+    fields = ", ".join(repr(field) for field, _ in kind.fields)
+    lines += [
+        f"{indent}if isinstance({target}, dict):",
+        f"{indent}    {target} = [{target}[field] for field in ({fields},)]",
+        f"{indent}{', '.join(names)}, = {target}",
+    ]
+    for name, (_, field_kind) in zip(names, kind.fields):
+        _unpack_lines(field_kind, name, leaves, lines, indent)
+
+
+def _build_encoder(schema):
+    leaves = []
+    lines = ["def encode_into(value, out):", "    try:"]
+    _unpack_lines(schema, "value", leaves, lines, "        ")
+    namespace = {"L": _LENGTH.pack, "struct_error": struct.error}
+    for i, run in enumerate(_runs(leaves)):
+        name, kind = run[0]
+        if kind in _FIXED:
+            namespace[f"S{i}"] = struct.Struct(">" + "".join(_FIXED[kind] for _, kind in run)).pack
+            lines.append(f"        out += S{i}({', '.join(name for name, _ in run)})")
+        elif kind in ("bytes", "string"):
+            lines += [
+                f"        raw = {name}.encode()" if kind == "string" else f"        raw = bytes({name})",
+                "        out += L(len(raw))",
+                "        out += raw",
+            ]
+        else:
+            width, signed = _WIDE[kind]
+            if signed is None:
+                lines += [
+                    f"        if len({name}) != {width}:",
+                    f"            raise ValueError('OBI_ENCODE: {kind} needs {width} bytes')",
+                    f"        out += {name}",
+                ]
+            else:
+                lines.append(f"        out += {name}.to_bytes({width}, 'big', signed={signed})")
+    lines += [
+        "    except (struct_error, OverflowError, ValueError, TypeError, KeyError) as e:",
+        "        if str(e).startswith('OBI_ENCODE'):",
+        "            raise",
+        "        raise ValueError(f'OBI_ENCODE: {e}') from None",
+    ]
+    exec("\n".join(lines), namespace)
+    return namespace["encode_into"]
+
+
+# Slicing bytes copies once, while bytes(memoryview[...]) allocates the view and then copies, so
+# bytes are read as they are and anything else (bytearray, mmap, a larger buffer) through a view.
+def _view(data):
+    return data if type(data) is bytes else memoryview(data)
+
+
+class Codec:
+    def __init__(self, schema):
+        self.schema = parse_schema(schema) if isinstance(schema, str) else schema
+        self._decode_from, self._decode_many = _build_decoder(self.schema)
+        self._encode_into = _build_encoder(self.schema)
+
+    def decode(self, data):
+        view = _view(data)
+        value, offset = self._decode_from(view, 0)
+        if offset != len(view):
+            raise ValueError("DATA_DECODE_NOT_FINISHED")
+        return value
+
+    # Decodes records laid back to back until the buffer is used up.
+    def decode_many(self, data):
+        return self._decode_many(_view(data))
+
+    def encode(self, value):
+        out = bytearray()
+        self._encode_into(value, out)
+        return bytes(out)
+
+    def encode_many(self, values):
+        out = bytearray()
+        encode_into = self._encode_into
+        for value in values:
+            encode_into(value, out)
+        return bytes(out)
+
+
+# The VRF oracle scripts. Result.params of a VRF request is VRF_PARAMS; the V1 result is the proof
+# followed by the result (VRFDecoderV1.decodeResult reads them in that order), the V2 result only
+# the result.
+VRF_PARAMS = Codec("{seed:bytes,time:u64,task_worker:bytes}")
+VRF_V1_RESULT = Codec("{proof:bytes,result:bytes}")
+VRF_V2_RESULT = Codec("{result:bytes}")
+
+
+if __name__ == "__main__":
+    # The vectors of tests/bridge/test_obi.py.
+    price = Codec("{symbol:string,multiplier:u64,what:u8}")
+    assert price.decode(bytes.fromhex("00000003425443000000000000003264")) == ("BTC", 50, 100)
+    assert price.decode(bytes.fromhex("0000000462616e64000000000000019064")) == ("band", 400, 100)
+    assert price.encode({"symbol": "band", "multiplier": 400, "what": 100}).hex() == "0000000462616e64000000000000019064"
+    for data, error in [
+        ("000000034254433200000000000064", "Obi: Out of range"),
+        ("0000000342544300000000000000326400", "DATA_DECODE_NOT_FINISHED"),
+    ]:
+        try:
+            price.decode(bytes.fromhex(data))
+            raise AssertionError(f"expected {error}")
+        except ValueError as e:
+            assert e.args[0] == error
+
+    every = Codec("{a:u8,b:i8,c:u16,d:i16,e:u32,f:i32,g:u64,h:i64,i:u128,j:i128,k:u256,l:i256,m:bool,"
+                  "n:{o:string,p:bytes32},q:bytes64,r:bytes65,s:bytes}")
+    value = every.schema.record(
+        255, -128, 65535, -32768, 2**32 - 1, -2**31, 2**64 - 1, -2**63, 2**128 - 1, -2**127, 2**256 - 1, -1,
+        True, every.schema.fields[13][1].record("obi", bytes(range(32))), bytes(64), bytes(range(65)), b"",
+    )
+    encoded = every.encode(value)
+    assert len(encoded) == 1 + 1 + 2 + 2 + 4 + 4 + 8 + 8 + 16 + 16 + 32 + 32 + 1 + 7 + 32 + 64 + 65 + 4
+    assert every.decode(encoded) == value
+    assert every.decode_many(encoded * 3) == [value] * 3
+    for raw, value in [("80", -128), ("7fff", -1), ("ff7f0000", -0x810000), ("0080", -128),
+                       ("00800000", -2**23), ("0000000000000080", -128)]:
+        assert obi_sol_signed(bytes.fromhex(raw)) == value
+    assert Codec("i16").decode(bytes.fromhex("0080")) == 128
+    assert Codec("u64").decode_many(Codec("u64").encode_many(range(5))) == list(range(5))
+    try:
+        Codec("u8").encode(256)
+        raise AssertionError("expected OBI_ENCODE")
+    except ValueError as e:
+        assert e.args[0].startswith("OBI_ENCODE")
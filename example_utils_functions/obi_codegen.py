@@ -0,0 +1,236 @@
+# Generates a specialized decoder for one OBI schema, as a Solidity library and as a Python module.
+#
+# Obi.sol decodes field by field, and decodeU64 alone is eight decodeU8 calls with a bounds check
+# and an offset update each. The generated library walks the buffer with a single pointer instead:
+# fixed-width fields are read with one mload at a fixed offset from it, and bytes/string fields are
+# copied a word at a time. The only bounds checks are one per bytes/string field, which has to read
+# its length before it can move on, and one at the end if the schema ends in fixed-width fields; a
+# schema of fixed-width fields alone is checked once. Reverts use the strings of Obi.sol and the
+# hand-written decoders ("Obi: Out of range", "DATA_DECODE_NOT_FINISHED").
+#
+#     python obi_codegen.py solidity ObiVRFParams Params "{seed:bytes,time:u64,task_worker:bytes}"
+#     python obi_codegen.py python ObiVRFParams Params "{seed:bytes,time:u64,task_worker:bytes}"
+#     python obi_codegen.py vrf  # rewrites contracts/obi/generated from VRF_SCHEMAS
+import os
+import sys
+
+import obi
+
+_SOLIDITY_TYPES = {
+    "bool": "bool",
+    "string": "string",
+    "bytes": "bytes",
+    "bytes32": "bytes32",
+    **{f"u{bits}": f"uint{bits}" for bits in (8, 16, 32, 64, 128, 256)},
+    **{f"i{bits}": f"int{bits}" for bits in (8, 16, 32, 64, 128, 256)},
+}
+_WIDTHS = {"bool": 1, "bytes32": 32, **{f"{sign}{bits}": bits // 8 for sign in "ui" for bits in (8, 16, 32, 64, 128, 256)}}
+
+
+def _camel_case(name):
+    head, *tail = name.split("_")
+    return head + "".join(part[:1].upper() + part[1:] for part in tail)
+
+
+def _fields(schema):
+    kind = obi.parse_schema(schema)
+    if not isinstance(kind, obi.Struct):
+        raise ValueError("OBI_CODEGEN: the schema must be a struct")
+    for name, field_kind in kind.fields:
+        if field_kind not in _SOLIDITY_TYPES:
+            raise ValueError(f"OBI_CODEGEN: {name}: {field_kind if isinstance(field_kind, str) else 'struct'} is not supported")
+    return kind.fields
+
+
+# The assembly expression that reads a fixed-width field at pointer p.
+def _load(kind, p):
+    word = f"mload({p})"
+    if kind == "bool":
+        return f"iszero(iszero(shr(248, {word})))"
+    width = _WIDTHS[kind]
+    if width == 32:
+        return word
+    value = f"shr({256 - 8 * width}, {word})"
+    return f"signextend({width - 1}, {value})" if kind.startswith("i") else value
+
+
+def generate_solidity(library, struct_name, schema):
+    fields = _fields(schema)
+    members = "".join(f"        {_SOLIDITY_TYPES[kind]} {_camel_case(name)};\n" for name, kind in fields)
+    body = []
+    run = []
+
+    def flush():
+        # One assembly block per run of fixed-width fields: every load is at a constant offset from
+        # ptr and is stored straight into its struct member, the word at value + 32 * index.
+        if not run:
+            return
+        body.append("        // solium-disable-next-line security/no-inline-assembly\n")
+        body.append("        assembly {\n")
+        offset = 0
+        for index, name, kind in run:
+            p = f"add(ptr, {offset})" if offset else "ptr"
+            member = f"add(value, {32 * index})" if index else "value"
+            body.append(f"            // {name}: {kind}\n")
+            body.append(f"            mstore({member}, {_load(kind, p)})\n")
+            offset += _WIDTHS[kind]
+        body.append(f"            ptr := add(ptr, {offset})\n")
+        body.append("        }\n")
+        run.clear()
+
+    for index, (name, kind) in enumerate(fields):
+        if kind not in ("bytes", "string"):
+            run.append((index, name, kind))
+            continue
+        flush()
+        copy = "_copy(ptr, size)" if kind == "bytes" else "string(_copy(ptr, size))"
+        body.append(
+            "        // solium-disable-next-line security/no-inline-assembly\n"
+            "        assembly {\n"
+            "            size := shr(224, mload(ptr))\n"
+            "            ptr := add(ptr, 4)\n"
+            "        }\n"
+            '        require(ptr + size <= end, "Obi: Out of range");\n'
+            f"        value.{_camel_case(name)} = {copy};\n"
+            "        ptr += size;\n"
+        )
+    ends_fixed = bool(run)
+    flush()
+    if ends_fixed:
+        body.append('        require(ptr <= end, "Obi: Out of range");\n')
+    body.append('        require(ptr == end, "DATA_DECODE_NOT_FINISHED");\n')
+
+    has_dynamic = any(kind in ("bytes", "string") for _, kind in fields)
+    copy_function = (
+        "\n"
+        "    /// @dev Copies size bytes at ptr a word at a time into a new bytes, allocated without\n"
+        "    /// zero-filling like Obi.decodeBytes, and zeroes the padding of the last word, which the\n"
+        "    /// copy may have filled with the bytes that follow.\n"
+        "    function _copy(uint256 ptr, uint256 size)\n"
+        "        private\n"
+        "        pure\n"
+        "        returns (bytes memory out)\n"
+        "    {\n"
+        "        // solium-disable-next-line security/no-inline-assembly\n"
+        "        assembly {\n"
+        "            out := mload(0x40)\n"
+        "            mstore(out, size)\n"
+        "            let dest := add(out, 32)\n"
+        "            for {\n"
+        "                let i := 0\n"
+        "            } lt(i, size) {\n"
+        "                i := add(i, 32)\n"
+        "            } {\n"
+        "                mstore(add(dest, i), mload(add(ptr, i)))\n"
+        "            }\n"
+        "            mstore(add(dest, size), 0)\n"
+        "            mstore(0x40, add(dest, and(add(size, 31), not(31))))\n"
+        "        }\n"
+        "    }\n"
+    ) if has_dynamic else ""
+    return (
+        "// SPDX-License-Identifier: Apache-2.0\n"
+        f"// Generated by example_utils_functions/obi_codegen.py from the OBI schema\n"
+        f"// {schema}. Do not edit; regenerate instead.\n"
+        "\n"
+        "pragma solidity ^0.8.14;\n"
+        "\n"
+        f"/// @title {library} library\n"
+        f"/// @notice Decodes OBI-encoded {struct_name} in one pass over the input\n"
+        f"library {library} {{\n"
+        f"    struct {struct_name} {{\n"
+        f"{members}"
+        "    }\n"
+        "\n"
+        f"    function decode(bytes memory raw)\n"
+        "        internal\n"
+        "        pure\n"
+        f"        returns ({struct_name} memory value)\n"
+        "    {\n"
+        "        uint256 ptr;\n"
+        "        uint256 end;\n"
+        + ("        uint256 size;\n" if has_dynamic else "")
+        + "        // solium-disable-next-line security/no-inline-assembly\n"
+        "        assembly {\n"
+        "            ptr := add(raw, 32)\n"
+        "            end := add(ptr, mload(raw))\n"
+        "        }\n"
+        f"{''.join(body)}"
+        "    }\n"
+        f"{copy_function}"
+        "}\n"
+    )
+
+
+# The Python module has the decoder obi.Codec would build for the schema, written out as source.
+def generate_python(module, struct_name, schema):
+    _fields(schema)
+    source, records, layouts = obi.decoder_source(obi.parse_schema(schema, struct_name))
+    definitions = "".join(
+        f"{name} = namedtuple({kind.record.__name__!r}, {list(kind.record._fields)!r})\n" for name, kind in records.items()
+    )
+    definitions += "".join(f"{name} = struct.Struct({layout!r}).unpack_from\n" for name, layout in layouts.items())
+    return (
+        f"# Generated by obi_codegen.py as {module} from the OBI schema\n"
+        f"# {schema}. Do not edit; regenerate instead.\n"
+        "import struct\n"
+        "from collections import namedtuple\n"
+        "\n"
+        f"{definitions}"
+        f"L = struct.Struct('>I').unpack_from\n"
+        "new = tuple.__new__\n"
+        "from_bytes = int.from_bytes\n"
+        "struct_error = struct.error\n"
+        "\n"
+        "\n"
+        f"{source}"
+        "\n"
+        "\n"
+        "def decode(data):\n"
+        "    view = data if type(data) is bytes else memoryview(data)\n"
+        "    value, offset = decode_from(view, 0)\n"
+        "    if offset != len(view):\n"
+        "        raise ValueError('DATA_DECODE_NOT_FINISHED')\n"
+        "    return value\n"
+    )
+
+
+GENERATED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "contracts", "obi", "generated")
+
+# The VRF schemas generated into contracts/obi/generated. VRFDecoderV1.decodeResult reads the proof
+# before the result, so that is the wire order of the V1 result.
+VRF_SCHEMAS = {
+    "ObiVRFParams": ("Params", "{seed:bytes,time:u64,task_worker:bytes}"),
+    "ObiVRFResultV1": ("Result", "{proof:bytes,result:bytes}"),
+    "ObiVRFResultV2": ("Result", "{result:bytes}"),
+}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5:
+        language, name, struct_name, schema = sys.argv[1:]
+        generate = {"solidity": generate_solidity, "python": generate_python}[language]
+        sys.stdout.write(generate(name, struct_name, schema))
+        sys.exit(0)
+    if sys.argv[1:] == ["vrf"]:
+        os.makedirs(GENERATED_DIR, exist_ok=True)
+        for library, (struct_name, schema) in VRF_SCHEMAS.items():
+            with open(os.path.join(GENERATED_DIR, f"{library}.sol"), "w") as f:
+                f.write(generate_solidity(library, struct_name, schema))
+        sys.exit(0)
+
+    # Without arguments, check the generated Python against obi.Codec.
+    price = "{symbol:string,multiplier:u64,what:u8}"
+    namespace = {}
+    exec(generate_python("price", "Price", price), namespace)
+    data = bytes.fromhex("00000003425443000000000000003264")
+    assert namespace["decode"](data) == obi.Codec(price).decode(data) == ("BTC", 50, 100)
+    assert namespace["decode_many"](data * 2) == [("BTC", 50, 100)] * 2
+    assert "require(ptr <= end" in generate_solidity("ObiPrice", "Price", price)
+    assert "require(ptr <= end" not in generate_solidity("ObiVRFParams", *VRF_SCHEMAS["ObiVRFParams"])
+    for schema in ["u64", "{a:{b:u8}}", "{a:bytes64}"]:
+        try:
+            generate_solidity("Obi", "Data", schema)
+            raise AssertionError("expected OBI_CODEGEN")
+        except ValueError as e:
+            assert e.args[0].startswith("OBI_CODEGEN")
@@ -0,0 +1,156 @@
+# Drops the signatures a relayBlock payload does not need. verifyBlockHeader only requires
+# sumVotingPower * 3 > totalValidatorPower * 2, but every signature sent costs calldata, a sha256,
+# an ecrecover and an EnumerableMap lookup.
+#
+# Signatures are kept greedily by voting power per unit of gas until the threshold plus a safety
+# margin is reached, then any kept signature the target can do without is dropped again. Calldata
+# is priced exactly from the encoded payloads; execution gas uses the per-signature estimate below.
+from collections import namedtuple
+
+import bridge
+import bridge_codec
+
+# Execution gas of one loop iteration of verifyBlockHeader: the ecrecover and sha256 precompiles
+# (3000 and 60 + 12 per word of a ~130 byte vote) called through staticcall, two cold SLOADs in
+# EnumerableMap.tryGet, and building the canonical vote in memory. An estimate, not a measurement.
+GAS_PER_SIGNATURE = 3000 + 120 + 2 * 2100 + 1000
+
+# abi.encode size of one TMSignature inside TMSignature[]: its offset word, r, s, v, the offset and
+# length of encodedTimestamp and the timestamp padded to a word.
+_SIGNATURE_WORDS = 7
+
+Report = namedtuple("Report", [
+    "kept",
+    "dropped",
+    "voting_power",
+    "target_power",
+    "calldata_bytes_saved",
+    "calldata_gas_saved",
+    "execution_gas_saved",
+])
+
+
+def calldata_gas(data):
+    zeros = data.count(0)
+    return 4 * zeros + 16 * (len(data) - zeros)
+
+
+def _signature_gas(signature):
+    words = [signature.r, signature.s, signature.v.to_bytes(32, "big"), signature.encoded_timestamp]
+    nonzero = sum(len(word) - word.count(0) for word in words)
+    return GAS_PER_SIGNATURE + 4 * 32 * _SIGNATURE_WORDS + 12 * nonzero
+
+
+# The smallest voting power that satisfies sumVotingPower * 3 > totalValidatorPower * 2, raised by
+# margin_bps basis points of the total power so the relay survives small validator set updates.
+def target_power(total_validator_power, margin_bps=0):
+    return total_validator_power * 2 // 3 + 1 + total_validator_power * margin_bps // 10000
+
+
+# Returns the signatures to relay, sorted by signer address as the contract requires. Signatures
+# that would not add power on-chain (bad timestamp, unrecoverable, unknown or repeated signer) are
+# always dropped. When even the margin cannot be met, every useful signature is kept.
+def select_signatures(
+    signatures,
+    common_encoded_part,
+    encoded_chain_id,
+    validator_powers,
+    total_validator_power,
+    margin_bps=0,
+):
+    usable = [signature for signature in signatures if 6 <= len(signature.encoded_timestamp) <= 12]
+    signers = bridge.recover_signers(usable, common_encoded_part, encoded_chain_id)
+    candidates = {}
+    for signer, signature in zip(signers, usable):
+        if validator_powers.get(signer, 0) > 0 and signer not in candidates:
+            candidates[signer] = signature
+
+    if not sum(validator_powers[signer] for signer in candidates) * 3 > total_validator_power * 2:
+        raise ValueError("INSUFFICIENT_VALIDATOR_SIGNATURES")
+    target = target_power(total_validator_power, margin_bps)
+
+    ranked = sorted(
+        candidates,
+        key=lambda signer: (-validator_powers[signer] / _signature_gas(candidates[signer]), signer),
+    )
+    kept = []
+    voting_power = 0
+    for signer in ranked:
+        if voting_power >= target:
+            break
+        kept.append(signer)
+        voting_power += validator_powers[signer]
+    # A late, large signer can make earlier small ones redundant.
+    for signer in sorted(kept, key=lambda signer: validator_powers[signer]):
+        if voting_power - validator_powers[signer] >= target:
+            kept.remove(signer)
+            voting_power -= validator_powers[signer]
+
+    return [candidates[signer] for signer in sorted(kept)], voting_power, target
+
+
+# Returns the payload (a bridge_codec RelayAndVerify, RelayAndMultiVerify or RelayAndVerifyCount)
+# with only the selected signatures, its encoding, and a Report of what was saved.
+def optimize_payload(payload, validator_powers, total_validator_power, encoded_chain_id, margin_bps=0):
+    relay_data = payload.relay_data
+    block_header = bridge.get_block_header(relay_data.merkle_parts, bridge.get_app_hash(relay_data.multi_store))
+    common_encoded_part = bridge.check_parts_and_encoded_common_parts(
+        relay_data.common_encoded_vote_part, block_header
+    )
+    signatures = list(relay_data.signatures)
+    kept, voting_power, target = select_signatures(
+        signatures, common_encoded_part, encoded_chain_id, validator_powers, total_validator_power, margin_bps
+    )
+
+    optimized = payload._replace(relay_data=relay_data._replace(signatures=kept))
+    before = bridge_codec.encode(payload)
+    after = bridge_codec.encode(optimized)
+    report = Report(
+        kept=len(kept),
+        dropped=len(signatures) - len(kept),
+        voting_power=voting_power,
+        target_power=target,
+        calldata_bytes_saved=len(before) - len(after),
+        calldata_gas_saved=calldata_gas(before) - calldata_gas(after),
+        execution_gas_saved=GAS_PER_SIGNATURE * (len(signatures) - len(kept)),
+    )
+    return optimized, after, report
+
+
+if __name__ == "__main__":
+    # Canonical vote and signatures from tests/bridge/test_tmsignature.py.
+    common_encoded_part = bytes.fromhex(
+        "08021184C002000000000022480A20"
+        "8c36c3d12a378bd7e4e8f26bdecca68b48390240da456ee9c3292b6e36756ac4"
+        "12240801122044551F853D916A7C630C0C210C921BAC7D05CE0C249DFC6088C0274F05841827"
+    )
+    encoded_chain_id = bytes.fromhex("321362616e642d6c616f7a692d746573746e657431")
+    signatures = [bridge.TMSignature(bytes.fromhex(r), bytes.fromhex(s), v, bytes.fromhex(t)) for r, s, v, t in [
+        ("6916405D52FF02EC26DD78E831E0A179C89B99CBBDB15C9DA802B75A7621D5EB",
+         "69CF40BE7AC1AA176B13BA4D57EB2B8735A5832014F0DC168EA6F580C51BB222", 28, "08DE9493850610F0FFAEEB02"),
+        ("6A8E3C35DEED991D257BCA9451360BFBE7978D388AF8D2F864A6919FE1083C7E",
+         "14D145DD6BC1A770ACBDF37DAC08DD8076AB888FDA2739BE9B9767B23A387D1E", 27, "08DE9493850610DAEB8D9C03"),
+        ("EB402F4B863A1DF91E7772D9574640EFFC5447ECEC6EDF6F1CFE2C33D7DC8DD4",
+         "1FEC45523E885DD6E8AD75EA2D81D30657267DF646406240F206A98749EBD0A7", 27, "08DE9493850610B68FD4E702"),
+    ]]
+    a, b, c = [bytes.fromhex(address) for address in [
+        "3b759C4d728e50D5cC04c75f596367829d5b5061",
+        "49897b9D617AD700b84a935616E81f9f4b5305bc",
+        "7054bd1Fd7535A0DD552361e634196b1574594BB",
+    ]]
+
+    def select(powers, total, margin_bps=0):
+        return select_signatures(signatures[::-1], common_encoded_part, encoded_chain_id, powers, total, margin_bps)
+
+    # 20 + 50 clears 2/3 of 100 and comes back in address order.
+    assert select({a: 20, b: 15, c: 50}, 100) == ([signatures[0], signatures[2]], 70, 67)
+    # A 5% margin needs all three.
+    assert select({a: 20, b: 15, c: 50}, 100, 500) == (signatures, 85, 72)
+    # c alone clears the threshold.
+    assert select({a: 40, b: 1, c: 70}, 100) == ([signatures[2]], 70, 67)
+    try:
+        select({a: 20, b: 15, c: 30}, 100)
+        raise AssertionError("expected INSUFFICIENT_VALIDATOR_SIGNATURES")
+    except ValueError as e:
+        assert e.args[0] == "INSUFFICIENT_VALIDATOR_SIGNATURES"
+    assert calldata_gas(b"\x00\x01\x00") == 24
@@ -1,3 +1,5 @@
+from keccak256 import digest as keccak256
+
 # https://en.bitcoin.it/wiki/Secp256k1
 _p = 115792089237316195423570985008687907853269984665640564039457584007908834671663
 _n = 115792089237316195423570985008687907852837564279074904382605163141518161494337
@@ -36,7 +38,7 @@ def ecc_double(a):
 
 
 # https://en.wikipedia.org/wiki/Elliptic_curve_point_multiplication
-def ecc_mul(point, scalar):
+def ecc_mul_affine(point, scalar):
     if scalar == 0 or scalar >= _p:
         raise ValueError("INVALID_SCALAR_OR_PRIVATEKEY")
     scalar_bin = str(bin(scalar))[2:]
@@ -48,6 +50,296 @@ def ecc_mul(point, scalar):
     return q
 
 
+# Jacobian coordinates represent the affine point (X / Z^2, Y / Z^3) as (X, Y, Z), so additions
+# and doublings need no modular inversion. A scalar multiplication only inverts Z once at the end.
+# https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian-0.html
+_jacobian_inf = (0, 1, 0)
+
+
+def to_jacobian(a):
+    return (a[0], a[1], 1)
+
+
+def from_jacobian(a):
+    if a[2] == 0:
+        raise ValueError("POINT_AT_INFINITY")
+    z_inv = inv_mod(a[2])
+    z_inv2 = (z_inv * z_inv) % _p
+    return ((a[0] * z_inv2) % _p, (a[1] * z_inv2 * z_inv) % _p)
+
+
+# https://en.wikipedia.org/wiki/Modular_multiplicative_inverse#Multiple_inverses
+# Montgomery's trick: inverts every value with a single inv_mod and 3 multiplications per value.
+def batch_inv_mod(values, n=_p):
+    prefix = [1] * (len(values) + 1)
+    for i, a in enumerate(values):
+        if a % n == 0:
+            raise ValueError("BATCH_INV_MOD_ERROR: cannot invert zero")
+        prefix[i + 1] = (prefix[i] * a) % n
+    inv = inv_mod(prefix[-1], n)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        result[i] = (inv * prefix[i]) % n
+        inv = (inv * values[i]) % n
+    return result
+
+
+def batch_from_jacobian(points):
+    z_invs = batch_inv_mod([a[2] for a in points])
+    result = []
+    for a, z_inv in zip(points, z_invs):
+        z_inv2 = (z_inv * z_inv) % _p
+        result.append(((a[0] * z_inv2) % _p, (a[1] * z_inv2 * z_inv) % _p))
+    return result
+
+
+# https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian-0.html#doubling-dbl-2009-l
+def jacobian_double(a):
+    x, y, z = a
+    if y == 0 or z == 0:
+        return _jacobian_inf
+    xx = (x * x) % _p
+    yy = (y * y) % _p
+    yyyy = (yy * yy) % _p
+    d = (2 * ((x + yy) * (x + yy) - xx - yyyy)) % _p
+    e = 3 * xx
+    x3 = (e * e - 2 * d) % _p
+    y3 = (e * (d - x3) - 8 * yyyy) % _p
+    z3 = (2 * y * z) % _p
+    return (x3, y3, z3)
+
+
+# https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian-0.html#addition-add-2007-bl
+# Falls back to the cheaper mixed addition (madd) when b is affine (Z = 1).
+def jacobian_add(a, b):
+    x1, y1, z1 = a
+    x2, y2, z2 = b
+    if z1 == 0:
+        return b
+    if z2 == 0:
+        return a
+    z1z1 = (z1 * z1) % _p
+    u2 = (x2 * z1z1) % _p
+    s2 = (y2 * z1 * z1z1) % _p
+    if z2 == 1:
+        u1, s1 = x1, y1
+    else:
+        z2z2 = (z2 * z2) % _p
+        u1 = (x1 * z2z2) % _p
+        s1 = (y1 * z2 * z2z2) % _p
+    h = (u2 - u1) % _p
+    r = (s2 - s1) % _p
+    if h == 0:
+        return jacobian_double(a) if r == 0 else _jacobian_inf
+    hh = (h * h) % _p
+    hhh = (h * hh) % _p
+    v = (u1 * hh) % _p
+    x3 = (r * r - hhh - 2 * v) % _p
+    y3 = (r * (v - x3) - s1 * hhh) % _p
+    z3 = (z1 * h) % _p if z2 == 1 else (z1 * z2 * h) % _p
+    return (x3, y3, z3)
+
+
+def jacobian_mul(point, scalar):
+    scalar_bin = str(bin(scalar))[2:]
+    q = point
+    for i in range(1, len(scalar_bin)):
+        q = jacobian_double(q)
+        if scalar_bin[i] == "1":
+            q = jacobian_add(q, point)
+    return q
+
+
+def ecc_mul(point, scalar):
+    if scalar == 0 or scalar >= _p:
+        raise ValueError("INVALID_SCALAR_OR_PRIVATEKEY")
+    return from_jacobian(jacobian_mul(to_jacobian(point), scalar))
+
+
+# Fixed-base windowed multiplication for the generator. Row i of the table holds
+# j * 2^(8i) * G for j in [1, 255] as affine points in Jacobian form (Z = 1), so multiplying by
+# G is at most 32 mixed additions and no doublings. The table is built on first use.
+_base_window = 8
+_base_table = None
+
+
+def _get_base_table():
+    global _base_table
+    if _base_table is None:
+        rows = []
+        base = to_jacobian(_g)
+        for _ in range(0, 256, _base_window):
+            row = [base]
+            for _ in range(2, 1 << _base_window):
+                row.append(jacobian_add(row[-1], base))
+            rows.append(row)
+            base = to_jacobian(from_jacobian(jacobian_add(row[-1], base)))
+        points = batch_from_jacobian([point for row in rows for point in row])
+        size = (1 << _base_window) - 1
+        _base_table = [
+            [to_jacobian(point) for point in points[i:i + size]]
+            for i in range(0, len(points), size)
+        ]
+    return _base_table
+
+
+def jacobian_mul_base(scalar):
+    table = _get_base_table()
+    mask = (1 << _base_window) - 1
+    q = _jacobian_inf
+    i = 0
+    while scalar:
+        digit = scalar & mask
+        if digit:
+            q = jacobian_add(q, table[i][digit - 1])
+        scalar >>= _base_window
+        i += 1
+    return q
+
+
+def ecc_mul_base(scalar):
+    if scalar == 0 or scalar >= _p:
+        raise ValueError("INVALID_SCALAR_OR_PRIVATEKEY")
+    return from_jacobian(jacobian_mul_base(scalar))
+
+
+def jacobian_neg(a):
+    return (a[0], -a[1] % _p, a[2])
+
+
+# https://en.wikipedia.org/wiki/Elliptic_curve_point_multiplication#w-ary_non-adjacent_form_(wNAF)_method
+# Digits are least significant first. Every non-zero digit is odd and lies in (-2^(w-1), 2^(w-1)).
+def _wnaf(k, w):
+    digits = []
+    while k:
+        if k & 1:
+            d = k & ((1 << w) - 1)
+            if d >= 1 << (w - 1):
+                d -= 1 << w
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+    return digits
+
+
+# Returns [P, 3P, 5P, ..., (2^(w-1) - 1)P] as affine points in Jacobian form for mixed additions.
+def _odd_multiples(point, w):
+    table = [to_jacobian(point)]
+    double = jacobian_double(table[0])
+    for _ in range(1, 1 << (w - 2)):
+        table.append(jacobian_add(double, table[-1]))
+    return [to_jacobian(a) for a in batch_from_jacobian(table)]
+
+
+_mul2_window = 5
+_g_window = 8
+_g_odd_multiples = None
+
+
+def _get_g_odd_multiples():
+    global _g_odd_multiples
+    if _g_odd_multiples is None:
+        _g_odd_multiples = _odd_multiples(_g, _g_window)
+    return _g_odd_multiples
+
+
+# https://en.wikipedia.org/wiki/Elliptic_curve_point_multiplication#Shamir's_trick
+# Strauss-Shamir interleaving: all wNAF expansions share a single chain of doublings.
+# terms is a list of (odd multiples table, wNAF digits) pairs.
+def jacobian_mul_multi(terms):
+    q = _jacobian_inf
+    for i in range(max(len(digits) for _, digits in terms) - 1, -1, -1):
+        q = jacobian_double(q)
+        for table, digits in terms:
+            if i < len(digits) and digits[i]:
+                d = digits[i]
+                if d > 0:
+                    q = jacobian_add(q, table[d >> 1])
+                else:
+                    q = jacobian_add(q, jacobian_neg(table[-d >> 1]))
+    return q
+
+
+# GLV endomorphism: lambda * (x, y) = (beta * x, y), where beta^3 = 1 mod _p and lambda^3 = 1 mod _n.
+# A scalar k splits into k1 + k2 * lambda with |k1|, |k2| < 2^128, so k * P = k1 * P + k2 * phi(P)
+# needs half the doublings when both halves are interleaved.
+# https://www.iacr.org/archive/crypto2001/21390189.pdf
+# https://github.com/bitcoin-core/secp256k1/blob/master/src/scalar_impl.h (secp256k1_scalar_split_lambda)
+_beta = int("7ae96a2b657c07106e64479eac3434e99cf0497512f58995c1396c28719501ee", 16)
+_lambda = int("5363ad4cc05c30e0a5261c028812645a122e22ea20816678df02967c1b23bd72", 16)
+_glv_a1 = int("3086d221a7d46bcde86c90e49284eb15", 16)
+_glv_b1 = -int("e4437ed6010e88286f547fa90abfe4c3", 16)
+_glv_a2 = int("114ca50f7a8e2f3f657c1108d9d44cfd8", 16)
+_glv_b2 = _glv_a1
+_g_endomorphism_odd_multiples = None
+
+
+def glv_decompose(k):
+    k %= _n
+    c1 = (_glv_b2 * k + _n // 2) // _n
+    c2 = (-_glv_b1 * k + _n // 2) // _n
+    k1 = k - c1 * _glv_a1 - c2 * _glv_a2
+    k2 = -c1 * _glv_b1 - c2 * _glv_b2
+    return k1, k2
+
+
+def jacobian_endomorphism(a):
+    return ((a[0] * _beta) % _p, a[1], a[2])
+
+
+def _signed_wnaf(k, w):
+    if k < 0:
+        return [-d for d in _wnaf(-k, w)]
+    return _wnaf(k, w)
+
+
+def _get_g_endomorphism_odd_multiples():
+    global _g_endomorphism_odd_multiples
+    if _g_endomorphism_odd_multiples is None:
+        _g_endomorphism_odd_multiples = [jacobian_endomorphism(a) for a in _get_g_odd_multiples()]
+    return _g_endomorphism_odd_multiples
+
+
+def _mul_terms(point, scalar, glv=False):
+    if point == _g:
+        table, w = _get_g_odd_multiples(), _g_window
+    else:
+        table, w = _odd_multiples(point, _mul2_window), _mul2_window
+    if not glv:
+        return [(table, _wnaf(scalar, w))]
+    k1, k2 = glv_decompose(scalar)
+    if point == _g:
+        endomorphism_table = _get_g_endomorphism_odd_multiples()
+    else:
+        endomorphism_table = [jacobian_endomorphism(a) for a in table]
+    return [(table, _signed_wnaf(k1, w)), (endomorphism_table, _signed_wnaf(k2, w))]
+
+
+def jacobian_mul2(P, a, Q, b, glv=True):
+    terms = [
+        term
+        for point, scalar in ((P, a), (Q, b)) if scalar
+        for term in _mul_terms(point, scalar, glv) if term[1]
+    ]
+    return jacobian_mul_multi(terms) if terms else _jacobian_inf
+
+
+# Returns a * P + b * Q. The GLV split is used unless glv is False.
+def ecc_mul2(P, a, Q, b, glv=True):
+    if not (0 <= a < _p and 0 <= b < _p) or a == b == 0:
+        raise ValueError("INVALID_SCALAR_OR_PRIVATEKEY")
+    return from_jacobian(jacobian_mul2(P, a, Q, b, glv))
+
+
+def ecc_mul_glv(point, scalar):
+    if scalar == 0 or scalar >= _p:
+        raise ValueError("INVALID_SCALAR_OR_PRIVATEKEY")
+    terms = [term for term in _mul_terms(point, scalar, True) if term[1]]
+    return from_jacobian(jacobian_mul_multi(terms) if terms else _jacobian_inf)
+
+
 # https://rosettacode.org/wiki/Cipolla%27s_algorithm#Python
 def to_base(n, b):
     if n < 2:
@@ -114,13 +406,142 @@ def ecrecover(_e: bytes, _r: bytes, _s: bytes, v):
 
     R = (x, y % _n)
     x_inv = inv_mod(x, _n)
-    gxh = ecc_mul(_g, -e % _n)
 
-    pub = ecc_mul(ecc_add(gxh, ecc_mul(R, s)), x_inv)
+    # pub = x_inv * (s * R - e * G) = (-e * x_inv) * G + (s * x_inv) * R
+    pub = ecc_mul2(_g, (-e * x_inv) % _n, R, (s * x_inv) % _n)
 
     return bytes.fromhex("%064x" % pub[0] + "%064x" % pub[1])
 
 
+# Since _p % 4 == 3 the square root is a single exponentiation. Checking the candidate by squaring
+# replaces the separate Euler criterion exponentiation done by ecc_sqrt.
+def _lift_x(x, v):
+    alpha = (x * x * x + x * _a + _b) % _p
+    y = pow(alpha, (_p + 1) // 4, _p)
+    if (y * y) % _p != alpha:
+        raise ValueError("ECRECOVER_ERROR: r is not a valid x coordinate")
+    if v == 27:
+        return y if y % 2 == 0 else -y % _p
+    elif v == 28:
+        return y if y % 2 == 1 else -y % _p
+    raise ValueError(f"ECRECOVER_ERROR: v must be 27 or 28 but got {v}")
+
+
+# Recovers every signature of a commit at once. The x_inv of all signatures and the final Z
+# inversions of all recovered points are each computed with one shared inversion.
+def batch_ecrecover(messages, rs, ss, vs):
+    if not len(messages) == len(rs) == len(ss) == len(vs):
+        raise ValueError("BATCH_ECRECOVER_ERROR: input lengths mismatch")
+    if not messages:
+        return []
+    xs = [int.from_bytes(_r, "big") % _n for _r in rs]
+    x_invs = batch_inv_mod(xs, _n)
+
+    points = []
+    for _e, _s, v, x, x_inv in zip(messages, ss, vs, xs, x_invs):
+        e = int.from_bytes(_e, "big")
+        s = int.from_bytes(_s, "big")
+        R = (x, _lift_x(x, v) % _n)
+        # pub = x_inv * (s * R - e * G) = (-e * x_inv) * G + (s * x_inv) * R
+        points.append(jacobian_mul2(_g, (-e * x_inv) % _n, R, (s * x_inv) % _n))
+
+    return [
+        bytes.fromhex("%064x" % pub[0] + "%064x" % pub[1])
+        for pub in batch_from_jacobian(points)
+    ]
+
+
+# https://ethereum.org/en/developers/docs/accounts/#account-creation
+def pubkey_to_address(pub: bytes):
+    return keccak256(pub)[-20:]
+
+
+def _pubkey_to_point(pub: bytes):
+    if len(pub) != 64:
+        raise ValueError(f"INVALID_PUBKEY: expected 64 bytes but got {len(pub)}")
+    x = int.from_bytes(pub[:32], "big")
+    y = int.from_bytes(pub[32:], "big")
+    if not (x < _p and y < _p) or (y * y - x * x * x - x * _a - _b) % _p != 0:
+        raise ValueError("INVALID_PUBKEY: point is not on the curve")
+    return (x, y)
+
+
+# Validators sign many blocks with the same key, so the odd multiples of each public key Q and of
+# phi(Q) are built once and kept for the lifetime of the process.
+_verify_window = 6
+_pubkey_tables = {}
+
+
+def _get_pubkey_tables(pub: bytes):
+    tables = _pubkey_tables.get(pub)
+    if tables is None:
+        table = _odd_multiples(_pubkey_to_point(pub), _verify_window)
+        tables = (table, [jacobian_endomorphism(a) for a in table])
+        _pubkey_tables[pub] = tables
+    return tables
+
+
+# https://en.wikipedia.org/wiki/Elliptic_Curve_Digital_Signature_Algorithm#Signature_verification_algorithm
+# Verifying against a known public key needs no square root and no recovery id. The x coordinate
+# of R = u1 * G + u2 * Q is compared in Jacobian form (X == r * Z^2), so the only inversion is s^-1.
+# With a recovery id v, the signature must also recover to Q through ecrecover, which lifts R from
+# x == r with the y parity of v: then x(R) must be r itself and R is made affine to check its y.
+def ecdsa_verify(pub: bytes, _e: bytes, _r: bytes, _s: bytes, s_inv=None, v=None):
+    e = int.from_bytes(_e, "big")
+    r = int.from_bytes(_r, "big")
+    s = int.from_bytes(_s, "big")
+    if not (0 < r < _n and 0 < s < _n):
+        return False
+    if s_inv is None:
+        s_inv = inv_mod(s, _n)
+
+    table, endomorphism_table = _get_pubkey_tables(pub)
+    terms = _mul_terms(_g, (e * s_inv) % _n, True) if e % _n else []
+    k1, k2 = glv_decompose((r * s_inv) % _n)
+    terms += [
+        (table, _signed_wnaf(k1, _verify_window)),
+        (endomorphism_table, _signed_wnaf(k2, _verify_window)),
+    ]
+    R = jacobian_mul_multi([term for term in terms if term[1]])
+    x, _, z = R
+    if z == 0:
+        return False
+    zz = (z * z) % _p
+    if v is not None:
+        return v in (27, 28) and x == (r * zz) % _p and from_jacobian(R)[1] % 2 == v - 27
+    # x(R) mod _n == r holds for x(R) == r or, when r + _n < _p, for x(R) == r + _n.
+    return x == (r * zz) % _p or (r + _n < _p and x == ((r + _n) * zz) % _p)
+
+
+def build_validator_registry(validators):
+    registry = {}
+    for pub, power in validators:
+        address = pubkey_to_address(pub)
+        if address in registry:
+            raise ValueError("DUPLICATION_IN_VALIDATOR_SET")
+        registry[address] = (pub, power)
+    return registry
+
+
+# Mirrors the power sum of Bridge.verifyBlockHeader for a commit whose signers are already known.
+# signatures is a list of (address, message hash, r, s, v) sorted by address as the contract
+# requires. A signature counts only if ecrecover with its v would return the registered key of its
+# address, and signers that are not in the registry add no power, just like a failed
+# validatorPowers.tryGet.
+def verify_commit(registry, signatures):
+    s_invs = batch_inv_mod([int.from_bytes(_s, "big") % _n or 1 for _, _, _, _s, _ in signatures], _n)
+    last_signer = bytes(20)
+    sum_voting_power = 0
+    for (address, _e, _r, _s, v), s_inv in zip(signatures, s_invs):
+        if not address > last_signer:
+            raise ValueError("INVALID_SIGNATURE_SIGNER_ORDER")
+        validator = registry.get(address)
+        if validator is not None and ecdsa_verify(validator[0], _e, _r, _s, s_inv, v):
+            sum_voting_power += validator[1]
+        last_signer = address
+    return sum_voting_power
+
+
 if __name__ == "__main__":
     assert ecrecover(
         bytes.fromhex(
@@ -131,3 +552,47 @@ if __name__ == "__main__":
             "aa4b0588903d649c20d4d924998cb8be13e1f4ffe7e11ad8f84f80a8b2771fc9"),
         27
     ).hex() == 'ba9231dbfdaa0c5c62c320402f9136ced720a585244c4daacfade4b15614c4dcd13fcc4241a5dbdb10865791e22a2c639ce5673ff6213c018f7a93808ab5b9b7'
+    assert batch_ecrecover(
+        [bytes.fromhex("45298f64c176ea53805cec6a6bff4bdd3fccb40250d62dc8f954aab6ef9037cb")] * 2,
+        [bytes.fromhex("10ce9c6360ed05342478a0ed2ec6d378adf5a1d437a2be3c8e89740b3cd3bff1")] * 2,
+        [bytes.fromhex("aa4b0588903d649c20d4d924998cb8be13e1f4ffe7e11ad8f84f80a8b2771fc9")] * 2,
+        [27, 28],
+    ) == [
+        ecrecover(
+            bytes.fromhex("45298f64c176ea53805cec6a6bff4bdd3fccb40250d62dc8f954aab6ef9037cb"),
+            bytes.fromhex("10ce9c6360ed05342478a0ed2ec6d378adf5a1d437a2be3c8e89740b3cd3bff1"),
+            bytes.fromhex("aa4b0588903d649c20d4d924998cb8be13e1f4ffe7e11ad8f84f80a8b2771fc9"),
+            v,
+        )
+        for v in (27, 28)
+    ]
+    for k in (1, 2, 3, 7, _n - 1, 0xdeadbeef, int("45298f64c176ea53805cec6a6bff4bdd3fccb40250d62dc8f954aab6ef9037cb", 16)):
+        assert ecc_mul(_g, k) == ecc_mul_affine(_g, k) == ecc_mul_base(k)
+        Q = ecc_mul_base(k)
+        assert ecc_mul2(_g, k, Q, _n - 2 * k % _n) == ecc_add(ecc_mul(_g, k), ecc_mul(Q, _n - 2 * k % _n))
+        assert ecc_mul2(_g, k, Q, _n - 2 * k % _n, glv=False) == ecc_mul2(_g, k, Q, _n - 2 * k % _n)
+    pub = ecrecover(
+        bytes.fromhex("45298f64c176ea53805cec6a6bff4bdd3fccb40250d62dc8f954aab6ef9037cb"),
+        bytes.fromhex("10ce9c6360ed05342478a0ed2ec6d378adf5a1d437a2be3c8e89740b3cd3bff1"),
+        bytes.fromhex("aa4b0588903d649c20d4d924998cb8be13e1f4ffe7e11ad8f84f80a8b2771fc9"),
+        27,
+    )
+    registry = build_validator_registry([(pub, 100)])
+    signature = (
+        pubkey_to_address(pub),
+        bytes.fromhex("45298f64c176ea53805cec6a6bff4bdd3fccb40250d62dc8f954aab6ef9037cb"),
+        bytes.fromhex("10ce9c6360ed05342478a0ed2ec6d378adf5a1d437a2be3c8e89740b3cd3bff1"),
+        bytes.fromhex("aa4b0588903d649c20d4d924998cb8be13e1f4ffe7e11ad8f84f80a8b2771fc9"),
+        27,
+    )
+    assert verify_commit(registry, [signature]) == 100
+    assert verify_commit(registry, [signature[:1] + (bytes(32),) + signature[2:]]) == 0
+    # With v = 28 ecrecover returns another key, and v outside 27 and 28 makes it fail.
+    for v in (28, 0, 29):
+        assert verify_commit(registry, [signature[:4] + (v,)]) == 0
+    assert ecc_mul_base(_lambda) == (_gx * _beta % _p, _gy)
+    for k in (1, 2, _lambda, _n - 1, _n - _lambda, _glv_a2, 2 ** 128, 2 ** 255 + 19):
+        k1, k2 = glv_decompose(k)
+        assert (k1 + k2 * _lambda) % _n == k % _n and abs(k1) < 2 ** 129 and abs(k2) < 2 ** 129
+        assert ecc_mul_glv(_g, k) == ecc_mul(_g, k)
+        assert ecc_mul_glv((_gx * _beta % _p, _gy), k) == ecc_mul((_gx * _beta % _p, _gy), k)
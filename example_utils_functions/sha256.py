@@ -1,4 +1,10 @@
 # https://gist.github.com/prokls/41e82472bd4968720d1482f81235e0ac
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # batch_digest falls back to the scalar path
+    np = None
 
 F32 = 0xFFFFFFFF
 
@@ -35,36 +41,33 @@ def _pad(msglen):
     return b'\x80' + (b'\x00' * padlen) + length
 
 
-def _rotr(x, y):
-    return ((x >> y) | (x << (32 - y))) & F32
-
-
-def _maj(x, y, z):
-    return (x & y) ^ (x & z) ^ (y & z)
-
+_block = struct.Struct('>16I')
 
-def _ch(x, y, z):
-    return (x & y) ^ ((~x) & z)
 
-
-def _compress(c, hh):
-    k = _k[:]
-    w = [0] * 64
-    w[0:16] = tuple([int.from_bytes(c[i*4:i*4+4], byteorder='big')
-                     for i in range(16)])
+# Works on any buffer (bytes, bytearray or memoryview) and reads the block at offset in place.
+# w is a caller-owned 64-word schedule that is overwritten, so hashing allocates nothing per block.
+# The rotations are inlined: (x >> n | x << (32 - n)) leaves junk above bit 31 that the final
+# & F32 of each sigma clears.
+def _compress(c, hh, offset=0, w=None):
+    if w is None:
+        w = [0] * 64
+    k = _k
+    w[0:16] = _block.unpack_from(c, offset)
 
     for i in range(16, 64):
-        s0 = _rotr(w[i-15], 7) ^ _rotr(w[i-15], 18) ^ (w[i-15] >> 3)
-        s1 = _rotr(w[i-2], 17) ^ _rotr(w[i-2], 19) ^ (w[i-2] >> 10)
+        x = w[i-15]
+        y = w[i-2]
+        s0 = ((x >> 7 | x << 25) ^ (x >> 18 | x << 14) ^ (x >> 3)) & F32
+        s1 = ((y >> 17 | y << 15) ^ (y >> 19 | y << 13) ^ (y >> 10)) & F32
         w[i] = (w[i-16] + s0 + w[i-7] + s1) & F32
 
     a, b, c, d, e, f, g, h = hh
 
     for i in range(64):
-        s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
-        t2 = s0 + _maj(a, b, c)
-        s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
-        t1 = h + s1 + _ch(e, f, g) + k[i] + w[i]
+        s0 = ((a >> 2 | a << 30) ^ (a >> 13 | a << 19) ^ (a >> 22 | a << 10)) & F32
+        t2 = s0 + ((a & b) ^ (a & c) ^ (b & c))
+        s1 = ((e >> 6 | e << 26) ^ (e >> 11 | e << 21) ^ (e >> 25 | e << 7)) & F32
+        t1 = h + s1 + ((e & f) ^ (~e & g)) + k[i] + w[i]
 
         h = g
         g = f
@@ -75,8 +78,14 @@ def _compress(c, hh):
         b = a
         a = (t1 + t2) & F32
 
-    for i, (x, y) in enumerate(zip(hh, [a, b, c, d, e, f, g, h])):
-        hh[i] = (x + y) & F32
+    hh[0] = (hh[0] + a) & F32
+    hh[1] = (hh[1] + b) & F32
+    hh[2] = (hh[2] + c) & F32
+    hh[3] = (hh[3] + d) & F32
+    hh[4] = (hh[4] + e) & F32
+    hh[5] = (hh[5] + f) & F32
+    hh[6] = (hh[6] + g) & F32
+    hh[7] = (hh[7] + h) & F32
 
     return hh
 
@@ -86,11 +95,20 @@ def update(counter, cache, m, h):
         return counter, cache, h
 
     counter += len(m)
-    m = cache + m
+    m = memoryview(m)
+    w = [0] * 64
+    i = 0
 
-    for i in range(0, len(m) // 64):
-        h = _compress(m[64 * i:64 * (i + 1)], h)
-    cache = m[-(len(m) % 64):]
+    if cache:
+        i = 64 - len(cache)
+        if len(m) < i:
+            return counter, cache + bytes(m), h
+        h = _compress(cache + bytes(m[:i]), h, 0, w)
+
+    while len(m) - i >= 64:
+        h = _compress(m, h, i, w)
+        i += 64
+    cache = bytes(m[i:])
 
     return counter, cache, h
 
@@ -101,5 +119,196 @@ def digest(_m):
     return b''.join([(i).to_bytes(4, byteorder='big') for i in h[:8]])
 
 
+def _rotr_lanes(x, y):
+    return (x >> np.uint32(y)) | (x << np.uint32(32 - y))
+
+
+# Same rounds as _compress, run over one block of N messages at once: every word is a uint32 array
+# with one lane per message, and NumPy's uint32 arithmetic wraps modulo 2^32 like the & F32 masks.
+def _compress_lanes(block, hh):
+    w = [block[:, i] for i in range(16)]
+    for i in range(16, 64):
+        s0 = _rotr_lanes(w[i-15], 7) ^ _rotr_lanes(w[i-15], 18) ^ (w[i-15] >> np.uint32(3))
+        s1 = _rotr_lanes(w[i-2], 17) ^ _rotr_lanes(w[i-2], 19) ^ (w[i-2] >> np.uint32(10))
+        w.append(w[i-16] + s0 + w[i-7] + s1)
+
+    a, b, c, d, e, f, g, h = hh
+
+    for i in range(64):
+        s0 = _rotr_lanes(a, 2) ^ _rotr_lanes(a, 13) ^ _rotr_lanes(a, 22)
+        t2 = s0 + ((a & b) ^ (a & c) ^ (b & c))
+        s1 = _rotr_lanes(e, 6) ^ _rotr_lanes(e, 11) ^ _rotr_lanes(e, 25)
+        t1 = h + s1 + ((e & f) ^ (~e & g)) + np.uint32(_k[i]) + w[i]
+
+        h = g
+        g = f
+        f = e
+        e = d + t1
+        d = c
+        c = b
+        b = a
+        a = t1 + t2
+
+    return [x + y for x, y in zip(hh, [a, b, c, d, e, f, g, h])]
+
+
+# Hashes many messages at once. Equal-length messages (e.g. Merkle inner nodes, IAVL nodes or votes
+# of the same size) share their padding and are compressed together in uint32 NumPy lanes; ragged
+# input, or a missing NumPy, uses digest for each message.
+def batch_digest(messages):
+    messages = list(messages)
+    if np is None or len(messages) < 2 or len({len(m) for m in messages}) != 1:
+        return [digest(m) for m in messages]
+
+    pad = _pad(len(messages[0]))
+    # join takes any buffer, where m + pad would fail for a memoryview.
+    data = np.frombuffer(b''.join([part for m in messages for part in (m, pad)]), dtype='>u4').astype(np.uint32)
+    blocks = data.reshape(len(messages), -1, 16)
+    hh = [np.full(len(messages), x, dtype=np.uint32) for x in _h]
+    for i in range(blocks.shape[1]):
+        hh = _compress_lanes(blocks[:, i, :], hh)
+
+    out = np.stack(hh, axis=1).astype('>u4').tobytes()
+    return [out[32 * i:32 * (i + 1)] for i in range(len(messages))]
+
+
+# hashlib-style incremental hasher. copy() forks the midstate, so a prefix shared by many messages
+# (e.g. the common encoded part of every validator's canonical vote) is compressed only once.
+class Sha256:
+    digest_size = 32
+    block_size = 64
+
+    def __init__(self, m=b''):
+        self._counter = 0
+        self._h = _h[:]
+        # Partial block waiting for more input and the message schedule, both reused by every block.
+        self._buffer = bytearray(64)
+        self._buffered = 0
+        self._w = [0] * 64
+        self.update(m)
+
+    def update(self, m):
+        m = memoryview(m)
+        size = len(m)
+        self._counter += size
+        i = 0
+
+        if self._buffered:
+            i = min(64 - self._buffered, size)
+            self._buffer[self._buffered:self._buffered + i] = m[:i]
+            self._buffered += i
+            if self._buffered < 64:
+                return
+            _compress(self._buffer, self._h, 0, self._w)
+            self._buffered = 0
+
+        while size - i >= 64:
+            _compress(m, self._h, i, self._w)
+            i += 64
+
+        self._buffer[:size - i] = m[i:]
+        self._buffered = size - i
+
+    def copy(self):
+        other = Sha256.__new__(Sha256)
+        other._counter = self._counter
+        other._h = self._h[:]
+        other._buffer = bytearray(self._buffer)
+        other._buffered = self._buffered
+        other._w = [0] * 64
+        return other
+
+    def digest(self):
+        tail = bytes(self._buffer[:self._buffered]) + _pad(self._counter)
+        h = self._h[:]
+        for i in range(0, len(tail), 64):
+            _compress(tail, h, i, self._w)
+        return b''.join([(i).to_bytes(4, byteorder='big') for i in h[:8]])
+
+    def hexdigest(self):
+        return self.digest().hex()
+
+
+# A backend is a hashlib-style constructor: backend(m) returns an object with update, copy and
+# digest. hashlib is preferred when the interpreter provides it; Sha256 is the pure-Python reference.
+_backends = {}
+
+
+def register_backend(name, constructor):
+    _backends[name] = constructor
+
+
+def backends():
+    return list(_backends)
+
+
+def get_backend(name=None):
+    if name is None:
+        name = "hashlib" if "hashlib" in _backends else "reference"
+    if name not in _backends:
+        raise ValueError(f"UNKNOWN_SHA256_BACKEND: {name}")
+    return _backends[name]
+
+
+def new(m=b'', backend=None):
+    return get_backend(backend)(m)
+
+
+register_backend("reference", Sha256)
+try:
+    from hashlib import sha256 as _hashlib_sha256
+    register_backend("hashlib", _hashlib_sha256)
+except ImportError:
+    pass
+
+
+# https://www.di-mgt.com.au/sha_testvectors.html
+_vectors = [
+    (b'', 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'),
+    (b'abc', 'ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad'),
+    (b'abcdbcdecdefdefgefghfghighijhijkijkljklmklmnlmnomnopnopq',
+     '248d6a61d20638b8e5c026930c3e6039a33ce45964ff2167f6ecedd419db06c1'),
+    (b'abcdefghbcdefghicdefghijdefghijkefghijklfghijklmghijklmnhijklmnoijklmnopjklmnopqklmnopqrlmnopqrsmnopqrstnopqrstu',
+     'cf5b16a778af8380036ce59e7b0492370b249b11e8f07a51afac45037afee9d1'),
+    (b'a' * 1000000, 'cdc76e5c9914fb9281a1c7e284d73e67f1809a48a497200e046d39ccc7112cd0'),
+]
+
+
+# Conformance check for a backend: the known vectors fed in uneven updates, with the state forked
+# by copy() halfway through, plus the short vectors in a single call.
+def check_backend(name=None):
+    constructor = get_backend(name)
+    for message, expected in _vectors:
+        if len(message) < 1000:
+            assert constructor(message).hexdigest() == expected, (name, message[:16])
+        half = len(message) // 2
+        h = constructor()
+        for i in range(0, half, 7919):
+            h.update(message[i:min(i + 7919, half)])
+        fork = h.copy()
+        for i in range(half, len(message), 7919):
+            h.update(message[i:i + 7919])
+            fork.update(memoryview(message)[i:i + 7919])
+        assert h.hexdigest() == fork.hexdigest() == expected, (name, message[:16])
+
+
 if __name__ == "__main__":
     assert digest(b'').hex() == 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'
+    assert digest(b'a' * 64).hex() == 'ffe054fe7ae0cb6dc65c3af9b61d5209f439851db43d0ba5997337df154668eb'
+    prefix = Sha256(b'a' * 100)
+    fork = prefix.copy()
+    fork.update(b'b' * 28)
+    prefix.update(b'c')
+    assert fork.digest() == digest(b'a' * 100 + b'b' * 28)
+    assert prefix.digest() == digest(b'a' * 100 + b'c')
+    for size in (0, 33, 64, 65, 119):
+        messages = [bytes([i]) * size for i in range(5)]
+        assert batch_digest(messages) == [digest(m) for m in messages]
+    assert batch_digest([b'', b'a' * 64]) == [digest(b''), digest(b'a' * 64)]
+    views = [memoryview(bytes([i]) * 65) for i in range(3)] + [bytearray(b'x' * 65)]
+    assert batch_digest(views) == [digest(bytes(m)) for m in views]
+    for name in backends():
+        check_backend(name)
+    for size in range(0, 300, 7):
+        message = bytes(range(size % 256)) * (size // 256 + 1)
+        assert digest(message) == new(message, "reference").digest() == new(message).digest()
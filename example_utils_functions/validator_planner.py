@@ -0,0 +1,139 @@
+# Plans Bridge.updateValidatorPowers calls that move the on-chain validator set to a target set.
+#
+# updateValidatorPowers applies a list of (address, power) changes, power 0 removing the validator,
+# and only checks expectedTotalPower once at the end. A large churn therefore has to be split over
+# several transactions, each one carrying the total power the set will have right after it. The
+# planner reads the current set page by page through getValidators, keeps only the entries that
+# actually change, and packs them in order into chunks whose estimated gas fits a budget.
+#
+# Removals go first, so the EnumerableMap never holds more entries than the larger of the current
+# and target sets, then power updates, then additions; each group is sorted by address so the
+# same sets always give the same plan.
+from collections import namedtuple
+
+# Gas estimates for EIP-2929 pricing, before refunds: block gas limits apply to the gas used before
+# the refunds of cleared slots are taken off. An estimate, not a measurement.
+GasModel = namedtuple("GasModel", ["base", "per_change", "remove", "update", "add"])
+DEFAULT_GAS_MODEL = GasModel(
+    # 21000 intrinsic, the hasRole, totalValidatorPower and final totalValidatorPower accesses,
+    # and the selector, offsets and array length in calldata.
+    base=31000,
+    # Calldata of one (address, uint256 power) tuple and the loop body.
+    per_change=900,
+    # tryGet, then EnumerableMap.remove: clearing the value, moving the last key into the freed
+    # index, popping the array and clearing the index.
+    remove=28000,
+    # tryGet and overwriting a warm non-zero value.
+    update=6000,
+    # tryGet of a missing key, then three new slots: the value, the array element and the index.
+    add=67000,
+)
+
+Chunk = namedtuple("Chunk", ["changes", "expected_total_power", "estimated_gas"])
+
+
+def _key(address):
+    return address.lower()
+
+
+# Reads the whole validator set as {lowercase address: power}, page_size entries per call.
+# get_validators is Bridge.getValidators or anything with its (offset, size) signature.
+def read_validators(get_validators, page_size=100):
+    validators = {}
+    offset = 0
+    while True:
+        page = get_validators(offset, page_size)
+        for address, power in page:
+            validators[_key(address)] = power
+        if len(page) < page_size:
+            return validators
+        offset += page_size
+
+
+# The changes that turn current into target, both {address: power}, ordered as described above.
+# A target power of 0 means the validator is not in the target set.
+def diff(current, target):
+    current = {_key(address): power for address, power in current.items()}
+    target_keys = [_key(address) for address in target]
+    if len(set(target_keys)) != len(target_keys):
+        raise ValueError("VALIDATOR_PLAN: duplicated address in target set")
+    target = {key: power for key, power in zip(target_keys, target.values()) if power > 0}
+
+    removals = [(address, 0) for address in sorted(current) if address not in target]
+    updates = [
+        (address, target[address])
+        for address in sorted(target)
+        if address in current and current[address] != target[address]
+    ]
+    additions = [(address, target[address]) for address in sorted(target) if address not in current]
+    return removals + updates + additions
+
+
+def _change_gas(change, current, gas_model):
+    address, power = change
+    if power == 0:
+        return gas_model.per_change + gas_model.remove
+    if address in current:
+        return gas_model.per_change + gas_model.update
+    return gas_model.per_change + gas_model.add
+
+
+# Splits the diff into chunks of at most gas_budget estimated gas each. Every chunk carries the
+# totalValidatorPower after it and the chain reaches the target total after the last one.
+def plan(current, target, gas_budget, gas_model=DEFAULT_GAS_MODEL):
+    current = {_key(address): power for address, power in current.items()}
+    total_power = sum(current.values())
+    chunks = []
+    changes = []
+    gas = gas_model.base
+    for change in diff(current, target):
+        change_gas = _change_gas(change, current, gas_model)
+        if gas_model.base + change_gas > gas_budget:
+            raise ValueError(f"VALIDATOR_PLAN: gas budget {gas_budget} cannot fit a single change")
+        if gas + change_gas > gas_budget:
+            chunks.append(Chunk(changes, total_power, gas))
+            changes = []
+            gas = gas_model.base
+        address, power = change
+        total_power += power - current.get(address, 0)
+        changes.append(change)
+        gas += change_gas
+    if changes:
+        chunks.append(Chunk(changes, total_power, gas))
+    return chunks
+
+
+if __name__ == "__main__":
+    a, b, c, d, e = [f"0x{i:040x}" for i in range(10, 15)]
+    current = {a: 100, b: 100, c: 100, d: 100}
+    target = {b: 100, c: 50, d: 0, e.upper().replace("0X", "0x"): 30}
+    assert diff(current, target) == [(a, 0), (d, 0), (c, 50), (e, 30)]
+    assert diff(current, current) == []
+
+    # Everything fits in one transaction.
+    (chunk,) = plan(current, target, 30_000_000)
+    assert chunk.changes == diff(current, target)
+    assert chunk.expected_total_power == 180
+    assert chunk.estimated_gas == 31000 + 4 * 900 + 2 * 28000 + 6000 + 67000
+
+    # The addition does not fit next to the rest, and the first chunk carries the running total.
+    chunks = plan(current, target, 100000)
+    assert [chunk.changes for chunk in chunks] == [[(a, 0), (d, 0), (c, 50)], [(e, 30)]]
+    assert [chunk.expected_total_power for chunk in chunks] == [150, 180]
+    assert [chunk.estimated_gas for chunk in chunks] == [95700, 98900]
+
+    # Pages shorter than page_size end the read.
+    validators = [(f"0x{i:040X}", i + 1) for i in range(250)]
+    pages = []
+
+    def get_validators(offset, size):
+        pages.append(offset)
+        return validators[offset:offset + size]
+
+    assert read_validators(get_validators) == {f"0x{i:040x}": i + 1 for i in range(250)}
+    assert pages == [0, 100, 200]
+    try:
+        plan(current, target, 50000)
+        raise AssertionError("expected VALIDATOR_PLAN")
+    except ValueError as error:
+        assert error.args[0].startswith("VALIDATOR_PLAN")
@@ -0,0 +1,486 @@
+# Indexes the events of a VRFProviderBaseV1 or VRFProviderBaseV2 into a local SQLite database, so
+# pending tasks, relays and fees are answered by indexed queries instead of one tasks(nonce) call
+# per nonce.
+#
+# The indexer only speaks JSON-RPC, through rpc(method, params) returning the call's result: for
+# instance http_rpc(url), or brownie's lambda method, params: web3.provider.make_request(method,
+# params)["result"]. Logs are fetched with eth_getLogs over block ranges that adapt like
+# vrf_tasks.read_tasks: the span doubles after a range comes back with few logs, and halves when the
+# node rejects a range (too many results, timeouts), which also caps later spans, or returns more
+# than max_logs. Each range is
+# written in one transaction together with a checkpoint, the range's last block number and hash.
+#
+# Before every range the latest checkpoint is checked against the node. When its hash has changed,
+# the indexer walks back its checkpoints to the newest one still on the chain and deletes every row
+# above it. RandomDataRelayed carries no nonce, so a relay is matched to its request by seed, which
+# getSeed derives from the nonce and is therefore unique.
+import json
+import sqlite3
+import urllib.request
+from collections import namedtuple
+from itertools import count
+
+from keccak256 import digest as keccak256
+
+Request = namedtuple("Request", [
+    "nonce",
+    "time",
+    "caller",
+    "block_hash",
+    "seed",
+    "chain_id",
+    "task_fee",
+    "client_seed",
+    "block_number",
+    "tx_hash",
+    "relay_block_number",
+])
+Relay = namedtuple("Relay", [
+    "block_number",
+    "log_index",
+    "seed",
+    "time",
+    "band_request_id",
+    "to",
+    "result_hash",
+    "client_seed",
+    "tx_hash",
+    "relayer",
+])
+
+_SETTINGS = {
+    "SetBridge(address)": "bridge",
+    "SetOracleScriptID(uint64)": "oracle_script_id",
+    "SetMinCount(uint8)": "min_count",
+    "SetAskCount(uint8)": "ask_count",
+    "SetMinimumFee(uint256)": "minimum_fee",
+}
+
+
+def _topic(signature):
+    return "0x" + keccak256(signature.encode()).hex()
+
+
+REQUESTED = _topic("RandomDataRequested(uint64,uint64,address,bytes32,bytes32,uint256,uint256,string)")
+RELAYED = _topic("RandomDataRelayed(uint64,uint64,address,bytes32,bytes32,string)")
+SETTING_TOPICS = {_topic(signature): name for signature, name in _SETTINGS.items()}
+
+# bytes32 values are stored as 0x-prefixed lowercase hex, addresses likewise. chain_id, task_fee and
+# the minimum_fee setting are uint256, beyond SQLite's 64-bit integers, so they are stored as
+# decimal text.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS checkpoints (block_number INTEGER PRIMARY KEY, block_hash TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS requests (
+    nonce INTEGER PRIMARY KEY,
+    time INTEGER NOT NULL,
+    caller TEXT NOT NULL,
+    block_hash TEXT NOT NULL,
+    seed TEXT NOT NULL UNIQUE,
+    chain_id TEXT NOT NULL,
+    task_fee TEXT NOT NULL,
+    client_seed TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    relay_block_number INTEGER
+);
+CREATE INDEX IF NOT EXISTS requests_pending ON requests (nonce) WHERE relay_block_number IS NULL;
+CREATE INDEX IF NOT EXISTS requests_caller ON requests (caller, nonce);
+CREATE INDEX IF NOT EXISTS requests_block ON requests (block_number);
+CREATE TABLE IF NOT EXISTS relays (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    seed TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    band_request_id INTEGER NOT NULL,
+    "to" TEXT NOT NULL,
+    result_hash TEXT NOT NULL,
+    client_seed TEXT NOT NULL,
+    tx_hash TEXT NOT NULL,
+    relayer TEXT,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS relays_seed ON relays (seed);
+CREATE INDEX IF NOT EXISTS relays_relayer ON relays (relayer, block_number);
+CREATE TABLE IF NOT EXISTS settings (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+"""
+
+
+# A JSON-RPC client over HTTP for the indexer, using only the standard library.
+def http_rpc(url, timeout=30):
+    ids = count()
+
+    def rpc(method, params):
+        body = json.dumps({"jsonrpc": "2.0", "id": next(ids), "method": method, "params": params})
+        request = urllib.request.Request(url, body.encode(), {"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            reply = json.load(response)
+        if "error" in reply:
+            raise ValueError(f"VRF_INDEXER: {method} failed: {reply['error'].get('message', reply['error'])}")
+        return reply["result"]
+
+    return rpc
+
+
+def _int(value):
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+def _hex(value):
+    return value.lower() if isinstance(value, str) else "0x" + bytes(value).hex()
+
+
+def _word(data, index):
+    return data[32 * index:32 * index + 32]
+
+
+def _uint(data, index):
+    return int.from_bytes(_word(data, index), "big")
+
+
+def _string(data, index):
+    offset = _uint(data, index)
+    length = int.from_bytes(data[offset:offset + 32], "big")
+    return data[offset + 32:offset + 32 + length].decode()
+
+
+def _address(word):
+    return "0x" + word[-20:].hex()
+
+
+# Splits one eth_getLogs entry into (table, row). Logs of other events are skipped.
+def decode_log(log):
+    topics = [_hex(topic) for topic in log["topics"]]
+    data = log["data"]
+    data = bytes.fromhex(data[2:]) if isinstance(data, str) else bytes(data)
+    block_number = _int(log["blockNumber"])
+    log_index = _int(log["logIndex"])
+    tx_hash = _hex(log["transactionHash"])
+    topic0 = topics[0] if topics else None
+    if topic0 == REQUESTED:
+        return "requests", Request(
+            nonce=_uint(data, 1),
+            time=_uint(data, 0),
+            caller=_address(bytes.fromhex(topics[1][2:])),
+            block_hash="0x" + _word(data, 2).hex(),
+            seed="0x" + _word(data, 3).hex(),
+            chain_id=str(_uint(data, 4)),
+            task_fee=str(_uint(data, 5)),
+            client_seed=_string(data, 6),
+            block_number=block_number,
+            tx_hash=tx_hash,
+            relay_block_number=None,
+        )
+    if topic0 == RELAYED:
+        return "relays", Relay(
+            block_number=block_number,
+            log_index=log_index,
+            seed="0x" + _word(data, 3).hex(),
+            time=_uint(data, 0),
+            band_request_id=_uint(data, 1),
+            to=_address(bytes.fromhex(topics[1][2:])),
+            result_hash="0x" + _word(data, 2).hex(),
+            client_seed=_string(data, 4),
+            tx_hash=tx_hash,
+            relayer=None,
+        )
+    if topic0 in SETTING_TOPICS:
+        name = SETTING_TOPICS[topic0]
+        value = _address(bytes.fromhex(topics[1][2:])) if name == "bridge" else str(_uint(data, 0))
+        return "settings", (block_number, log_index, name, value)
+    return None, None
+
+
+class Indexer:
+    # provider is the VRF provider's address and start_block the block it was deployed in. The
+    # database remembers both and refuses to be reused for another provider. Blocks less than
+    # confirmations deep are left for a later sync. Only the newest keep_checkpoints checkpoints are
+    # kept: a reorg deeper than the oldest of them re-indexes from start_block.
+    def __init__(
+        self,
+        path,
+        rpc,
+        provider,
+        start_block=0,
+        confirmations=12,
+        span=2000,
+        max_span=100000,
+        max_logs=5000,
+        keep_checkpoints=64,
+        relayers=True,
+    ):
+        self.rpc = rpc
+        self.provider = provider.lower()
+        self.confirmations = confirmations
+        self.span = span
+        self.ceiling = max_span
+        self.max_logs = max_logs
+        self.keep_checkpoints = keep_checkpoints
+        self.relayers = relayers
+        self.db = sqlite3.connect(path)
+        with self.db:
+            self.db.executescript(_SCHEMA)
+            self.db.execute("INSERT OR IGNORE INTO meta VALUES ('provider', ?)", (self.provider,))
+            self.db.execute("INSERT OR IGNORE INTO meta VALUES ('start_block', ?)", (str(start_block),))
+        stored = dict(self.db.execute("SELECT key, value FROM meta"))
+        if stored["provider"] != self.provider:
+            raise ValueError(f"VRF_INDEXER: database indexes provider {stored['provider']}, not {self.provider}")
+        self.start_block = int(stored["start_block"])
+
+    def close(self):
+        self.db.close()
+
+    def _block_hash(self, number):
+        block = self.rpc("eth_getBlockByNumber", [hex(number), False])
+        return None if block is None else _hex(block["hash"])
+
+    def _checkpoint(self):
+        return self.db.execute(
+            "SELECT block_number, block_hash FROM checkpoints ORDER BY block_number DESC LIMIT 1"
+        ).fetchone()
+
+    # The first block not indexed yet.
+    def next_block(self):
+        checkpoint = self._checkpoint()
+        return self.start_block if checkpoint is None else checkpoint[0] + 1
+
+    # Deletes every row above block_number, as if the chain had only been indexed up to it.
+    def rollback(self, block_number):
+        with self.db:
+            for table in ("requests", "relays", "settings", "checkpoints"):
+                self.db.execute(f"DELETE FROM {table} WHERE block_number > ?", (block_number,))
+            self.db.execute(
+                "UPDATE requests SET relay_block_number = NULL WHERE relay_block_number > ?", (block_number,)
+            )
+
+    # Rolls back to the newest checkpoint still on the chain. Returns the block rolled back to, or
+    # None when the latest checkpoint is intact.
+    def _handle_reorg(self):
+        checkpoints = self.db.execute(
+            "SELECT block_number, block_hash FROM checkpoints ORDER BY block_number DESC"
+        ).fetchall()
+        for i, (block_number, block_hash) in enumerate(checkpoints):
+            if self._block_hash(block_number) == block_hash:
+                if i == 0:
+                    return None
+                self.rollback(block_number)
+                return block_number
+        if checkpoints:
+            self.rollback(self.start_block - 1)
+            return self.start_block - 1
+        return None
+
+    def _get_logs(self, first, last):
+        return self.rpc("eth_getLogs", [{"address": self.provider, "fromBlock": hex(first), "toBlock": hex(last)}])
+
+    def _write(self, logs, last, last_hash):
+        rows = {"requests": [], "relays": [], "settings": []}
+        for log in sorted(logs, key=lambda log: (_int(log["blockNumber"]), _int(log["logIndex"]))):
+            if log.get("removed"):
+                continue
+            table, row = decode_log(log)
+            if table is not None:
+                rows[table].append(row)
+        if self.relayers and rows["relays"]:
+            senders = {}
+            for relay in rows["relays"]:
+                if relay.tx_hash not in senders:
+                    senders[relay.tx_hash] = _hex(self.rpc("eth_getTransactionByHash", [relay.tx_hash])["from"])
+            rows["relays"] = [relay._replace(relayer=senders[relay.tx_hash]) for relay in rows["relays"]]
+
+        # One transaction per range: requests before the relays that resolve them.
+        with self.db:
+            for table, record in (("requests", Request), ("relays", Relay)):
+                placeholders = ", ".join("?" * len(record._fields))
+                self.db.executemany(f"INSERT INTO {table} VALUES ({placeholders})", rows[table])
+            self.db.executemany(
+                "UPDATE requests SET relay_block_number = ? WHERE seed = ?",
+                [(relay.block_number, relay.seed) for relay in rows["relays"]],
+            )
+            self.db.executemany("INSERT INTO settings VALUES (?, ?, ?, ?)", rows["settings"])
+            self.db.execute("INSERT INTO checkpoints VALUES (?, ?)", (last, last_hash))
+            self.db.execute(
+                "DELETE FROM checkpoints WHERE block_number NOT IN "
+                "(SELECT block_number FROM checkpoints ORDER BY block_number DESC LIMIT ?)",
+                (self.keep_checkpoints,),
+            )
+        return sum(len(table_rows) for table_rows in rows.values())
+
+    # Indexes up to to_block, by default the node's head minus confirmations. Returns the number of
+    # requests, relays and settings written; logs of other events, such as Ownable's, are skipped.
+    def sync(self, to_block=None):
+        if to_block is None:
+            to_block = _int(self.rpc("eth_blockNumber", [])) - self.confirmations
+        written = 0
+        while True:
+            self._handle_reorg()
+            first = self.next_block()
+            if first > to_block:
+                return written
+            last = min(to_block, first + self.span - 1)
+            last_hash = self._block_hash(last)
+            if last_hash is None:
+                raise ValueError(f"VRF_INDEXER: block {last} is not on the node yet")
+            try:
+                logs = self._get_logs(first, last)
+            except Exception:
+                if last == first:
+                    raise
+                # As in vrf_tasks.read_tasks, later ranges stay under the one that failed.
+                self.span = self.ceiling = max(1, (last - first + 1) // 2)
+                continue
+            # A reorg while the logs were fetched: try the range again.
+            if self._block_hash(last) != last_hash:
+                continue
+            written += self._write(logs, last, last_hash)
+            if len(logs) > self.max_logs:
+                self.span = max(1, self.span // 2)
+            else:
+                self.span = min(self.ceiling, self.span * 2)
+
+    def pending_tasks(self, limit=-1):
+        return [
+            Request._make(row)
+            for row in self.db.execute(
+                "SELECT * FROM requests WHERE relay_block_number IS NULL ORDER BY nonce LIMIT ?", (limit,)
+            )
+        ]
+
+    def tasks_of(self, caller):
+        return [
+            Request._make(row)
+            for row in self.db.execute("SELECT * FROM requests WHERE caller = ? ORDER BY nonce", (caller.lower(),))
+        ]
+
+    def relays_by(self, relayer):
+        return [
+            Relay._make(row)
+            for row in self.db.execute(
+                "SELECT * FROM relays WHERE relayer = ? ORDER BY block_number, log_index", (relayer.lower(),)
+            )
+        ]
+
+    # The latest value of every setting event seen, as {name: value}.
+    def settings(self):
+        return dict(
+            self.db.execute(
+                "SELECT name, value FROM settings ORDER BY block_number, log_index"
+            )
+        )
+
+
+if __name__ == "__main__":
+    import hashlib
+    import os
+    import tempfile
+
+    # A fake node with one log per request and relay, whose chain can be forked.
+    provider = "0x" + "ab" * 20
+    caller = "0x" + "11" * 20
+    worker = "0x" + "22" * 20
+
+    def words(*values):
+        return b"".join(
+            value.to_bytes(32, "big") if isinstance(value, int) else value.rjust(32, b"\x00") for value in values
+        )
+
+    def string(text):
+        raw = text.encode()
+        return words(len(raw)) + raw.ljust((len(raw) + 31) // 32 * 32, b"\x00")
+
+    def seed_of(nonce):
+        return hashlib.sha256(b"seed %d" % nonce).digest()
+
+    def requested(nonce, fee):
+        data = words(1000 + nonce, nonce, b"\x01" * 32, seed_of(nonce), 112, fee, 7 * 32) + string(f"client {nonce}")
+        return [REQUESTED, "0x" + bytes(12).hex() + caller[2:]], data
+
+    def relayed(nonce):
+        data = words(1000 + nonce, 500 + nonce, b"\x02" * 32, seed_of(nonce), 5 * 32) + string(f"client {nonce}")
+        return [RELAYED, "0x" + bytes(12).hex() + caller[2:]], data
+
+    class Chain:
+        def __init__(self):
+            self.blocks = []
+            self.calls = []
+
+        def mine(self, events=(), fork=""):
+            number = len(self.blocks)
+            self.blocks.append((hashlib.sha256(b"%d%s" % (number, fork.encode())).hexdigest(), list(events)))
+
+        def rpc(self, method, params):
+            self.calls.append(method)
+            if method == "eth_blockNumber":
+                return hex(len(self.blocks) - 1)
+            if method == "eth_getBlockByNumber":
+                number = int(params[0], 16)
+                return {"hash": "0x" + self.blocks[number][0]} if number < len(self.blocks) else None
+            if method == "eth_getTransactionByHash":
+                return {"from": worker}
+            if method == "eth_getLogs":
+                first, last = int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16)
+                if last - first >= 8:
+                    raise ValueError("range too large")
+                return [
+                    {
+                        "blockNumber": hex(number),
+                        "logIndex": hex(i),
+                        "transactionHash": "0x" + hashlib.sha256(b"%d %d" % (number, i)).hexdigest(),
+                        "topics": topics,
+                        "data": "0x" + data.hex(),
+                    }
+                    for number in range(first, last + 1)
+                    for i, (topics, data) in enumerate(self.blocks[number][1])
+                ]
+            raise AssertionError(method)
+
+    chain = Chain()
+    # The deploy block also holds an event the indexer does not store, like Ownable's OwnershipTransferred.
+    chain.mine([
+        ([_topic("OwnershipTransferred(address,address)")], b""),
+        ([_topic("SetMinimumFee(uint256)")], words(10**14)),
+    ])
+    for nonce in range(20):
+        chain.mine([requested(nonce, 10**15 + nonce)] + ([relayed(nonce - 1)] if nonce % 2 else []))
+
+    indexer = Indexer(":memory:", chain.rpc, provider, confirmations=0, span=4)
+    assert indexer.sync() == 31
+    assert [task.nonce for task in indexer.pending_tasks()] == [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+    assert indexer.pending_tasks(limit=1)[0].task_fee == str(10**15 + 1)
+    assert indexer.pending_tasks()[0].client_seed == "client 1"
+    assert len(indexer.tasks_of(caller.upper().replace("0X", "0x"))) == 20
+    assert [relay.band_request_id for relay in indexer.relays_by(worker)] == [500 + n for n in range(0, 19, 2)]
+    assert indexer.settings() == {"minimum_fee": str(10**14)}
+    # The span grew past the node's limit of 8 blocks and came back down.
+    assert indexer.span <= 8
+
+    # Blocks 15 and above are replaced: nonce 13 is now relayed, and nonces 14 to 19 never happened.
+    del chain.blocks[15:]
+    chain.mine([relayed(13)], fork="b")
+    for _ in range(3):
+        chain.mine(fork="b")
+    indexer.sync()
+    assert [task.nonce for task in indexer.pending_tasks()] == [1, 3, 5, 7, 9, 11]
+    assert indexer.next_block() == len(chain.blocks)
+    assert indexer.db.execute("SELECT COUNT(*) FROM requests").fetchone()[0] == 14
+
+    # Nothing new: one reorg check and nothing else.
+    chain.calls.clear()
+    assert indexer.sync() == 0
+    assert chain.calls == ["eth_blockNumber", "eth_getBlockByNumber"]
+
+    # A database belongs to one provider.
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "vrf.sqlite")
+        Indexer(path, chain.rpc, provider).close()
+        try:
+            Indexer(path, chain.rpc, "0x" + "cd" * 20)
+            raise AssertionError("expected VRF_INDEXER")
+        except ValueError as error:
+            assert error.args[0].startswith("VRF_INDEXER")
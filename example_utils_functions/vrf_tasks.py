@@ -0,0 +1,135 @@
+# Reads every VRF task, nonces 0 to taskNonce - 1, through VRFLensV1.getTasksBulk or
+# VRFLensV2.getTasksBulk.
+#
+# One eth_call per batch of nonces. The batch size adapts: it doubles after a call succeeds, and a
+# call that fails (typically on the node's eth_call gas cap) is split in half and retried, until a
+# single nonce fails on its own and the error is raised. A failure also caps later batches at half
+# the failed size, so the reader settles instead of failing every other call. Up to `workers` calls
+# run at once, and tasks are yielded in nonce order as soon as every earlier nonce has been read.
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# VRFProviderBaseV1.Task and VRFProviderBaseV2.Task, in Solidity field order.
+TaskV1 = namedtuple("TaskV1", [
+    "is_resolved",
+    "time",
+    "caller",
+    "task_fee",
+    "seed",
+    "client_seed",
+    "proof",
+    "result",
+])
+TaskV2 = namedtuple("TaskV2", [
+    "is_resolved",
+    "time",
+    "caller",
+    "task_fee",
+    "seed",
+    "result",
+    "client_seed",
+])
+_TASK_TYPES = {len(TaskV1._fields): TaskV1, len(TaskV2._fields): TaskV2}
+
+
+def decode_task(raw):
+    task_type = _TASK_TYPES.get(len(raw))
+    if task_type is None:
+        raise ValueError(f"VRF_TASKS: a task has {len(TaskV1._fields)} or {len(TaskV2._fields)} fields, not {len(raw)}")
+    return task_type._make(raw)
+
+
+# Yields (nonce, task) for nonce in [start, task_nonce). get_tasks_bulk is the lens's getTasksBulk
+# or anything taking a list of nonces and returning their tasks; errors lists the exceptions that
+# mean "batch too large" rather than a bug.
+def read_tasks(
+    get_tasks_bulk,
+    task_nonce,
+    start=0,
+    batch=64,
+    max_batch=1024,
+    workers=4,
+    errors=(Exception,),
+):
+    retries = []
+    next_nonce = start
+    running = {}
+    done = {}
+    emitted = start
+    ceiling = max_batch
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while emitted < task_nonce:
+            while len(running) < workers and (retries or next_nonce < task_nonce):
+                if retries:
+                    first, last = retries.pop()
+                    # A range queued before a later failure lowered the ceiling is cut down first.
+                    if last - first > ceiling:
+                        retries.append((first + ceiling, last))
+                        last = first + ceiling
+                else:
+                    first, last = next_nonce, min(next_nonce + batch, task_nonce)
+                    next_nonce = last
+                running[executor.submit(get_tasks_bulk, list(range(first, last)))] = (first, last)
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                first, last = running.pop(future)
+                try:
+                    tasks = future.result()
+                except errors:
+                    if last - first == 1:
+                        raise
+                    middle = (first + last) // 2
+                    # Popped from the end: the lower half is retried first.
+                    retries += [(middle, last), (first, middle)]
+                    ceiling = min(ceiling, middle - first)
+                    batch = min(batch, ceiling)
+                    continue
+                if len(tasks) != last - first:
+                    raise ValueError(f"VRF_TASKS: asked for {last - first} tasks but got {len(tasks)}")
+                done[first] = (last, tasks)
+                batch = min(ceiling, batch * 2)
+
+            while emitted in done:
+                last, tasks = done.pop(emitted)
+                for nonce, raw in zip(range(emitted, last), tasks):
+                    yield nonce, decode_task(raw)
+                emitted = last
+
+
+if __name__ == "__main__":
+    import threading
+
+    # A fake lens whose calls fail above 100 nonces.
+    def fake_task(nonce):
+        return (nonce % 2 == 0, 1000 + nonce, "0x" + "11" * 20, 10**14, bytes([nonce % 256]) * 32, bytes(32), f"seed {nonce}")
+
+    calls = []
+    lock = threading.Lock()
+
+    def get_tasks_bulk(nonces):
+        with lock:
+            calls.append(len(nonces))
+        if len(nonces) > 100:
+            raise RuntimeError("out of gas")
+        return [fake_task(nonce) for nonce in nonces]
+
+    tasks = list(read_tasks(get_tasks_bulk, 5000, batch=16, workers=3))
+    assert [nonce for nonce, _ in tasks] == list(range(5000))
+    assert all(task == TaskV2._make(fake_task(nonce)) for nonce, task in tasks)
+    # It grew past 100, failed once per worker at most, and settled below it.
+    assert max(calls) > 100 and sum(size > 100 for size in calls) <= 6
+
+    assert list(read_tasks(get_tasks_bulk, 10, start=7)) == [(n, TaskV2._make(fake_task(n))) for n in (7, 8, 9)]
+    assert list(read_tasks(get_tasks_bulk, 0)) == []
+    assert decode_task(tuple(range(8))).result == 7
+
+    def broken(nonces):
+        raise RuntimeError("node down")
+
+    try:
+        list(read_tasks(broken, 10, workers=1))
+        raise AssertionError("expected the error of a single-nonce call")
+    except RuntimeError as error:
+        assert error.args[0] == "node down"
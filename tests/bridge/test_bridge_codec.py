@@ -0,0 +1,53 @@
+import pytest
+import bridge_codec
+
+
+def test_bridge_codec_relay_and_verify_round_trip(valid_proof):
+    payload = bridge_codec.decode_relay_and_verify(valid_proof)
+    assert bridge_codec.encode(payload).hex() == valid_proof.lower()
+    assert payload.verify_data.result.resolve_status == 1
+    assert len(payload.relay_data.multi_store.oracle_iavl_state_hash) == 32
+
+
+def test_bridge_codec_relay_and_verify_count_round_trip(valid_count_proof):
+    payload = bridge_codec.decode_relay_and_verify_count(valid_count_proof)
+    assert bridge_codec.encode(payload).hex() == valid_count_proof.lower()
+    assert payload.verify_data.count == 15246756
+
+
+def test_bridge_codec_relay_and_multi_verify_round_trip(valid_multi_proof, expected_multi_relay_result):
+    payload = bridge_codec.decode_relay_and_multi_verify(valid_multi_proof)
+    assert bridge_codec.encode(payload).hex() == valid_multi_proof.lower()
+    assert payload.relay_data.merkle_parts.height == 13135707
+    results = [verify_data.result for verify_data in payload.verify_data]
+    assert [
+        [
+            result.client_id,
+            result.oracle_script_id,
+            "0x" + result.params.hex(),
+            result.ask_count,
+            result.min_count,
+            result.request_id,
+            result.ans_count,
+            result.request_time,
+            result.resolve_time,
+            result.resolve_status,
+            "0x" + result.result.hex(),
+        ]
+        for result in results
+    ] == expected_multi_relay_result
+
+
+def test_bridge_codec_encode_modified_payload(valid_proof):
+    payload = bridge_codec.decode_relay_and_verify(valid_proof)
+    relay_data = payload.relay_data
+    signatures = list(relay_data.signatures)[1:]
+    shorter = payload._replace(relay_data=relay_data._replace(signatures=signatures))
+    decoded = bridge_codec.decode_relay_and_verify(bridge_codec.encode(shorter))
+    assert list(decoded.relay_data.signatures) == signatures
+    assert decoded.verify_data == payload.verify_data
+
+
+def test_bridge_codec_decode_fail_invalid_proof(invalid_proof):
+    with pytest.raises(ValueError):
+        bridge_codec.decode_relay_and_verify(invalid_proof)
@@ -0,0 +1,206 @@
+import hashlib
+
+import pytest
+from brownie import accounts, MockBridge, MockResultCodec
+
+import bridge
+import bridge_codec
+import secp256k1
+
+ENCODED_CHAIN_ID = bytes.fromhex("321362616e642d6c616f7a692d746573746e657431")
+SIGNED_DATA_PREFIX = bytes.fromhex("08021184C002000000000022480A20")
+SIGNED_DATA_SUFFIX = bytes.fromhex("12240801122044551F853D916A7C630C0C210C921BAC7D05CE0C249DFC6088C0274F05841827")
+ENCODED_TIMESTAMP = bytes.fromhex("08DE9493850610F0FFAEEB02")
+HEIGHT = 180356
+VERSION = 180300
+
+SIGNATURE_COUNTS = [4, 16, 64]
+PATH_DEPTHS = [4, 12, 20]
+RESULT_SIZES = [0, 256, 2048]
+
+
+def _hash(data):
+    return hashlib.sha256(data).digest()
+
+
+# Deterministic validator keys, sorted by address as verifyBlockHeader requires.
+VALIDATOR_KEYS = sorted(
+    (
+        secp256k1.pubkey_to_address(b"".join(c.to_bytes(32, "big") for c in secp256k1.ecc_mul_base(priv))),
+        priv,
+    )
+    for priv in (int.from_bytes(_hash(b"gas validator %d" % i), "big") % secp256k1._n for i in range(max(SIGNATURE_COUNTS)))
+)
+
+
+def _sign(priv, message):
+    e = int.from_bytes(message, "big")
+    k = int.from_bytes(_hash(priv.to_bytes(32, "big") + message), "big") % secp256k1._n
+    x, y = secp256k1.ecc_mul_base(k)
+    r = x % secp256k1._n
+    s = secp256k1.inv_mod(k, secp256k1._n) * (e + r * priv) % secp256k1._n
+    return r.to_bytes(32, "big"), s.to_bytes(32, "big"), 27 + y % 2
+
+
+def build_relay_data(validator_count, oracle_root):
+    multi_store = bridge_codec.MultiStore(oracle_root, *[_hash(b"store %d" % i) for i in range(5)])
+    merkle_parts = bridge_codec.BlockHeaderMerkleParts(
+        _hash(b"version"), HEIGHT, 1621412443, 922160838, *[_hash(b"part %d" % i) for i in range(4)]
+    )
+    common_vote = bridge_codec.CommonEncodedVotePart(SIGNED_DATA_PREFIX, SIGNED_DATA_SUFFIX)
+    block_hash = bridge.get_block_header(merkle_parts, bridge.get_app_hash(multi_store))
+    vote = bridge.check_parts_and_encoded_common_parts(common_vote, block_hash)
+    vote += bytes([42, len(ENCODED_TIMESTAMP)]) + ENCODED_TIMESTAMP + ENCODED_CHAIN_ID
+    message = _hash(bytes([len(vote)]) + vote)
+    signatures = [
+        bridge_codec.TMSignature(*_sign(priv, message), ENCODED_TIMESTAMP)
+        for _, priv in VALIDATOR_KEYS[:validator_count]
+    ]
+    # Fail here, not inside a transaction, if the synthetic commit is malformed.
+    validator_powers = {address: 1 for address, _ in VALIDATOR_KEYS[:validator_count]}
+    assert bridge.verify_block_header(
+        multi_store, merkle_parts, common_vote, signatures, validator_powers, validator_count, ENCODED_CHAIN_ID
+    ) == oracle_root
+    return bridge_codec.RelayData(multi_store, merkle_parts, common_vote, signatures)
+
+
+def build_result(request_id, result_size):
+    return bridge_codec.Result(
+        "gas", 1, bytes(range(32)), 16, 10, request_id, 16, 1621412440, 1621412443, 1, bytes([7]) * result_size
+    )
+
+
+def build_merkle_paths(leaf_hash, depth):
+    merkle_paths = []
+    merkle_hash = leaf_hash
+    for height in range(1, depth + 1):
+        merkle_path = bridge_codec.IAVLMerklePath(
+            height % 2 == 0, height, 1 << height, VERSION + height, _hash(b"sibling %d" % height)
+        )
+        merkle_hash = bridge.get_parent_hash(merkle_path, merkle_hash)
+        merkle_paths.append(merkle_path)
+    return merkle_hash, merkle_paths
+
+
+def _args(record):
+    return [_args(value) if isinstance(value, bridge_codec.Record) else value for value in record]
+
+
+@pytest.fixture(scope="module")
+def resultcodec():
+    return accounts[0].deploy(MockResultCodec)
+
+
+@pytest.fixture(scope="module")
+def oracle_proof(resultcodec):
+    # Returns (oracle root, verify data) for a result of the given size under a path of the given depth.
+    def build(depth, result_size, request_id=1):
+        result = build_result(request_id, result_size)
+        data_hash = _hash(bytes(resultcodec.encode(_args(result))))
+        leaf_hash = bridge.get_leaf_hash(VERSION, bridge.request_key(request_id), data_hash)
+        root, merkle_paths = build_merkle_paths(leaf_hash, depth)
+        return root, bridge_codec.VerifyData(HEIGHT, result, VERSION, merkle_paths)
+
+    return build
+
+
+def _deploy_bridge(validator_count):
+    validators = [["0x" + address.hex(), 1] for address, _ in VALIDATOR_KEYS[:validator_count]]
+    return accounts[0].deploy(MockBridge, validators, ENCODED_CHAIN_ID)
+
+
+@pytest.mark.parametrize("signatures", SIGNATURE_COUNTS)
+def test_bridge_gas_relay_block(gas_table, signatures):
+    relay_data = build_relay_data(signatures, _hash(b"oracle root"))
+    bridge_contract = _deploy_bridge(signatures)
+    tx = bridge_contract.relayBlock(*_args(relay_data), {"from": accounts[0]})
+    assert bridge_contract.blockDetails(HEIGHT)[0] == "0x" + _hash(b"oracle root").hex()
+    gas_table.record(f"relayBlock/signatures={signatures}", tx.gas_used)
+
+
+@pytest.mark.parametrize("depth", PATH_DEPTHS)
+@pytest.mark.parametrize("result_size", RESULT_SIZES)
+def test_bridge_gas_verify_oracle_data(gas_table, oracle_proof, depth, result_size):
+    root, verify_data = oracle_proof(depth, result_size)
+    bridge_contract = _deploy_bridge(4)
+    bridge_contract.setOracleState(HEIGHT, root)
+    args = [HEIGHT, _args(verify_data.result), VERSION, _args(verify_data)[3]]
+    assert bridge_contract.verifyOracleData(*args)[5] == 1
+    gas_table.record(
+        f"verifyOracleData/depth={depth}/result_size={result_size}", bridge_contract.verifyOracleData.estimate_gas(*args)
+    )
+
+
+# The IAVL part of the recorded fixture proof, checked against the oracle root it carries.
+def test_bridge_gas_verify_oracle_data_fixture(gas_table, valid_proof):
+    payload = bridge_codec.decode_relay_and_verify(valid_proof)
+    verify_data = payload.verify_data
+    bridge_contract = _deploy_bridge(4)
+    bridge_contract.setOracleState(verify_data.block_height, payload.relay_data.multi_store.oracle_iavl_state_hash)
+    args = [verify_data.block_height, _args(verify_data.result), verify_data.version, _args(verify_data)[3]]
+    assert bridge_contract.verifyOracleData(*args)[5] == verify_data.result.request_id
+    gas_table.record("verifyOracleData/fixture=valid_proof", bridge_contract.verifyOracleData.estimate_gas(*args))
+
+
+@pytest.mark.parametrize("signatures", SIGNATURE_COUNTS)
+def test_bridge_gas_verify_oracle_result(gas_table, oracle_proof, signatures):
+    root, verify_data = oracle_proof(12, 256)
+    data = bridge_codec.encode(bridge_codec.RelayAndVerify(build_relay_data(signatures, root), verify_data))
+    bridge_contract = _deploy_bridge(signatures)
+    assert bridge_contract.verifyOracleResult(data)[5] == 1
+    gas_table.record(f"verifyOracleResult/signatures={signatures}", bridge_contract.verifyOracleResult.estimate_gas(data))
+
+
+@pytest.mark.parametrize("signatures", SIGNATURE_COUNTS)
+def test_bridge_gas_relay_and_verify(gas_table, oracle_proof, signatures):
+    root, verify_data = oracle_proof(12, 256)
+    data = bridge_codec.encode(bridge_codec.RelayAndVerify(build_relay_data(signatures, root), verify_data))
+    bridge_contract = _deploy_bridge(signatures)
+    tx = bridge_contract.relayAndVerify(data, {"from": accounts[0]})
+    assert tx.return_value[5] == 1
+    gas_table.record(f"relayAndVerify/signatures={signatures}", tx.gas_used)
+
+
+@pytest.mark.parametrize("results", [1, 4, 16])
+def test_bridge_gas_relay_and_multi_verify(gas_table, resultcodec, results):
+    # Every result sits in its own leaf of a balanced tree, so all proofs share one oracle root.
+    leaves = []
+    for request_id in range(1, results + 1):
+        result = build_result(request_id, 256)
+        data_hash = _hash(bytes(resultcodec.encode(_args(result))))
+        leaves.append((result, bridge.get_leaf_hash(VERSION, bridge.request_key(request_id), data_hash), []))
+    nodes = [(leaf_hash, [i]) for i, (_, leaf_hash, _) in enumerate(leaves)]
+    height = 0
+    while len(nodes) > 1:
+        height += 1
+        parents = []
+        for (left, left_leaves), (right, right_leaves) in zip(nodes[::2], nodes[1::2]):
+            size = len(left_leaves) + len(right_leaves)
+            for i in left_leaves:
+                leaves[i][2].append(bridge_codec.IAVLMerklePath(False, height, size, VERSION, right))
+            for i in right_leaves:
+                leaves[i][2].append(bridge_codec.IAVLMerklePath(True, height, size, VERSION, left))
+            parents.append((bridge.get_parent_hash(leaves[left_leaves[0]][2][-1], left), left_leaves + right_leaves))
+        nodes = parents
+    root = nodes[0][0]
+
+    verify_data = [bridge_codec.VerifyData(HEIGHT, result, VERSION, merkle_paths) for result, _, merkle_paths in leaves]
+    data = bridge_codec.encode(bridge_codec.RelayAndMultiVerify(build_relay_data(16, root), verify_data))
+    bridge_contract = _deploy_bridge(16)
+    tx = bridge_contract.relayAndMultiVerify(data, {"from": accounts[0]})
+    assert [result[5] for result in tx.return_value] == list(range(1, results + 1))
+    gas_table.record(f"relayAndMultiVerify/signatures=16/results={results}", tx.gas_used)
+
+
+@pytest.mark.parametrize("depth", PATH_DEPTHS)
+def test_bridge_gas_relay_and_verify_count(gas_table, depth):
+    count = 15246756
+    leaf_hash = bridge.get_leaf_hash(VERSION, bridge.REQUESTS_COUNT_KEY, _hash(count.to_bytes(8, "big")))
+    root, merkle_paths = build_merkle_paths(leaf_hash, depth)
+    payload = bridge_codec.RelayAndVerifyCount(
+        build_relay_data(16, root), bridge_codec.CountData(HEIGHT, count, VERSION, merkle_paths)
+    )
+    bridge_contract = _deploy_bridge(16)
+    tx = bridge_contract.relayAndVerifyCount(bridge_codec.encode(payload), {"from": accounts[0]})
+    assert tx.return_value[1] == count
+    gas_table.record(f"relayAndVerifyCount/signatures=16/depth={depth}", tx.gas_used)
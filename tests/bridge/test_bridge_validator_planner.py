@@ -0,0 +1,50 @@
+import pytest
+from brownie import accounts, Bridge
+
+import validator_planner
+
+
+# chain_id is band-laozi-testnet1
+ENCODED_CHAIN_ID = "0x321362616e642d6c616f7a692d746573746e657431"
+GAS_BUDGET = 1_000_000
+
+
+@pytest.fixture
+def bridge(simple_validator_set):
+    bridge = accounts[0].deploy(Bridge)
+    bridge.initialize(simple_validator_set, ENCODED_CHAIN_ID)
+    bridge.grantRole(bridge.VALIDATORS_UPDATER_ROLE(), accounts[0].address, {"from": accounts[0]})
+    return bridge
+
+
+def _apply(bridge, chunks, gas_table):
+    for idx, chunk in enumerate(chunks):
+        tx = bridge.updateValidatorPowers(chunk.changes, chunk.expected_total_power, {"from": accounts[0]})
+        gas_table.record(f"updateValidatorPowers/large_churn/chunk={idx}/changes={len(chunk.changes)}", tx.gas_used)
+        assert tx.gas_used <= GAS_BUDGET
+        assert bridge.totalValidatorPower() == chunk.expected_total_power
+
+
+def test_bridge_validator_planner_large_churn(bridge, gas_table, simple_validator_set):
+    current = validator_planner.read_validators(bridge.getValidators, page_size=3)
+    assert current == {address.lower(): power for address, power in simple_validator_set}
+
+    # Drop two validators, change one, keep one and add sixty.
+    (a, _), (b, _), (c, _), (d, power_d) = simple_validator_set
+    target = {c: 250, d: power_d}
+    target.update({f"0x{i:040x}": 1000 + i for i in range(1, 61)})
+
+    chunks = validator_planner.plan(current, target, GAS_BUDGET)
+    assert len(chunks) > 1
+    assert chunks[-1].expected_total_power == sum(target.values())
+    _apply(bridge, chunks, gas_table)
+
+    assert validator_planner.read_validators(bridge.getValidators, page_size=7) == {
+        address.lower(): power for address, power in target.items()
+    }
+    assert bridge.getValidatorPower(a) == bridge.getValidatorPower(b) == 0
+
+
+def test_bridge_validator_planner_no_change(bridge, simple_validator_set):
+    current = validator_planner.read_validators(bridge.getValidators)
+    assert validator_planner.plan(current, dict(simple_validator_set), GAS_BUDGET) == []
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+import brownie
+from brownie import accounts, MockMerkleHashing, MockUtils
+
+import bridge
+import bridge_codec
+import result_codec
+
+
+@pytest.fixture(scope="module")
+def mockmerklehashing():
+    return accounts[0].deploy(MockMerkleHashing)
+
+
+@pytest.fixture(scope="module")
+def mockutils():
+    return accounts[0].deploy(MockUtils)
+
+
+def _hashes_args(payload):
+    relay_data, verify_data = payload.relay_data, payload.verify_data
+    return (
+        tuple(relay_data.multi_store),
+        tuple(relay_data.merkle_parts),
+        verify_data.version,
+        bridge.request_key(verify_data.result.request_id),
+        result_codec.data_hash(verify_data.result),
+        [tuple(path) for path in verify_data.merkle_paths],
+    )
+
+
+def _random_args(rng, path_count):
+    word = lambda: rng.randbytes(32)
+    multi_store = bridge.MultiStore(*[word() for _ in bridge.MultiStore._fields])
+    merkle_parts = bridge.BlockHeaderMerkleParts(
+        word(), rng.randrange(1, 2**64), rng.randrange(1, 2**64), rng.randrange(0, 2**32), word(), word(), word(), word()
+    )
+    merkle_paths = [
+        bridge.IAVLMerklePath(
+            rng.random() < 0.5, rng.randrange(1, 128), rng.randrange(2, 2**40), rng.randrange(1, 2**40), word()
+        )
+        for _ in range(path_count)
+    ]
+    key = rng.randbytes(rng.randrange(1, 64))
+    return multi_store, merkle_parts, rng.randrange(1, 2**40), key, word(), merkle_paths
+
+
+def _expected(multi_store, merkle_parts, version, key, data_hash, merkle_paths):
+    oracle_root = bridge.get_leaf_hash(version, key, data_hash)
+    for merkle_path in merkle_paths:
+        oracle_root = bridge.get_parent_hash(merkle_path, oracle_root)
+    return "0x" + bridge.get_block_header(merkle_parts, bridge.get_app_hash(multi_store)).hex(), "0x" + oracle_root.hex()
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_merkle_hashing_matches_legacy(mockmerklehashing, seed):
+    multi_store, merkle_parts, version, key, data_hash, merkle_paths = _random_args(random.Random(seed), 2 + 4 * seed)
+    args = (
+        tuple(multi_store), tuple(merkle_parts), version, key, data_hash, [tuple(path) for path in merkle_paths]
+    )
+    hashes = mockmerklehashing.relayHashes(*args)
+    assert hashes == mockmerklehashing.relayHashesLegacy(*args)
+    assert tuple(hashes) == _expected(multi_store, merkle_parts, version, key, data_hash, merkle_paths)
+
+
+def test_merkle_hashing_gas(gas_table, mockmerklehashing, valid_proof):
+    args = _hashes_args(bridge_codec.decode_relay_and_verify(valid_proof))
+    assert mockmerklehashing.relayHashes(*args) == mockmerklehashing.relayHashesLegacy(*args)
+    gas = mockmerklehashing.relayHashes.estimate_gas(*args)
+    legacy_gas = mockmerklehashing.relayHashesLegacy.estimate_gas(*args)
+    gas_table.record(f"MockMerkleHashing.relayHashes/paths={len(args[5])}", gas)
+    gas_table.record(f"MockMerkleHashing.relayHashesLegacy/paths={len(args[5])}", legacy_gas)
+
+
+def test_utils_encode_zero(mockutils):
+    # Like the legacy encoder, zero reverts with the arithmetic underflow panic.
+    with brownie.reverts("Integer overflow"):
+        mockutils.encodeVarintUnsigned(0)
+    with brownie.reverts("Integer overflow"):
+        mockutils.encodeVarintSigned(0)
+    with brownie.reverts("Integer overflow"):
+        mockutils.encodeTime(0, 0)
+    assert mockutils.encodeTime(1, 0) == "0x0801"
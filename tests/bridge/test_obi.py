@@ -2,6 +2,8 @@ import pytest
 import brownie
 from brownie import accounts, MockObiUser
 
+import obi
+
 
 @pytest.fixture(scope="module")
 def mockobiuser():
@@ -23,3 +25,82 @@ def test_obi_decode_success(mockobiuser):
 def test_obi_decode_invalid_bytes(mockobiuser):
     with brownie.reverts("Obi: Out of range"):
         mockobiuser.decode("0x000000034254433200000000000064")
+
+
+SEED = bytes(range(32))
+TASK_WORKER = bytes.fromhex("0063046686e46dc6f15918b61ae2b121458534a5")
+VRF_CASES = [
+    (
+        "decodeVRFParamsV1",
+        "decodeVRFParamsLegacy",
+        obi.VRF_PARAMS.encode((SEED, 1655972425, TASK_WORKER)),
+    ),
+    (
+        "decodeVRFParamsV2",
+        "decodeVRFParamsLegacy",
+        obi.VRF_PARAMS.encode((SEED, 2**64 - 1, TASK_WORKER)),
+    ),
+    (
+        "decodeVRFResultV1",
+        "decodeVRFResultV1Legacy",
+        obi.VRF_V1_RESULT.encode((bytes(range(80)), bytes(range(64, 128)))),
+    ),
+    (
+        "decodeVRFResultV2",
+        "decodeVRFResultV2Legacy",
+        obi.VRF_V2_RESULT.encode((SEED,)),
+    ),
+]
+
+
+@pytest.mark.parametrize("method, legacy_method, data", VRF_CASES)
+def test_obi_vrf_decoders_gas(gas_table, mockobiuser, method, legacy_method, data):
+    decode = getattr(mockobiuser, method)
+    legacy = getattr(mockobiuser, legacy_method)
+    assert decode(data) == legacy(data)
+    gas = decode.estimate_gas(data)
+    legacy_gas = legacy.estimate_gas(data)
+    gas_table.record(f"MockObiUser.{method}", gas)
+    gas_table.record(f"MockObiUser.{legacy_method}", legacy_gas)
+
+
+@pytest.mark.parametrize("method, legacy_method, data", VRF_CASES)
+def test_obi_vrf_decoders_invalid(mockobiuser, method, legacy_method, data):
+    for invalid, reason in [(data[:-1], "Obi: Out of range"), (data + b"\x00", "DATA_DECODE_NOT_FINISHED")]:
+        for decode in [getattr(mockobiuser, method), getattr(mockobiuser, legacy_method)]:
+            with brownie.reverts(reason):
+                decode(invalid)
+
+
+# Every i8 to i256 read back to back, each built by pattern(size) around a sign boundary.
+SIGNED_SIZES = [1, 2, 4, 8, 16, 32]
+SIGN_BOUNDARIES = {
+    "lowest_byte_negative": lambda size: bytes(size - 1) + b"\x80",
+    "min": lambda size: b"\x80" + bytes(size - 1),
+    "max": lambda size: b"\x7f" + b"\xff" * (size - 1),
+    "minus_one": lambda size: b"\xff" * size,
+    "lowest_byte_max": lambda size: bytes(size - 1) + b"\x7f",
+    "lower_half_negative": lambda size: bytes(size // 2 - 1) + b"\x01\x80" + bytes(size // 2 - 1) if size > 1 else b"\x80",
+    "upper_half_negative": lambda size: b"\xff" * (size // 2) + b"\x7f" + bytes(size // 2 - 1) if size > 1 else b"\xff",
+}
+
+
+@pytest.mark.parametrize("pattern", list(SIGN_BOUNDARIES))
+def test_obi_signed_decoders_match_legacy(mockobiuser, pattern):
+    data = b"".join(SIGN_BOUNDARIES[pattern](size) for size in SIGNED_SIZES)
+    assert mockobiuser.decodeSigned(data) == mockobiuser.decodeSignedLegacy(data)
+
+
+def test_obi_signed_decoders_values(mockobiuser):
+    # A lower half with its top bit set decodes as that half alone, as it always has, so the i64
+    # 0x7fffffffffffffff is -1.
+    data = bytes.fromhex("80" "0080" "00800000" "7fffffffffffffff") + bytes(15) + b"\x01" + b"\xff" * 32
+    assert mockobiuser.decodeSigned(data) == (-128, -128, -(2**23), -1, 1, -1)
+    with brownie.reverts("Obi: Out of range"):
+        mockobiuser.decodeSigned(data[:-1])
+
+
+@pytest.mark.parametrize("pattern", list(SIGN_BOUNDARIES))
+def test_obi_signed_decoders_match_python_model(mockobiuser, pattern):
+    fields = [SIGN_BOUNDARIES[pattern](size) for size in SIGNED_SIZES]
+    assert mockobiuser.decodeSigned(b"".join(fields)) == tuple(obi.obi_sol_signed(raw) for raw in fields)
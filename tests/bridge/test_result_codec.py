@@ -1,6 +1,10 @@
 import pytest
 from brownie import accounts, MockResultCodec
 
+import bridge
+import bridge_codec
+import result_codec
+
 
 @pytest.fixture(scope="module")
 def mockresultcodec():
@@ -29,3 +33,55 @@ def test_resultcodec_encode_success(mockresultcodec):
         encoded_result
         == "0x0a09636c69656e745f696410011a0f0000000342544300000000000003e82001280130013801409af6f8f605489df6f8f6055002"
     )
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        ["beeb", 1, "0x0000000342544300000000000003e8", 1, 1, 2, 1, 1591622616, 1591622618, 1, "0x00000000009443ee"],
+        ["", 0, "0x", 0, 0, 0, 0, 0, 0, 0, "0x"],
+        ["c" * 200, 2**64 - 1, "0x" + "ab" * 300, 127, 128, 2**35, 16383, 16384, 2**63, 3, "0x" + "00" * 129],
+    ],
+)
+def test_resultcodec_python_encoder(mockresultcodec, result):
+    expected = mockresultcodec.encode(result)
+    python_result = [bytes.fromhex(value[2:]) if isinstance(value, str) and value.startswith("0x") else value for value in result]
+    assert "0x" + result_codec.encode(python_result).hex() == expected
+    assert result_codec.data_hashes([python_result]) == [result_codec.data_hash(python_result)]
+
+
+# The data hash of the relayed result, placed in its IAVL leaf, must lead to the proof's oracle root.
+def test_resultcodec_python_leaf_hash(valid_proof):
+    payload = bridge_codec.decode_relay_and_verify(valid_proof)
+    verify_data = payload.verify_data
+    assert bridge.verify_proof(
+        payload.relay_data.multi_store.oracle_iavl_state_hash,
+        verify_data.version,
+        bridge.request_key(verify_data.result.request_id),
+        result_codec.data_hashes([verify_data.result])[0],
+        list(verify_data.merkle_paths),
+    )
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        ["beeb", 1, "0x0000000342544300000000000003e8", 1, 1, 2, 1, 1591622616, 1591622618, 1, "0x00000000009443ee"],
+        ["", 0, "0x", 0, 0, 0, 0, 0, 0, 0, "0x"],
+        ["", 0, "0x", 0, 0, 0, 0, 0, 0, 2, "0x01"],
+        ["c" * 31, 127, "0x" + "ab" * 32, 128, 16383, 16384, 2**21 - 1, 2**21, 2**63, 3, "0x" + "cd" * 33],
+        ["c" * 200, 2**64 - 1, "0x" + "ab" * 300, 127, 128, 2**35, 16383, 16384, 2**63, 3, "0x" + "00" * 129],
+    ],
+)
+def test_resultcodec_encode_matches_legacy(mockresultcodec, result):
+    assert mockresultcodec.encode(result) == mockresultcodec.encodeLegacy(result)
+
+
+@pytest.mark.parametrize("size", [8, 100, 1000, 4000])
+def test_resultcodec_encode_gas(gas_table, mockresultcodec, size):
+    result = ["client_id", 1, "0x" + "ab" * size, 16, 10, 4242, 16, 1591622426, 1591622429, 1, "0x" + "cd" * size]
+    assert mockresultcodec.encode(result) == mockresultcodec.encodeLegacy(result)
+    gas = mockresultcodec.encode.estimate_gas(result)
+    legacy_gas = mockresultcodec.encodeLegacy.estimate_gas(result)
+    gas_table.record(f"ResultCodec.encode/size={size}", gas)
+    gas_table.record(f"ResultCodec.encodeLegacy/size={size}", legacy_gas)
@@ -102,3 +102,71 @@ def test_tmsignature_check_time_and_recoversigner_fail_invalid_validator(mocktms
         ENCODED_CHAIN_ID,
     )
     assert signers != "0x3b759C4d728e50D5cC04c75f596367829d5b5061"
+
+
+SIGNATURES = [
+    [
+        "0x6916405D52FF02EC26DD78E831E0A179C89B99CBBDB15C9DA802B75A7621D5EB",
+        "0x69CF40BE7AC1AA176B13BA4D57EB2B8735A5832014F0DC168EA6F580C51BB222",
+        28,
+        "0x08DE9493850610F0FFAEEB02",
+    ],
+    [
+        "0x6A8E3C35DEED991D257BCA9451360BFBE7978D388AF8D2F864A6919FE1083C7E",
+        "0x14D145DD6BC1A770ACBDF37DAC08DD8076AB888FDA2739BE9B9767B23A387D1E",
+        27,
+        "0x08DE9493850610DAEB8D9C03",
+    ],
+    [
+        "0xEB402F4B863A1DF91E7772D9574640EFFC5447ECEC6EDF6F1CFE2C33D7DC8DD4",
+        "0x1FEC45523E885DD6E8AD75EA2D81D30657267DF646406240F206A98749EBD0A7",
+        27,
+        "0x08DE9493850610B68FD4E702",
+    ],
+]
+SIGNERS = [
+    "0x3b759C4d728e50D5cC04c75f596367829d5b5061",
+    "0x49897b9D617AD700b84a935616E81f9f4b5305bc",
+    "0x7054bd1Fd7535A0DD552361e634196b1574594BB",
+]
+
+
+def test_tmsignature_recover_signers_in_place(mocktmsignature):
+    # Timestamps of different sizes move the chain ID, which must not leave stale bytes behind.
+    signatures = SIGNATURES + [SIGNATURES[0][:3] + ["0x08DE94938506"]] + SIGNATURES
+    signers = mocktmsignature.recoverSigners(COMMON_ENCODED_VOTE_PART, BLOCK_HASH, ENCODED_CHAIN_ID, signatures)
+    assert signers == mocktmsignature.recoverSignersLegacy(
+        COMMON_ENCODED_VOTE_PART, BLOCK_HASH, ENCODED_CHAIN_ID, signatures
+    )
+    assert signers[:3] == SIGNERS and signers[4:] == SIGNERS
+    assert signers[3] not in SIGNERS
+
+
+def test_tmsignature_recover_signers_in_place_fail(mocktmsignature):
+    with brownie.reverts("TMSignature: Invalid timestamp's size"):
+        mocktmsignature.recoverSigners(
+            COMMON_ENCODED_VOTE_PART, BLOCK_HASH, ENCODED_CHAIN_ID, SIGNATURES + [SIGNATURES[0][:3] + ["0x08DE949385"]]
+        )
+    with brownie.reverts("CommonEncodedVotePart: Invalid suffix's size"):
+        mocktmsignature.recoverSigners(
+            [COMMON_ENCODED_VOTE_PART[0], COMMON_ENCODED_VOTE_PART[1][:-2]], BLOCK_HASH, ENCODED_CHAIN_ID, SIGNATURES
+        )
+
+    chain_id_size = len(bytes.fromhex(ENCODED_CHAIN_ID[2:]))
+    with brownie.reverts("TMSignature: Chain ID exceeds the vote's capacity"):
+        mocktmsignature.recoverSignerWithCapacity(
+            COMMON_ENCODED_VOTE_PART, BLOCK_HASH, chain_id_size - 1, ENCODED_CHAIN_ID, SIGNATURES[0]
+        )
+    assert mocktmsignature.recoverSignerWithCapacity(
+        COMMON_ENCODED_VOTE_PART, BLOCK_HASH, chain_id_size + 32, ENCODED_CHAIN_ID, SIGNATURES[0]
+    ) == SIGNERS[0]
+
+
+@pytest.mark.parametrize("count", [3, 30, 99])
+def test_tmsignature_recover_signers_gas(gas_table, mocktmsignature, count):
+    args = (COMMON_ENCODED_VOTE_PART, BLOCK_HASH, ENCODED_CHAIN_ID, SIGNATURES * (count // 3))
+    assert mocktmsignature.recoverSigners(*args) == SIGNERS * (count // 3)
+    gas = mocktmsignature.recoverSigners.estimate_gas(*args)
+    legacy_gas = mocktmsignature.recoverSignersLegacy.estimate_gas(*args)
+    gas_table.record(f"MockTMSignature.recoverSigners/signatures={count}", gas)
+    gas_table.record(f"MockTMSignature.recoverSignersLegacy/signatures={count}", legacy_gas)
@@ -0,0 +1,67 @@
+import json
+import os
+import sys
+import warnings
+
+import pytest
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+
+# Lets tests import the off-chain helpers in example_utils_functions, which use flat imports.
+sys.path.insert(0, os.path.join(os.path.dirname(TESTS), "example_utils_functions"))
+
+
+# Gas measured through the gas_table fixture. Every run writes reports/gas.json. A measurement more
+# than BRIDGE_GAS_TOLERANCE (default 2%) above tests/gas_baseline.json fails its test; one with no
+# baseline only warns, so a new measurement passes until it is recorded. Only a run with
+# BRIDGE_GAS_UPDATE=1 writes the baseline: it records its measurements instead of checking them.
+GAS_BASELINE = os.path.join(TESTS, "gas_baseline.json")
+GAS_REPORT = os.path.join("reports", "gas.json")
+
+
+class GasTable:
+    def __init__(self, baseline, tolerance, update):
+        self.baseline = baseline
+        self.tolerance = tolerance
+        self.update = update
+        self.measured = {}
+
+    def record(self, name, gas_used):
+        self.measured[name] = gas_used
+        if self.update:
+            return
+        expected = self.baseline.get(name)
+        if expected is None:
+            warnings.warn(f"{name}: {gas_used} gas, no baseline in {GAS_BASELINE}, record it with BRIDGE_GAS_UPDATE=1")
+            return
+        assert gas_used <= expected * (1 + self.tolerance), f"{name}: {gas_used} gas, baseline {expected}"
+
+    def report(self):
+        return {
+            name: {
+                "gas": gas_used,
+                "baseline": self.baseline.get(name),
+                "delta": gas_used - self.baseline[name] if name in self.baseline else None,
+            }
+            for name, gas_used in sorted(self.measured.items())
+        }
+
+
+@pytest.fixture(scope="session")
+def gas_table():
+    stored = {}
+    if os.path.exists(GAS_BASELINE):
+        with open(GAS_BASELINE) as f:
+            stored = json.load(f)
+    update = os.environ.get("BRIDGE_GAS_UPDATE") == "1"
+    table = GasTable(stored, float(os.environ.get("BRIDGE_GAS_TOLERANCE", "0.02")), update)
+    yield table
+
+    os.makedirs(os.path.dirname(GAS_REPORT), exist_ok=True)
+    with open(GAS_REPORT, "w") as f:
+        json.dump(table.report(), f, indent=2)
+    if update and table.measured:
+        # Measurements that did not run keep their stored baseline.
+        with open(GAS_BASELINE, "w") as f:
+            json.dump(dict(sorted({**stored, **table.measured}.items())), f, indent=2)
+            f.write("\n")
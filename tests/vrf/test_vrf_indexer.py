@@ -0,0 +1,64 @@
+import pytest
+from brownie import accounts, chain, web3
+
+import vrf_indexer
+
+FEE_1E15 = 10**15
+CLIENT_SEEDS = ["mumu1", "indexer_seed_1", "indexer_seed_2", "indexer_seed_3"]
+
+
+def _rpc(method, params):
+    return web3.provider.make_request(method, params)["result"]
+
+
+@pytest.fixture(scope="module")
+def indexer(vrf_provider_1):
+    indexer = vrf_indexer.Indexer(
+        ":memory:", _rpc, vrf_provider_1.address, start_block=vrf_provider_1.tx.block_number, confirmations=0, span=2
+    )
+    yield indexer
+    indexer.close()
+
+
+def test_vrf_indexer_pending_and_relays(indexer, vrf_provider_1, bridge_1, testnet_vrf_proof):
+    for client_seed in CLIENT_SEEDS:
+        vrf_provider_1.requestRandomData(client_seed, {"from": accounts[1], "value": FEE_1E15})
+    tx = vrf_provider_1.relayProof(testnet_vrf_proof, 0, {"from": accounts[2]})
+
+    # The constructor's five settings, the requests and the relay; OwnershipTransferred is not stored.
+    assert indexer.sync() == 5 + len(CLIENT_SEEDS) + 1
+    assert [task.nonce for task in indexer.pending_tasks()] == [1, 2, 3]
+    for task in indexer.tasks_of(accounts[1].address):
+        on_chain = vrf_provider_1.tasks(task.nonce)
+        assert (task.caller, int(task.task_fee), task.seed, task.client_seed) == (
+            on_chain[2].lower(), on_chain[3], str(on_chain[4]).lower(), on_chain[5]
+        )
+
+    (relay,) = indexer.relays_by(accounts[2].address)
+    event = tx.events["RandomDataRelayed"][0]
+    assert (relay.block_number, relay.band_request_id, relay.to, relay.result_hash, relay.client_seed) == (
+        tx.block_number, event["bandRequestID"], accounts[1].address.lower(), str(event["resultHash"]).lower(), "mumu1"
+    )
+    assert indexer.settings() == {
+        "bridge": bridge_1.address.lower(),
+        "oracle_script_id": str(vrf_provider_1.oracleScriptID()),
+        "min_count": str(vrf_provider_1.minCount()),
+        "ask_count": str(vrf_provider_1.askCount()),
+        "minimum_fee": str(vrf_provider_1.minimumFee()),
+    }
+
+
+def test_vrf_indexer_reorg(indexer, vrf_provider_1):
+    chain.snapshot()
+    for client_seed in ["abandoned_1", "abandoned_2"]:
+        vrf_provider_1.requestRandomData(client_seed, {"from": accounts[1], "value": FEE_1E15})
+    indexer.sync()
+    assert [task.client_seed for task in indexer.pending_tasks()][-2:] == ["abandoned_1", "abandoned_2"]
+
+    # The two requests are dropped and the chain grows past the indexed head on another branch.
+    chain.revert()
+    vrf_provider_1.requestRandomData("after_reorg", {"from": accounts[1], "value": FEE_1E15})
+    chain.mine(4)
+    indexer.sync()
+    assert [task.client_seed for task in indexer.pending_tasks()] == CLIENT_SEEDS[1:] + ["after_reorg"]
+    assert indexer.next_block() == chain.height + 1
@@ -0,0 +1,80 @@
+import pytest
+import bridge_codec
+import obi
+
+V1_PROOFS = [
+    "testnet_vrf_proof",
+    "testnet_vrf_proof_2_16_min_count_not_match",
+    "testnet_vrf_proof_1_15_ask_count_not_match",
+    "testnet_vrf_proof_1_16_incorrect_worker",
+    "testnet_vrf_proof_1_16_incorrect_os_id",
+    "testnet_vrf_proof_1_16_seed_mismatch",
+    "testnet_vrf_proof_1_16_time_mismatch",
+    "testnet_vrf_proof_1_16",
+    "testnet_vrf_proof_for_consumer",
+    "testnet_vrf_proof_for_consumer_reentrant",
+]
+V2_PROOFS = [
+    "testnet_vrf_v2_proof_1",
+    "testnet_vrf_v2_proof_2_incorrect_worker",
+    "testnet_vrf_v2_proof_2_seed_mismatch",
+    "testnet_vrf_v2_proof_2_time_mismatch",
+    "testnet_vrf_v2_proof_2",
+]
+
+
+def _result(request, proof_fixture):
+    return bridge_codec.decode_relay_and_verify(request.getfixturevalue(proof_fixture)).verify_data.result
+
+
+@pytest.mark.parametrize("proof_fixture", V1_PROOFS + V2_PROOFS)
+def test_vrf_obi_codec_params(request, proof_fixture):
+    result = _result(request, proof_fixture)
+    params = obi.VRF_PARAMS.decode(result.params)
+    assert len(params.seed) == 32
+    assert len(params.task_worker) == 20
+    assert params.time in (1655972424, 1655972425, 1655972505)
+    assert obi.VRF_PARAMS.encode(params) == bytes(result.params)
+
+
+@pytest.mark.parametrize("proof_fixture", V1_PROOFS)
+def test_vrf_obi_codec_v1_result(request, proof_fixture):
+    result = _result(request, proof_fixture)
+    decoded = obi.VRF_V1_RESULT.decode(result.result)
+    assert (len(decoded.proof), len(decoded.result)) == (80, 64)
+    assert obi.VRF_V1_RESULT.encode(decoded) == bytes(result.result)
+
+
+@pytest.mark.parametrize("proof_fixture", V2_PROOFS)
+def test_vrf_obi_codec_v2_result(request, proof_fixture):
+    result = _result(request, proof_fixture)
+    decoded = obi.VRF_V2_RESULT.decode(result.result)
+    assert len(decoded.result) == 32
+    assert obi.VRF_V2_RESULT.encode(decoded) == bytes(result.result)
+
+
+@pytest.mark.parametrize(
+    "proof_fixture",
+    ["testnet_vrf_proof_1_16_not_successfully_resolved", "testnet_vrf_v2_proof_2_not_successfully_resolved"],
+)
+def test_vrf_obi_codec_unresolved_result(request, proof_fixture):
+    with pytest.raises(ValueError, match="Obi: Out of range"):
+        obi.VRF_V1_RESULT.decode(_result(request, proof_fixture).result)
+
+
+def test_vrf_obi_codec_decode_many(request):
+    params = [obi.VRF_PARAMS.decode(_result(request, proof_fixture).params) for proof_fixture in V1_PROOFS]
+    data = obi.VRF_PARAMS.encode_many(params)
+    assert obi.VRF_PARAMS.decode_many(data) == params
+    assert obi.VRF_PARAMS.decode_many(bytearray(data)) == params
+    with pytest.raises(ValueError, match="DATA_DECODE_NOT_FINISHED"):
+        obi.VRF_PARAMS.decode(data)
+
+
+def test_vrf_obi_codec_signed_diverges_from_obi_sol():
+    # obi.py decodes plain two's complement, Obi.sol sign-extends from the lowest byte with its top
+    # bit set (obi_sol_signed), so they differ once a lower half has its top bit set.
+    fields = [bytes.fromhex(raw) for raw in ["7f", "7fff", "00800000", "0000000000000080"]] + [bytes(16), bytes(32)]
+    codec = obi.Codec("{a:i8,b:i16,c:i32,d:i64,e:i128,f:i256}")
+    assert tuple(codec.decode(b"".join(fields))) == (127, 2**15 - 1, 2**23, 128, 0, 0)
+    assert [obi.obi_sol_signed(raw) for raw in fields] == [127, -1, -(2**23), -128, 0, 0]
@@ -0,0 +1,91 @@
+import os
+
+import brownie
+import pytest
+from brownie import accounts, MockObiGenerated
+
+import bridge_codec
+import obi
+import obi_codegen
+
+V1_PROOFS = [
+    "testnet_vrf_proof",
+    "testnet_vrf_proof_1_16_incorrect_worker",
+    "testnet_vrf_proof_1_16_seed_mismatch",
+    "testnet_vrf_proof_1_16_time_mismatch",
+]
+V2_PROOFS = [
+    "testnet_vrf_v2_proof_1",
+    "testnet_vrf_v2_proof_2_time_mismatch",
+]
+
+
+@pytest.fixture(scope="module")
+def mockobigenerated():
+    return accounts[0].deploy(MockObiGenerated)
+
+
+def _result(request, proof_fixture):
+    return bridge_codec.decode_relay_and_verify(request.getfixturevalue(proof_fixture)).verify_data.result
+
+
+def _compare(gas_table, proof_fixture, generic, generated, data):
+    assert generated(data) == generic(data)
+    generic_gas = generic.estimate_gas(data)
+    generated_gas = generated.estimate_gas(data)
+    gas_table.record(f"MockObiGenerated.{generic.abi['name']}/{proof_fixture}", generic_gas)
+    gas_table.record(f"MockObiGenerated.{generated.abi['name']}/{proof_fixture}", generated_gas)
+    return generated(data)
+
+
+@pytest.mark.parametrize("library", list(obi_codegen.VRF_SCHEMAS))
+def test_vrf_obi_generated_is_up_to_date(library):
+    with open(os.path.join(obi_codegen.GENERATED_DIR, f"{library}.sol")) as f:
+        assert f.read() == obi_codegen.generate_solidity(library, *obi_codegen.VRF_SCHEMAS[library])
+
+
+@pytest.mark.parametrize("proof_fixture", V1_PROOFS + V2_PROOFS)
+def test_vrf_obi_generated_params(request, gas_table, mockobigenerated, proof_fixture):
+    params = bytes(_result(request, proof_fixture).params)
+    decoded = _compare(
+        gas_table, proof_fixture, mockobigenerated.decodeParamsObi, mockobigenerated.decodeParamsGenerated, params
+    )
+    assert decoded == tuple("0x" + value.hex() if isinstance(value, bytes) else value for value in obi.VRF_PARAMS.decode(params))
+
+
+@pytest.mark.parametrize("proof_fixture", V1_PROOFS)
+def test_vrf_obi_generated_v1_result(request, gas_table, mockobigenerated, proof_fixture):
+    result = bytes(_result(request, proof_fixture).result)
+    _compare(
+        gas_table, proof_fixture, mockobigenerated.decodeResultV1Obi, mockobigenerated.decodeResultV1Generated, result
+    )
+
+
+@pytest.mark.parametrize("proof_fixture", V2_PROOFS)
+def test_vrf_obi_generated_v2_result(request, gas_table, mockobigenerated, proof_fixture):
+    result = bytes(_result(request, proof_fixture).result)
+    _compare(
+        gas_table, proof_fixture, mockobigenerated.decodeResultV2Obi, mockobigenerated.decodeResultV2Generated, result
+    )
+
+
+def test_vrf_obi_generated_invalid(request, mockobigenerated):
+    params = bytes(_result(request, "testnet_vrf_proof").params)
+    # Cut inside seed, inside time, inside task_worker, and one trailing byte.
+    for data, reason in [
+        (params[:20], "Obi: Out of range"),
+        (params[:40], "Obi: Out of range"),
+        (params[:-1], "Obi: Out of range"),
+        (params + b"\x00", "DATA_DECODE_NOT_FINISHED"),
+    ]:
+        for decode in [mockobigenerated.decodeParamsObi, mockobigenerated.decodeParamsGenerated]:
+            with brownie.reverts(reason):
+                decode(data)
+
+
+def test_vrf_obi_generated_python(request):
+    namespace = {}
+    exec(obi_codegen.generate_python("ObiVRFParams", *obi_codegen.VRF_SCHEMAS["ObiVRFParams"]), namespace)
+    for proof_fixture in V1_PROOFS + V2_PROOFS:
+        params = bytes(_result(request, proof_fixture).params)
+        assert namespace["decode"](params) == obi.VRF_PARAMS.decode(params)
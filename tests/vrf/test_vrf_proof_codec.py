@@ -0,0 +1,46 @@
+import pytest
+import bridge
+import bridge_codec
+import result_codec
+
+
+VRF_PROOFS = [
+    "testnet_vrf_proof",
+    "testnet_vrf_proof_2_16_min_count_not_match",
+    "testnet_vrf_proof_1_15_ask_count_not_match",
+    "testnet_vrf_proof_1_16_incorrect_worker",
+    "testnet_vrf_proof_1_16_incorrect_os_id",
+    "testnet_vrf_proof_1_16_seed_mismatch",
+    "testnet_vrf_proof_1_16_time_mismatch",
+    "testnet_vrf_proof_1_16_not_successfully_resolved",
+    "testnet_vrf_proof_1_16",
+    "testnet_vrf_proof_for_consumer",
+    "testnet_vrf_proof_for_consumer_reentrant",
+    "testnet_vrf_v2_proof_1",
+    "testnet_vrf_v2_proof_2_incorrect_worker",
+    "testnet_vrf_v2_proof_2_seed_mismatch",
+    "testnet_vrf_v2_proof_2_time_mismatch",
+    "testnet_vrf_v2_proof_2_not_successfully_resolved",
+    "testnet_vrf_v2_proof_2",
+]
+
+
+@pytest.mark.parametrize("proof_fixture", VRF_PROOFS)
+def test_vrf_proof_codec_round_trip(request, proof_fixture):
+    proof = request.getfixturevalue(proof_fixture)
+    payload = bridge_codec.decode_relay_and_verify(proof)
+    assert bridge_codec.encode(payload).hex() == proof.lower()
+
+
+def test_vrf_proof_codec_leaf_hashes(request):
+    payloads = [bridge_codec.decode_relay_and_verify(request.getfixturevalue(name)) for name in VRF_PROOFS]
+    hashes = result_codec.data_hashes([payload.verify_data.result for payload in payloads])
+    for payload, data_hash in zip(payloads, hashes):
+        verify_data = payload.verify_data
+        assert bridge.verify_proof(
+            payload.relay_data.multi_store.oracle_iavl_state_hash,
+            verify_data.version,
+            bridge.request_key(verify_data.result.request_id),
+            data_hash,
+            list(verify_data.merkle_paths),
+        )
@@ -0,0 +1,53 @@
+import pytest
+from brownie import accounts, VRFLensV2
+
+import vrf_tasks
+
+TASK_COUNT = 9
+
+
+@pytest.fixture(scope="module")
+def vrf_lens_2(vrf_provider_2):
+    return accounts[0].deploy(VRFLensV2, vrf_provider_2.address)
+
+
+# Tops the provider up to at least count tasks and returns its task nonce.
+def _request_tasks(provider, count):
+    for i in range(provider.taskNonce(), count):
+        provider.requestRandomData(f"reader_client_seed_{i}", {"from": accounts[1], "value": 10**15})
+    return provider.taskNonce()
+
+
+def test_vrf_tasks_reader_v1(vrf_lens, vrf_provider_1):
+    task_nonce = _request_tasks(vrf_provider_1, TASK_COUNT)
+    tasks = list(vrf_tasks.read_tasks(vrf_lens.getTasksBulk, task_nonce, batch=2, workers=2))
+    assert [nonce for nonce, _ in tasks] == list(range(task_nonce))
+    assert [task for _, task in tasks] == [
+        vrf_tasks.TaskV1._make(raw) for raw in vrf_lens.getTasksBulk(list(range(task_nonce)))
+    ]
+
+
+def test_vrf_tasks_reader_v2(vrf_lens_2, vrf_provider_2):
+    task_nonce = _request_tasks(vrf_provider_2, TASK_COUNT)
+    tasks = list(vrf_tasks.read_tasks(vrf_lens_2.getTasksBulk, task_nonce, start=4, batch=1))
+    assert [nonce for nonce, _ in tasks] == list(range(4, task_nonce))
+    assert [task for _, task in tasks] == [
+        vrf_tasks.TaskV2._make(raw) for raw in vrf_lens_2.getTasksBulk(list(range(4, task_nonce)))
+    ]
+
+
+def test_vrf_tasks_reader_splits_failed_batches(vrf_lens, vrf_provider_1):
+    task_nonce = _request_tasks(vrf_provider_1, TASK_COUNT)
+    calls = []
+
+    # Stands in for a node whose eth_call gas cap fits at most three tasks.
+    def get_tasks_bulk(nonces):
+        calls.append(len(nonces))
+        if len(nonces) > 3:
+            raise ValueError("out of gas")
+        return vrf_lens.getTasksBulk(nonces)
+
+    tasks = list(vrf_tasks.read_tasks(get_tasks_bulk, task_nonce, batch=8, workers=1))
+    assert [nonce for nonce, _ in tasks] == list(range(task_nonce))
+    # The first batch and its lower half fail; every later call stays under the lowered ceiling.
+    assert calls[:2] == [8, 4] and max(calls[2:]) <= 2